@@ -0,0 +1,196 @@
+"""
+Memory benchmark of the frame buffer pool.
+
+Runs two sessions, each once allocating new arrays for every frame and once with pre-allocated buffers:
+- "convert": flip and BGR -> RGB conversion of an in-memory frame (the per-frame allocations the pool removes);
+- "capture": reading frames of a synthetic MJPG video with `Camera` plus the BGR -> RGB conversion
+  of `HandTrackingProvider` (includes video decoding).
+For each run it reports the time per frame, RSS over the session, minor page faults (allocator churn
+of large arrays) and GC collections.
+
+Usage:
+    python benchmarks/frame_buffers.py [--width 1920] [--height 1080] [--frames 600] [--output results.json]
+"""
+
+import argparse
+from collections.abc import Iterator
+import gc
+import json
+import os
+from pathlib import Path
+import resource
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from touchless.camera import Camera
+from touchless.utils.buffers import FrameBufferPool
+
+
+def current_rss_mb() -> float:
+    """Get the current resident set size of the process.
+
+    Returns:
+        float: RSS in megabytes (peak RSS if the current one is not available).
+    """
+
+    statm: Path = Path("/proc/self/statm")
+
+    if statm.exists():
+        return int(statm.read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10
+
+
+def write_video(path: Path, width: int, height: int, frames: int) -> None:
+    """Write a synthetic MJPG video.
+
+    Args:
+        path (Path): The video file path.
+        width (int): Frame width.
+        height (int): Frame height.
+        frames (int): Number of frames.
+    """
+
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter.fourcc(*"MJPG"), 30, (width, height))
+    gradient: np.ndarray = np.tile(np.linspace(0, 255, width, dtype=np.uint8), (height, 1))
+
+    for i in range(frames):
+        frame: np.ndarray = cv2.merge([np.roll(gradient, i, axis=1), gradient, np.roll(gradient, -i, axis=1)])
+        writer.write(frame)
+
+    writer.release()
+
+
+def measure(frame_steps: Iterator[None], rss_every: int = 50) -> dict:
+    """Run frame steps and collect the session statistics.
+
+    Args:
+        frame_steps (Iterator[None]): An iterator processing one frame per step.
+        rss_every (int): Sample RSS every N frames. Default is 50.
+
+    Returns:
+        dict: The session statistics.
+    """
+
+    rss_mb: list[float] = []
+    frames: int = 0
+
+    gc.collect()
+    gc_collections: int = sum(stats["collections"] for stats in gc.get_stats())
+    page_faults: int = resource.getrusage(resource.RUSAGE_SELF).ru_minflt
+    start: float = time.perf_counter()
+
+    for _ in frame_steps:
+        frames += 1
+        if frames % rss_every == 0:
+            rss_mb.append(round(current_rss_mb(), 1))
+
+    elapsed: float = time.perf_counter() - start
+
+    return {
+        "frames": frames,
+        "ms_per_frame": round(elapsed / max(frames, 1) * 1000, 3),
+        "minor_page_faults_per_frame": round((resource.getrusage(resource.RUSAGE_SELF).ru_minflt - page_faults) / max(frames, 1), 1),
+        "gc_collections": sum(stats["collections"] for stats in gc.get_stats()) - gc_collections,
+        "rss_mb": rss_mb
+    }
+
+
+def convert_steps(width: int, height: int, frames: int, buffer_pool_size: int) -> Iterator[None]:
+    """Flip and convert an in-memory frame to RGB.
+
+    Args:
+        width (int): Frame width.
+        height (int): Frame height.
+        frames (int): Number of frames.
+        buffer_pool_size (int): Buffer pool size, 0 to allocate new arrays.
+
+    Yields:
+        None: After every processed frame.
+    """
+
+    frame: np.ndarray = np.random.default_rng(0).integers(0, 256, (height, width, 3), dtype=np.uint8)
+    pool: FrameBufferPool | None = FrameBufferPool(buffer_pool_size) if buffer_pool_size > 0 else None
+    rgb_frame: np.ndarray = np.empty_like(frame)
+
+    for _ in range(frames):
+        if pool is None:
+            cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB)
+        else:
+            cv2.cvtColor(cv2.flip(frame, 1, dst=pool.acquire(frame.shape)), cv2.COLOR_BGR2RGB, dst=rgb_frame)
+        yield
+
+
+def capture_steps(video_path: Path, buffer_pool_size: int) -> Iterator[None]:
+    """Read and convert all frames of a video.
+
+    Args:
+        video_path (Path): The video file path.
+        buffer_pool_size (int): Camera buffer pool size, 0 to allocate new frames (and RGB images).
+
+    Yields:
+        None: After every processed frame.
+    """
+
+    cam: Camera = Camera(str(video_path), headless=True, buffer_pool_size=buffer_pool_size)
+    rgb_frame: np.ndarray | None = None
+
+    while cam.is_active:
+        frame: np.ndarray | None = cam.read()
+
+        if frame is None:
+            break
+
+        if buffer_pool_size > 0:
+            if rgb_frame is None or rgb_frame.shape != frame.shape:
+                rgb_frame = np.empty_like(frame)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+        else:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        yield
+
+
+def main(width: int, height: int, frames: int, output: str | None) -> None:
+
+    # Convert sessions run first: once large arrays have been freed, glibc raises its mmap threshold
+    # and serves them from the heap, which hides the allocation churn of the later sessions.
+    results: list[dict] = [
+        {"session": "convert", "buffer_pool_size": buffer_pool_size, **measure(convert_steps(width, height, frames, buffer_pool_size))}
+        for buffer_pool_size in (0, 3)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        video_path: Path = Path(tmp_dir) / "frames.avi"
+        write_video(video_path, width, height, frames)
+
+        results.extend(
+            {"session": "capture", "buffer_pool_size": buffer_pool_size, **measure(capture_steps(video_path, buffer_pool_size))}
+            for buffer_pool_size in (0, 3)
+        )
+
+    for result in results:
+        rss: list[float] = result["rss_mb"]
+        print(
+            f"{result['session']}, buffer_pool_size={result['buffer_pool_size']}: {result['frames']} frames, "
+            f"{result['ms_per_frame']} ms/frame, {result['minor_page_faults_per_frame']} page faults/frame, "
+            f"{result['gc_collections']} GC collections, RSS {rss[0] if rss else None} -> {rss[-1] if rss else None} MB"
+        )
+
+    if output is not None:
+        Path(output).write_text(json.dumps({"width": width, "height": height, "sessions": results}, indent=2))
+
+
+if __name__ == "__main__":
+
+    args_parser = argparse.ArgumentParser()
+    args_parser.add_argument("--width", type=int, default=1920)
+    args_parser.add_argument("--height", type=int, default=1080)
+    args_parser.add_argument("--frames", type=int, default=600)
+    args_parser.add_argument("--output", type=str, default=None)
+    args = args_parser.parse_args()
+
+    main(width=args.width, height=args.height, frames=args.frames, output=args.output)
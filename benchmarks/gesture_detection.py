@@ -0,0 +1,478 @@
+"""
+Latency benchmark of the per-frame hand processing stages.
+
+Replays hand landmark fixtures through:
+- "landmark_conversion": `HandTrackingProvider.update` with the MediaPipe model replaced by precomputed results
+  (RGB conversion of a small frame, landmarks conversion and tracking data creation);
+- "detect_gestures_all" / "detect_gestures_filtered": `GestureProvider.detect_gestures` for all gestures
+  and for `FILTERED_GESTURES`;
+- "render_shapes" / "render_compiled_shapes": `render_shapes` of `SHAPES` and of the compiled `SHAPES`
+  with the index finger tip as the pointer;
+- "math_utils.*": each `math_utils` function on the landmarks of the frame in pixels;
+- "hands_update" / "hands_update_traced": `HandsProvider.update` with all right hand gestures (and the replayed
+  tracking), without and with a `FrameTracer`. The tracing overhead (the difference of their medians) is reported
+  per frame and relative to the 30 FPS frame budget (real frames also include MediaPipe inference).
+Every stage runs on two fixtures: "synthetic", independent hand poses (a template hand with random position,
+scale and finger curls), and "session", the right hand frames of `fixtures/session.bin`, a landmark recording
+(`touchless.recording`) of a generated session of continuous hand motion (see `session_landmarks`, regenerate it
+with `--write-fixture`). Both fixtures are generated, not captured from a camera, and seeded, so that results
+of different runs are comparable. With `--recording`, the right hand frames of a real capture are benchmarked
+instead of the session fixture, as the "recorded" fixture.
+For each stage it reports calls per second and the per-call latency percentiles. Results are written as JSON
+and can be compared with the results of a previous release to catch regressions.
+
+Run it as a module from the repository root (so that `touchless` is importable without installing it):
+    python -m benchmarks.gesture_detection [--recording landmarks.bin] [--frames 2000] [--repeat 5]
+        [--output results.json] [--baseline previous.json] [--tolerance 0.2]
+    python -m benchmarks.gesture_detection --write-fixture benchmarks/fixtures/session.bin
+"""
+
+import argparse
+from collections.abc import Callable
+from datetime import datetime, timezone
+from importlib import metadata
+import json
+from pathlib import Path
+import platform
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from mediapipe.framework.formats import classification_pb2, landmark_pb2
+import numpy as np
+
+from touchless.hands import GestureProvider, Hand, HandsProvider, HandTrackingData, HandTrackingProvider, HandType
+from touchless.profiling import FrameTracer
+from touchless.recording import HAND_CODES, LandmarkRecorder, LandmarkRecording
+from touchless.utils.landmarks import HandLandmarkPoints, get_pointer
+from touchless.utils.math_utils import (
+    angle_between_vectors,
+    dist_from_triangle_0_5_17_to_camera,
+    euclidean,
+    heron_area_by_points
+)
+from touchless.utils.compiled_shapes import CompiledShapes, compile_shapes
+from touchless.utils.shapes import SHAPES, render_shapes
+
+
+FRAME_SIZE: tuple[int, int] = (640, 480)
+FIXTURE_PATH: Path = Path(__file__).parent / "fixtures" / "session.bin"
+FIXTURE_FRAMES: int = 600
+FIXTURE_FPS: int = 30
+FILTERED_GESTURES: list[str] = ["click_index_middle", "pinch_thumb_index", "five_fingers"]
+PERCENTILES: tuple[int, ...] = (50, 90, 99)
+FRAME_BUDGET_US: float = 1e6 / FIXTURE_FPS
+
+# Open right hand facing the camera, normalized coordinates ordered as `HandLandmark`
+HAND_TEMPLATE: np.ndarray = np.array([
+    [0.50, 0.80, 0.00],
+    [0.44, 0.76, -0.02], [0.40, 0.70, -0.03], [0.37, 0.65, -0.04], [0.34, 0.61, -0.05],
+    [0.45, 0.62, -0.01], [0.44, 0.55, -0.02], [0.435, 0.51, -0.03], [0.43, 0.47, -0.04],
+    [0.50, 0.61, -0.01], [0.50, 0.53, -0.02], [0.50, 0.48, -0.03], [0.50, 0.44, -0.04],
+    [0.55, 0.62, -0.01], [0.555, 0.55, -0.02], [0.56, 0.51, -0.03], [0.565, 0.47, -0.04],
+    [0.59, 0.65, -0.01], [0.60, 0.60, -0.02], [0.605, 0.57, -0.03], [0.61, 0.54, -0.04]
+], dtype=np.float32)
+
+# Landmark indices of each finger from the base to the tip
+FINGERS: tuple[tuple[int, ...], ...] = ((1, 2, 3, 4), (5, 6, 7, 8), (9, 10, 11, 12), (13, 14, 15, 16), (17, 18, 19, 20))
+
+
+def pose_landmarks(curls: np.ndarray, scale: np.ndarray, shift: np.ndarray) -> np.ndarray:
+    """Generate hand poses from the template hand.
+
+    Args:
+        curls (np.ndarray): Curl of each finger towards the palm in [0, 1], of shape (frames, 5).
+        scale (np.ndarray): Scale of the hand around the wrist, of shape (frames,).
+        shift (np.ndarray): Shift of the hand (x, y), of shape (frames, 2).
+
+    Returns:
+        np.ndarray: Float32 landmarks of shape (frames, 21, 3).
+    """
+
+    landmarks: np.ndarray = np.repeat(HAND_TEMPLATE[None], len(curls), axis=0)
+
+    for finger, indices in enumerate(FINGERS):
+        base: np.ndarray = landmarks[:, indices[0]]
+        for position, index in enumerate(indices[1:], start=1):
+            # Curled joints fold back over the finger base
+            fold: np.ndarray = (curls[:, finger] * position / (len(indices) - 1))[:, None]
+            landmarks[:, index] += fold * (base - landmarks[:, index]) * 1.2
+
+    center: np.ndarray = landmarks[:, :1, :2].copy()
+    landmarks[:, :, :2] = (landmarks[:, :, :2] - center) * scale[:, None, None] + center + shift[:, None]
+
+    return landmarks.astype(np.float32)
+
+
+def synthetic_landmarks(frames: int, seed: int = 0) -> np.ndarray:
+    """Generate synthetic hand poses.
+
+    Fingers are curled towards the palm by a random amount, so that different gestures are detected.
+
+    Args:
+        frames (int): Number of frames.
+        seed (int): Random seed. Default is 0.
+
+    Returns:
+        np.ndarray: Float32 landmarks of shape (frames, 21, 3).
+    """
+
+    rng: np.random.Generator = np.random.default_rng(seed)
+    landmarks: np.ndarray = pose_landmarks(
+        curls=rng.choice([0.0, 0.0, 0.5, 1.0], size=(frames, len(FINGERS))),
+        scale=rng.uniform(0.6, 1.4, size=frames),
+        shift=rng.uniform(-0.2, 0.2, size=(frames, 2))
+    )
+    landmarks += rng.normal(0.0, 0.005, size=landmarks.shape)
+
+    return landmarks.astype(np.float32)
+
+
+def session_landmarks(frames: int, seed: int = 0, pose_frames: int = 20) -> np.ndarray:
+    """Generate a session of continuous hand motion, resembling a camera recording.
+
+    The hand moves between random key poses (finger curls, scale and position) every `pose_frames` frames,
+    with per-frame jitter, so consecutive frames are close and gestures last for several frames.
+
+    Args:
+        frames (int): Number of frames.
+        seed (int): Random seed. Default is 0.
+        pose_frames (int): Number of frames between key poses. Default is 20.
+
+    Returns:
+        np.ndarray: Float32 landmarks of shape (frames, 21, 3).
+    """
+
+    rng: np.random.Generator = np.random.default_rng(seed)
+    n_keys: int = frames // pose_frames + 2
+    key_times: np.ndarray = np.arange(n_keys) * pose_frames
+    times: np.ndarray = np.arange(frames)
+
+    def interpolate(keys: np.ndarray) -> np.ndarray:
+        return np.stack([np.interp(times, key_times, column) for column in keys.T], axis=-1)
+
+    landmarks: np.ndarray = pose_landmarks(
+        curls=interpolate(rng.choice([0.0, 0.0, 0.5, 1.0], size=(n_keys, len(FINGERS)))),
+        scale=interpolate(rng.uniform(0.7, 1.3, size=(n_keys, 1)))[:, 0],
+        shift=interpolate(rng.uniform(-0.15, 0.15, size=(n_keys, 2)))
+    )
+    landmarks += rng.normal(0.0, 0.002, size=landmarks.shape)
+
+    return landmarks.astype(np.float32)
+
+
+def write_fixture(path: Path, frames: int = FIXTURE_FRAMES, seed: int = 0) -> None:
+    """Write a landmark recording of a generated session (see `session_landmarks`) of the right hand.
+
+    Args:
+        path (Path): The recording file path, replaced if it exists.
+        frames (int): Number of frames. Default is `FIXTURE_FRAMES`.
+        seed (int): Random seed. Default is 0.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+
+    with LandmarkRecorder(path) as recorder:
+        for i, frame in enumerate(session_landmarks(frames, seed)):
+            recorder.write(HandType.RIGHT, HandTrackingData(
+                is_hand_detected=True,
+                hand_confidence=0.98,
+                timestamp_ns=i * 1000 // FIXTURE_FPS,
+                keypoints=HandLandmarkPoints(frame)
+            ))
+
+
+def recorded_landmarks(path: Path, frames: int) -> np.ndarray:
+    """Read the right hand frames of a landmark recording.
+
+    Args:
+        path (Path): The recording file path.
+        frames (int): Maximum number of frames.
+
+    Returns:
+        np.ndarray: Float32 landmarks of shape (n, 21, 3).
+
+    Raises:
+        ValueError: If the recording has no right hand frames.
+    """
+
+    recording: LandmarkRecording = LandmarkRecording(path)
+    landmarks: np.ndarray = np.array(recording.landmarks[recording.hand == HAND_CODES[HandType.RIGHT]][:frames])
+
+    if not len(landmarks):
+        raise ValueError(f"{path} has no right hand frames")
+
+    return landmarks
+
+
+class ReplayHandsProcessor:
+    """A replacement of the MediaPipe `Hands` model returning precomputed results of the fixture frames in turn."""
+
+    def __init__(self, landmarks: np.ndarray) -> None:
+        self._results: list[SimpleNamespace] = [
+            SimpleNamespace(
+                multi_hand_landmarks=[landmark_pb2.NormalizedLandmarkList(
+                    landmark=[landmark_pb2.NormalizedLandmark(x=x, y=y, z=z) for x, y, z in frame.tolist()]
+                )],
+                multi_handedness=[classification_pb2.ClassificationList(
+                    classification=[classification_pb2.Classification(index=0, score=0.98, label="Right")]
+                )]
+            )
+            for frame in landmarks
+        ]
+        self._index: int = 0
+
+    def process(self, image: np.ndarray) -> SimpleNamespace:
+        result: SimpleNamespace = self._results[self._index]
+        self._index = (self._index + 1) % len(self._results)
+        return result
+
+
+def measure(step: Callable[[int], Any], frames: int, repeat: int, warmup: int = 100) -> dict:
+    """Call a stage step for every fixture frame and collect the per-call latency statistics.
+
+    Args:
+        step (Callable[[int], Any]): The stage step, called with the frame index.
+        frames (int): Number of fixture frames.
+        repeat (int): Number of passes over the fixture frames.
+        warmup (int): Number of calls before measuring. Default is 100.
+
+    Returns:
+        dict: The stage statistics.
+    """
+
+    for i in range(warmup):
+        step(i % frames)
+
+    perf_counter_ns: Callable[[], int] = time.perf_counter_ns
+    latencies: np.ndarray = np.empty(frames * repeat, dtype=np.int64)
+
+    for call in range(len(latencies)):
+        i: int = call % frames
+        start: int = perf_counter_ns()
+        step(i)
+        latencies[call] = perf_counter_ns() - start
+
+    latencies_us: np.ndarray = latencies / 1000
+
+    return {
+        "calls": len(latencies),
+        "calls_per_s": round(1e6 / latencies_us.mean(), 1),
+        "mean_us": round(float(latencies_us.mean()), 3),
+        **{f"p{q}_us": round(float(np.percentile(latencies_us, q)), 3) for q in PERCENTILES},
+        "max_us": round(float(latencies_us.max()), 3)
+    }
+
+
+def replay_hands_provider(landmarks: np.ndarray, tracer: FrameTracer | None = None) -> HandsProvider:
+    """Create a hands provider tracking the fixture frames in turn (see `ReplayHandsProcessor`).
+
+    Args:
+        landmarks (np.ndarray): Fixture landmarks of shape (n, 21, 3).
+        tracer (FrameTracer | None): The tracer of the provider, or None. Default is None.
+
+    Returns:
+        HandsProvider: The hands provider.
+    """
+
+    hand_tracking_provider: HandTrackingProvider = HandTrackingProvider(tracer=tracer)
+    hand_tracking_provider._hands_processor = ReplayHandsProcessor(landmarks)
+
+    return HandsProvider(hand_tracking_provider=hand_tracking_provider, tracer=tracer)
+
+
+def build_stages(landmarks: np.ndarray) -> dict[str, Callable[[int], Any]]:
+    """Build the benchmarked stages over the fixture frames.
+
+    Args:
+        landmarks (np.ndarray): Fixture landmarks of shape (n, 21, 3).
+
+    Returns:
+        dict[str, Callable[[int], Any]]: Stage steps by stage name.
+    """
+
+    width, height = FRAME_SIZE
+    points: list[HandLandmarkPoints] = [HandLandmarkPoints(frame) for frame in landmarks]
+    pixels: np.ndarray = np.rint(landmarks[:, :, :2] * FRAME_SIZE).astype(int)
+
+    hand_tracking_provider: HandTrackingProvider = HandTrackingProvider()
+    hand_tracking_provider._hands_processor = ReplayHandsProcessor(landmarks)
+    camera_frame: np.ndarray = np.zeros((64, 64, 3), dtype=np.uint8)
+    hands_provider: HandsProvider = replay_hands_provider(landmarks)
+    traced_hands_provider: HandsProvider = replay_hands_provider(landmarks, FrameTracer())
+
+    gesture_provider: GestureProvider = GestureProvider()
+    hands: list[Hand] = [
+        Hand(type=HandType.RIGHT, data=HandTrackingData(is_hand_detected=True, hand_confidence=0.98, keypoints=keypoints))
+        for keypoints in points
+    ]
+    filtered_hands: list[Hand] = [hand.model_copy(update={"required_gestures": FILTERED_GESTURES}) for hand in hands]
+
+    frame: np.ndarray = np.zeros((height, width, 3), dtype=np.uint8)
+    pointers: list[tuple[int, int] | None] = [get_pointer(keypoints, FRAME_SIZE) for keypoints in points]
+    compiled_shapes: CompiledShapes = compile_shapes(SHAPES)
+
+    thumb_index: list[tuple[tuple[int, int], tuple[int, int]]] = [
+        (tuple(frame_pixels[4].tolist()), tuple(frame_pixels[8].tolist())) for frame_pixels in pixels
+    ]
+    vectors: list[tuple[tuple[int, int], tuple[int, int]]] = [
+        (tuple((frame_pixels[8] - frame_pixels[0]).tolist()), (0, -height)) for frame_pixels in pixels
+    ]
+    triangles: list[tuple[tuple[int, int], ...]] = [
+        tuple(tuple(frame_pixels[i].tolist()) for i in (0, 5, 17)) for frame_pixels in pixels
+    ]
+    areas: list[float] = [max(heron_area_by_points(*triangle), 1.0) for triangle in triangles]
+
+    return {
+        "landmark_conversion": lambda i: hand_tracking_provider.update(camera_frame),
+        "detect_gestures_all": lambda i: gesture_provider.detect_gestures(hands[i]),
+        "detect_gestures_filtered": lambda i: gesture_provider.detect_gestures(filtered_hands[i]),
+        "render_shapes": lambda i: render_shapes(frame, SHAPES, pointers[i]),
+        "render_compiled_shapes": lambda i: render_shapes(frame, compiled_shapes, pointers[i]),
+        "math_utils.euclidean": lambda i: euclidean(*thumb_index[i]),
+        "math_utils.angle_between_vectors": lambda i: angle_between_vectors(*vectors[i]),
+        "math_utils.heron_area_by_points": lambda i: heron_area_by_points(*triangles[i]),
+        "math_utils.dist_from_triangle_0_5_17_to_camera": lambda i: dist_from_triangle_0_5_17_to_camera(areas[i]),
+        "hands_update": lambda i: hands_provider.update(camera_frame, right_hand_gestures=True),
+        "hands_update_traced": lambda i: traced_hands_provider.update(camera_frame, right_hand_gestures=True)
+    }
+
+
+def environment() -> dict:
+    """Get the environment the benchmark runs in.
+
+    Returns:
+        dict: Package, Python and NumPy versions and the platform.
+    """
+
+    try:
+        version: str = metadata.version("touchless")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+
+    return {
+        "touchless": version,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine()
+    }
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Compare the median latencies with baseline results.
+
+    Args:
+        results (dict): The benchmark results.
+        baseline (dict): Results of a previous run.
+        tolerance (float): Allowed relative slowdown of the median latency, e.g. 0.2 for 20%.
+
+    Returns:
+        list[str]: Descriptions of the stages slower than the baseline by more than the tolerance.
+    """
+
+    regressions: list[str] = []
+
+    for stage, stats in results["stages"].items():
+        baseline_stats: dict | None = baseline.get("stages", {}).get(stage)
+        if baseline_stats is None or baseline_stats["p50_us"] <= 0:
+            continue
+
+        ratio: float = stats["p50_us"] / baseline_stats["p50_us"]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{stage}: p50 {baseline_stats['p50_us']} -> {stats['p50_us']} us ({ratio:.2f}x)")
+
+    return regressions
+
+
+def main(
+    recording: str | None,
+    frames: int,
+    repeat: int,
+    output: str | None,
+    baseline: str | None,
+    tolerance: float
+) -> int:
+
+    recording_path: Path = Path(recording) if recording is not None else FIXTURE_PATH
+    fixtures: dict[str, tuple[np.ndarray, dict]] = {}
+
+    landmarks: np.ndarray = synthetic_landmarks(frames)
+    fixtures["synthetic"] = (landmarks, {"seed": 0, "frames": len(landmarks)})
+    landmarks = recorded_landmarks(recording_path, frames)
+    fixtures["session" if recording is None else "recorded"] = (
+        landmarks, {"path": str(recording_path), "frames": len(landmarks)}
+    )
+
+    results: dict = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "fixtures": {name: fixture for name, (_, fixture) in fixtures.items()},
+        "repeat": repeat,
+        "stages": {},
+        "tracing_overhead": {}
+    }
+
+    for fixture_name, (landmarks, _) in fixtures.items():
+        for stage, step in build_stages(landmarks).items():
+            # Stages of the other fixtures are named e.g. "session/detect_gestures_all"
+            stage = stage if fixture_name == "synthetic" else f"{fixture_name}/{stage}"
+            stats: dict = measure(step, len(landmarks), repeat)
+            results["stages"][stage] = stats
+            print(
+                f"{stage}: {stats['calls_per_s']} calls/s, "
+                + ", ".join(f"p{q} {stats[f'p{q}_us']} us" for q in PERCENTILES)
+                + f", max {stats['max_us']} us"
+            )
+
+        prefix: str = "" if fixture_name == "synthetic" else f"{fixture_name}/"
+        overhead_us: float = (
+            results["stages"][f"{prefix}hands_update_traced"]["p50_us"] - results["stages"][f"{prefix}hands_update"]["p50_us"]
+        )
+        results["tracing_overhead"][fixture_name] = {
+            "per_frame_us": round(overhead_us, 3),
+            "frame_budget_percent": round(100 * overhead_us / FRAME_BUDGET_US, 3)
+        }
+        print(
+            f"{fixture_name} tracing overhead: {overhead_us:.3f} us per frame "
+            f"({100 * overhead_us / FRAME_BUDGET_US:.3f}% of a {FRAME_BUDGET_US / 1000:.1f} ms frame)"
+        )
+
+    if output is not None:
+        Path(output).write_text(json.dumps(results, indent=2))
+
+    if baseline is not None:
+        regressions: list[str] = find_regressions(results, json.loads(Path(baseline).read_text()), tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+
+    args_parser = argparse.ArgumentParser()
+    args_parser.add_argument("--recording", type=str, default=None)
+    args_parser.add_argument("--frames", type=int, default=2000)
+    args_parser.add_argument("--repeat", type=int, default=5)
+    args_parser.add_argument("--output", type=str, default=None)
+    args_parser.add_argument("--baseline", type=str, default=None)
+    args_parser.add_argument("--tolerance", type=float, default=0.2)
+    args_parser.add_argument("--write-fixture", type=str, default=None)
+    args = args_parser.parse_args()
+
+    if args.write_fixture is not None:
+        write_fixture(Path(args.write_fixture))
+        sys.exit(0)
+
+    sys.exit(main(
+        recording=args.recording,
+        frames=args.frames,
+        repeat=args.repeat,
+        output=args.output,
+        baseline=args.baseline,
+        tolerance=args.tolerance
+    ))
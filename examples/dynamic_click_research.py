@@ -22,10 +22,11 @@ import time
 import cv2
 
 from touchless.camera import Camera
-from touchless.hands import HandsProvider
+from touchless.hands import HandsProvider, HandType
+from touchless.recording import LandmarkRecorder
 from touchless.utils.landmarks import (
     HandLandmarkPoints,
-    Point,
+    LandmarkPoint,
     get_pointer
 )
 from touchless.utils.shapes import draw_pointer
@@ -44,7 +45,7 @@ def get_pointer3d_normalized(points: HandLandmarkPoints | None) -> tuple[float,
     """
     
     if points:
-        index_tip: Point = points.index_tip
+        index_tip: LandmarkPoint = points.index_tip
         pointer: tuple[float, float, float] = (index_tip.x, index_tip.y, index_tip.z)
         return pointer
     return None
@@ -65,14 +66,15 @@ def main():
     CV_WIN_NAME: str = "window"
     cv2.namedWindow(CV_WIN_NAME, cv2.WINDOW_GUI_NORMAL)
 
-    # Create hands provider
-    hands_provider: HandsProvider = HandsProvider()
+    # Create hands provider, compare the research statistics with the built-in dynamic click (touchless.gestures.dynamic)
+    hands_provider: HandsProvider = HandsProvider(right_hand_gestures=["dynamic_click"])
 
     check_every: int = 20
     frame_cnt: int = 0
 
     coord_deltas_log = open(LOGS_DIR / f"coord_deltas_{check_every}.txt", "w")
-    coord_log = open(LOGS_DIR / f"coords_{int(time.time())}.txt", "w")
+    # Read with touchless.recording.LandmarkRecording
+    landmark_recorder: LandmarkRecorder = LandmarkRecorder(LOGS_DIR / f"landmarks_{int(time.time())}.bin")
 
     while cam.is_active:
 
@@ -80,8 +82,22 @@ def main():
 
         if frame is not None:
 
-            hands_provider.update(frame)
+            hands_provider.update(frame, right_hand_gestures=True)
             keypoints: HandLandmarkPoints | None = hands_provider.right_hand.data.keypoints
+            landmark_recorder.write(HandType.RIGHT, hands_provider.right_hand.data)
+
+            for i, gesture in enumerate(hands_provider.right_hand.gestures):
+                if gesture.data.is_detected:
+                    cv2.putText(
+                        frame,
+                        gesture.name,
+                        (10, 30 + 20 * i),
+                        fontFace=cv2.FONT_HERSHEY_COMPLEX,
+                        fontScale=0.5,
+                        color=(0, 100, 0),
+                        thickness=1
+                    )
+
             pointer: tuple[int, int] | None = get_pointer(keypoints, FRAME_SIZE)
             pointer3d: tuple[float, float, float] | None = get_pointer3d_normalized(keypoints)
             draw_pointer(frame, pointer)
@@ -90,8 +106,6 @@ def main():
 
             if pointer is not None:
                 x, y, z = list(map(lambda coord: round(coord, 3), pointer3d))
-                coord_log.write(f"x = {x} \t y = {y} \t ts = {time.time()}\n")
-                coord_log.flush()
                 if frame_cnt == 0:
                     start_x, start_y, start_z = x, y, z
                     start_time = time.time()
@@ -122,7 +136,7 @@ def main():
     print(cam.release_status)
     cv2.destroyWindow(CV_WIN_NAME)
     coord_deltas_log.close()
-    coord_log.close()
+    landmark_recorder.close()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 import cv2
 import numpy as np
 
-from touchless.hands import Hand, HandsProvider
+from touchless.hands import GestureProvider, GestureStateChange, GestureTransition, HandsProvider, HandType
 from touchless.camera import Camera
 
 
@@ -21,6 +21,22 @@ if __name__ == "__main__":
     # Create hands provider
     hands_provider: HandsProvider = HandsProvider()
 
+    # Keep detected gestures of each hand up to date, callbacks are called on state changes only
+    detected_gestures: dict[HandType, list[str]] = {HandType.RIGHT: [], HandType.LEFT: []}
+
+    def on_gesture_change(change: GestureStateChange) -> None:
+        if change.transition == GestureTransition.STARTED:
+            detected_gestures[change.hand.type].append(change.gesture)
+        else:
+            detected_gestures[change.hand.type].remove(change.gesture)
+
+    for gesture_name in GestureProvider.GESTURES:
+        hands_provider.subscribe(
+            gesture_name,
+            on_gesture_change,
+            transitions=GestureTransition.STARTED | GestureTransition.ENDED
+        )
+
     while cam.is_active:
 
         frame: np.ndarray | None = cam.read()
@@ -28,21 +44,13 @@ if __name__ == "__main__":
         if frame is not None:
 
             cv2.rectangle(frame, (0, 0), (FRAME_WIDTH, 100), color=(255, 255, 255), thickness=-1)
-            hands_provider.update(frame, right_hand_gestures=True, left_hand_gestures=True)
-            hands: list[Hand] = [hands_provider.right_hand, hands_provider.left_hand]
-
-            for i, hand in enumerate(hands):
-                
-                # Filter gestures: take just detected
-                detected_gestures: str = ", ".join([
-                    gesture.name
-                    for gesture in hand.gestures
-                    if gesture.data.is_detected
-                ])
+            hands_provider.update(frame)
+
+            for i, hand_type in enumerate(detected_gestures):
 
                 cv2.putText(
                     frame,
-                    f"{hand.type} hand detected gestures: {detected_gestures}",
+                    f"{hand_type} hand detected gestures: {', '.join(detected_gestures[hand_type])}",
                     (5, 10 + i * 20),
                     fontFace=cv2.FONT_HERSHEY_COMPLEX,
                     fontScale=0.4,
@@ -2,6 +2,7 @@ import cv2
 
 from touchless.camera import Camera
 from touchless.hands import HandsProvider
+from touchless.utils.compiled_shapes import CompiledShapes, compile_shapes
 from touchless.utils.landmarks import HandLandmarkPoints, get_pointer
 from touchless.utils.shapes import SHAPES, draw_pointer, render_shapes
 
@@ -21,6 +22,9 @@ def main():
     # Create hands provider
     hands_provider: HandsProvider = HandsProvider()
 
+    # Merge shapes draw parameters once
+    shapes: CompiledShapes = compile_shapes(SHAPES)
+
     while cam.is_active:
 
         frame = cam.read()
@@ -32,7 +36,7 @@ def main():
             pointer: tuple[int, int] | None = get_pointer(keypoints, FRAME_SIZE)
 
             draw_pointer(frame, pointer)
-            render_shapes(frame, SHAPES, pointer)
+            render_shapes(frame, shapes, pointer)
 
             cv2.imshow(CV_WIN_NAME, frame)
 
@@ -1,15 +1,22 @@
 import math
+import threading
+
 import cv2
+import numpy as np
 
 from touchless.camera import Camera
-from touchless.hands import HandsProvider
+from touchless.hands import HandsProvider, HandTrackingPredictor, HandTrackingProvider, HandType
 from touchless.utils.landmarks import HandLandmarkPoints, get_pointer
+from touchless.utils.compiled_shapes import CompiledShapes, compile_shapes
 from touchless.utils.shapes import SHAPES, draw_pointer, render_shapes
 
 
 def main():
 
-    cam: Camera = Camera()
+    # Frames are read and hands are tracked in a separate thread (at the camera rate),
+    # while the pointer is predicted and drawn at the display rate
+    cam: Camera = Camera(headless=True)
+    DISPLAY_FPS: int = 120
 
     FRAME_WIDTH: int = cam.resolution.width
     FRAME_HEIGHT: int = cam.resolution.height
@@ -19,8 +26,12 @@ def main():
     CV_WIN_NAME: str = "window"
     cv2.namedWindow(CV_WIN_NAME, cv2.WINDOW_GUI_NORMAL)
 
-    # Create hands provider
-    hands_provider: HandsProvider = HandsProvider()
+    # Shapes are static, so they are compiled once
+    shapes: CompiledShapes = compile_shapes(SHAPES)
+
+    # Create hands provider, with a predictor updated by its inference results
+    predictor: HandTrackingPredictor = HandTrackingPredictor()
+    hands_provider: HandsProvider = HandsProvider(hand_tracking_provider=HandTrackingProvider(predictor=predictor))
 
     # Control ROI is a square with a given side
     #####################################################
@@ -43,11 +54,29 @@ def main():
     ASPECT_RATIO_X = FRAME_WIDTH / CONTROL_ROI_SIZE
     ASPECT_RATIO_Y = FRAME_HEIGHT / CONTROL_ROI_SIZE
 
-    while cam.is_active:
+    last_frame: np.ndarray | None = None
+
+    def track_hands() -> None:
+        nonlocal last_frame
+
+        while cam.is_active:
+            frame = cam.read()
+
+            if frame is not None:
+                hands_provider.update(frame)
+                last_frame = frame
+
+    tracking_thread: threading.Thread = threading.Thread(target=track_hands)
+    tracking_thread.start()
+
+    while tracking_thread.is_alive():
+
+        if cv2.waitKey(1000 // DISPLAY_FPS) == 27:
+            cam.stop("Stop on key 27")
 
-        frame = cam.read()
+        if last_frame is not None:
 
-        if frame is not None:
+            frame = last_frame.copy()
 
             # Draw control ROI (virtual touchpad rectangle) 
             cv2.rectangle(
@@ -58,8 +87,7 @@ def main():
                 thickness=2
             )
 
-            hands_provider.update(frame)
-            keypoints: HandLandmarkPoints | None = hands_provider.right_hand.data.keypoints
+            keypoints: HandLandmarkPoints | None = predictor.predict()[HandType.RIGHT].keypoints
             pointer: tuple[int, int] | None = get_pointer(keypoints, FRAME_SIZE)
             mapped_pointer: tuple[int, int] | None = None
 
@@ -75,7 +103,7 @@ def main():
                 draw_pointer(frame, pointer)
                 draw_pointer(frame, mapped_pointer)
 
-            render_shapes(frame, SHAPES, mapped_pointer)
+            render_shapes(frame, shapes, mapped_pointer)
             cv2.imshow(CV_WIN_NAME, frame)
 
     print(cam.release_status)
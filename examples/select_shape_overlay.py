@@ -0,0 +1,88 @@
+import cv2
+
+from touchless.camera import Camera
+from touchless.hands import HandsProvider
+from touchless.utils.landmarks import get_pointer
+from touchless.utils.overlay import ShapeOverlay
+from touchless.utils.shapes import draw_pointer
+
+
+def get_grid_shapes(frame_size: tuple[int, int], columns: int = 12, rows: int = 8) -> list[dict]:
+    """Get a grid of keys (rectangles) covering the frame, in the `SHAPES` format.
+
+    Args:
+        frame_size (tuple[int, int]): Frame size (width, height).
+        columns (int): Number of grid columns. Default is 12.
+        rows (int): Number of grid rows. Default is 8.
+
+    Returns:
+        list[dict]: The shapes definitions.
+    """
+
+    width, height = frame_size
+    key_width, key_height = width // columns, height // rows
+
+    return [
+        {
+            "type": "rectangle",
+            "name": f"key_{row}_{column}",
+            "params": {
+                "default": {
+                    "pt1": (column * key_width + 4, row * key_height + 4),
+                    "pt2": ((column + 1) * key_width - 4, (row + 1) * key_height - 4),
+                    "color": (200, 150, 100),
+                    "thickness": 1
+                },
+                "on_select": {
+                    "thickness": -1
+                }
+            }
+        }
+        for row in range(rows)
+        for column in range(columns)
+    ]
+
+
+def main():
+
+    cam: Camera = Camera()
+
+    FRAME_WIDTH: int = cam.resolution.width
+    FRAME_HEIGHT: int = cam.resolution.height
+    FRAME_SIZE: tuple[int, int] = (FRAME_WIDTH, FRAME_HEIGHT)
+    print(f"Frame size = {FRAME_SIZE}")
+
+    CV_WIN_NAME: str = "window"
+    cv2.namedWindow(CV_WIN_NAME, cv2.WINDOW_GUI_NORMAL)
+
+    # Create hands provider
+    hands_provider: HandsProvider = HandsProvider()
+
+    # Many shapes are drawn once into an overlay, only the keys whose selection changed are redrawn
+    overlay: ShapeOverlay = ShapeOverlay(get_grid_shapes(FRAME_SIZE), FRAME_SIZE)
+
+    while cam.is_active:
+
+        frame = cam.read()
+
+        if frame is not None:
+
+            hands_provider.update(frame)
+            pointers: list[tuple[int, int] | None] = [
+                get_pointer(hands_provider.right_hand.data.keypoints, FRAME_SIZE),
+                get_pointer(hands_provider.left_hand.data.keypoints, FRAME_SIZE)
+            ]
+
+            overlay.render(frame, pointers)
+            for pointer in pointers:
+                draw_pointer(frame, pointer)
+
+            cv2.imshow(CV_WIN_NAME, frame)
+
+    print(cam.release_status)
+    cv2.destroyWindow(CV_WIN_NAME)
+
+
+if __name__ == "__main__":
+
+    main()
@@ -2,6 +2,7 @@ import cv2
 import numpy as np
 
 from touchless.camera import Camera
+from touchless.gestures.temporal import GestureEvent, GesturePhase, GestureStateMachine, GestureTiming
 from touchless.hands import HandsProvider
 
 
@@ -21,6 +22,8 @@ def main():
     ]
     # Create hands provider
     hands_provider: HandsProvider = HandsProvider(right_hand_gestures=required_gestures)
+    # Switch only on gestures held for 100 ms, ignoring single-frame flickers
+    gesture_state_machine: GestureStateMachine = GestureStateMachine(GestureTiming(min_duration_ms=100, cooldown_ms=300))
 
     while cam.is_active:
 
@@ -33,22 +36,27 @@ def main():
             # Create frame with a black img
             stopped_img: np.ndarray = np.zeros([100, 100, 3], dtype=np.uint8)
 
-            for gesture in hands_provider.right_hand.gestures:
+            gesture_events: list[GestureEvent] = gesture_state_machine.update(hands_provider.right_hand.gestures)
+
+            for event in gesture_events:
+
+                if event.phase != GesturePhase.BEGIN:
+                    continue
 
                 # Check if hand is inverted or down
-                if gesture.name == "hand_down" and gesture.data.is_detected:
+                if event.name == "hand_down":
                     VIDEO_ON = False
 
                 # Check if three signal is given
-                if gesture.name == "three_fingers_index_middle_ring" and gesture.data.is_detected:
+                if event.name == "three_fingers_index_middle_ring":
                     BLUR_ON = True
 
                 # Check if two signal is given
-                if gesture.name == "two_fingers_index_middle" and gesture.data.is_detected:
+                if event.name == "two_fingers_index_middle":
                     BLUR_ON = False
 
                 # Check if hand is up and continue the capture
-                if gesture.name == "hand_up" and gesture.data.is_detected:
+                if event.name == "hand_up":
                     VIDEO_ON = True
 
             # If the hand was down
@@ -0,0 +1,81 @@
+import math
+
+from mediapipe.python.solutions.hands import HandLandmark
+import numpy as np
+import pytest
+
+from touchless.gestures.dynamic import DynamicGestureTracker, LandmarkWindow, TrajectoryStats
+from touchless.utils.landmarks import LANDMARKS_SHAPE
+
+
+WINDOW_SIZE: int = 8
+FRAME_NS: int = 33_000_000
+
+
+def window_indices(window: LandmarkWindow) -> range:
+    return range(window.oldest_index, window.newest_index + 1) if len(window) else range(0)
+
+
+def expected_trajectory(stats: TrajectoryStats, window: LandmarkWindow, landmark: int) -> tuple[float, float]:
+    """Recomputes the path length and winding of a landmark over the window from scratch."""
+    points: list[np.ndarray] = [window.landmarks(i)[landmark, :2].astype(np.float64) for i in window_indices(window)]
+    steps: list[np.ndarray] = [b - a for a, b in zip(points, points[1:])]
+
+    path_length: float = sum(math.hypot(*step) for step in steps)
+    winding: float = 0.0
+    for previous_step, step in zip(steps, steps[1:]):
+        if math.hypot(*previous_step) >= stats._min_step and math.hypot(*step) >= stats._min_step:
+            winding += math.atan2(
+                previous_step[0] * step[1] - previous_step[1] * step[0],
+                previous_step[0] * step[0] + previous_step[1] * step[1]
+            )
+
+    return (path_length if len(points) > 1 else 0.0), (winding if len(points) > 2 else 0.0)
+
+
+def expected_excursion(values: dict[int, float], window: LandmarkWindow) -> tuple[float, float, int]:
+    """Recomputes the excursion of a value series over the window from scratch."""
+    indices: range = window_indices(window)
+    if len(indices) < 3:
+        return 0.0, 0.0, 0
+
+    peak_index: int = max(indices, key=lambda i: (values[i], i))
+    peak: float = values[peak_index]
+
+    return (
+        peak - values[indices[0]],
+        peak - values[indices[-1]],
+        window.timestamp_ns(peak_index) - window.timestamp_ns(indices[0])
+    )
+
+
+def test_running_stats_match_recomputation() -> None:
+    rng: np.random.Generator = np.random.default_rng(0)
+    tracker: DynamicGestureTracker = DynamicGestureTracker(WINDOW_SIZE)
+    landmarks: np.ndarray = rng.uniform(0.3, 0.7, size=LANDMARKS_SHAPE).astype(np.float32)
+    depths: dict[int, float] = {}
+    bends: dict[int, float] = {}
+
+    for frame in range(100):
+        # Steps below `min_step` (still hand jitter) and clears (lost hand, detected gesture) in between
+        if frame in (30, 31, 57):
+            tracker.reset()
+
+        scale: float = 0.001 if 40 <= frame < 50 else 0.03
+        landmarks = landmarks + rng.normal(0.0, scale, size=LANDMARKS_SHAPE).astype(np.float32)
+        tracker.update(landmarks, frame * FRAME_NS)
+
+        index: int = tracker.window.newest_index
+        depths[index] = -float(landmarks[HandLandmark.INDEX_FINGER_TIP, 2])
+        bends[index] = float(landmarks[HandLandmark.INDEX_FINGER_TIP, 1] - landmarks[HandLandmark.INDEX_FINGER_MCP, 1])
+
+        for stats, landmark in (
+            (tracker.palm, HandLandmark.MIDDLE_FINGER_MCP), (tracker.index_tip, HandLandmark.INDEX_FINGER_TIP)
+        ):
+            path_length, winding = expected_trajectory(stats, tracker.window, landmark)
+            assert stats.path_length == pytest.approx(path_length, abs=1e-9)
+            assert stats.winding == pytest.approx(winding, abs=1e-9)
+
+        for excursion_stats, values in ((tracker.index_depth, depths), (tracker.index_bend, bends)):
+            rise, fall, peak_ns = expected_excursion(values, tracker.window)
+            assert excursion_stats.excursion() == (pytest.approx(rise), pytest.approx(fall), peak_ns)
@@ -0,0 +1,166 @@
+from collections.abc import Callable
+
+from mediapipe.python.solutions.hands import HandLandmark
+import numpy as np
+import pytest
+
+from touchless.gestures.dsl import parse_rule
+from touchless.gestures.engine import GestureEngine, Rule, RuleLandmark, all_of, any_of, points
+from touchless.hands import GestureProvider
+from touchless.utils.landmarks import LANDMARK_NAMES, LANDMARKS_SHAPE, HandLandmarkPoints
+
+
+N_FRAMES: int = 1500
+THUMB_TIP: int = HandLandmark.THUMB_TIP.value
+FINGER_TIPS: list[int] = [
+    HandLandmark.INDEX_FINGER_TIP.value,
+    HandLandmark.MIDDLE_FINGER_TIP.value,
+    HandLandmark.RING_FINGER_TIP.value,
+    HandLandmark.PINKY_TIP.value
+]
+
+
+def random_frames(rng: np.random.Generator) -> np.ndarray:
+    """Get frames of random landmarks.
+
+    A third of the frames are ordered hands (x increasing and y decreasing along the landmarks, so fingers
+    are extended), the others are clustered so that distances are near the thresholds: finger tips around
+    the thumb tip (one of them close to it, as in pinches) or all landmarks close together.
+    """
+    frames: np.ndarray = rng.random((N_FRAMES, *LANDMARKS_SHAPE))
+    frames[1::3] = frames[1::3] * 0.12 + 0.4
+    frames[2::3] = frames[2::3] * 0.05 + 0.45
+
+    pinches: np.ndarray = frames[1::3]
+    radii: np.ndarray = rng.uniform(0.045, 0.06, (len(pinches), 4))
+    radii[np.arange(len(pinches)), rng.integers(0, 4, len(pinches))] = rng.uniform(0.02, 0.04, len(pinches))
+    angles: np.ndarray = rng.uniform(0, 2 * np.pi, (len(pinches), 4))
+    pinches[:, FINGER_TIPS, 0] = pinches[:, [THUMB_TIP], 0] + radii * np.cos(angles)
+    pinches[:, FINGER_TIPS, 1] = pinches[:, [THUMB_TIP], 1] + radii * np.sin(angles)
+
+    frames[::3, :, 0] = np.sort(frames[::3, :, 0], axis=1)
+    frames[::3, :, 1] = -np.sort(-frames[::3, :, 1], axis=1)
+    return frames.astype(np.float32)
+
+
+def quantized_frames(rng: np.random.Generator) -> np.ndarray:
+    """Get random frames quantized to a 0.02 grid, so coordinates and distances are often equal."""
+    return (np.round(random_frames(rng) * 50) / 50).astype(np.float32)
+
+
+def nan_frames(rng: np.random.Generator) -> np.ndarray:
+    """Get random frames with NaN landmarks: some frames without a hand and some with missing landmarks."""
+    frames: np.ndarray = random_frames(rng)
+    frames[rng.random((N_FRAMES, LANDMARKS_SHAPE[0])) < 0.05] = np.nan
+    frames[::10] = np.nan
+    return frames
+
+
+FRAMES: dict[str, Callable[[np.random.Generator], np.ndarray]] = {
+    "random": random_frames,
+    "quantized": quantized_frames,
+    "nan": nan_frames
+}
+
+REQUIRED_GESTURES: dict[str, list[str] | None] = {
+    "all": None,
+    # Evaluated lazily by a context of a compiled subset
+    "few": ["click_index_middle", "five_fingers", "pinch_thumb_index"],
+    # Evaluated by a vectorized pass over a compiled subset
+    "many": [name for name in GestureProvider.GESTURES if not name.startswith("pinch")]
+}
+
+
+@pytest.fixture(scope="module")
+def provider() -> GestureProvider:
+    return GestureProvider()
+
+
+@pytest.fixture(params=list(FRAMES), scope="module")
+def frames(request: pytest.FixtureRequest) -> np.ndarray:
+    return FRAMES[request.param](np.random.default_rng(2))
+
+
+@pytest.fixture(scope="module")
+def expected(provider: GestureProvider, frames: np.ndarray) -> np.ndarray:
+    """Detection flags of the `GESTURES` callables (each rule evaluated on its own), columns ordered as `GESTURES`."""
+    return np.array([
+        [bool(gesture_callable(HandLandmarkPoints(frame))) for gesture_callable in provider.GESTURES.values()]
+        for frame in frames
+    ])
+
+
+def test_rules_cover_gestures(provider: GestureProvider) -> None:
+    assert set(provider.GESTURE_RULES) == set(provider.GESTURES)
+
+
+def test_frames_detect_gestures(provider: GestureProvider) -> None:
+    # Each gesture is detected in some frames and not in others, otherwise the comparisons prove little
+    frames: np.ndarray = np.concatenate([get_frames(np.random.default_rng(2)) for get_frames in FRAMES.values()])
+    detected: np.ndarray = provider.detect_gestures_batch(frames)
+
+    assert detected.any(axis=0).all()
+    assert not detected.all(axis=0).any()
+
+
+@pytest.mark.parametrize("required", list(REQUIRED_GESTURES))
+def test_detect_gestures_batch(provider: GestureProvider, frames: np.ndarray, expected: np.ndarray, required: str) -> None:
+    required_gestures: list[str] | None = REQUIRED_GESTURES[required]
+    columns: list[int] = [list(provider.GESTURES).index(name) for name in provider.gesture_names(required_gestures)]
+
+    detected: np.ndarray = provider.detect_gestures_batch(frames, required_gestures, chunk_size=256)
+
+    np.testing.assert_array_equal(detected, expected[:, columns])
+
+
+@pytest.mark.parametrize("required", list(REQUIRED_GESTURES))
+def test_detect_gestures(provider: GestureProvider, frames: np.ndarray, expected: np.ndarray, required: str) -> None:
+    required_gestures: list[str] | None = REQUIRED_GESTURES[required]
+    gesture_names: list[str] = provider.gesture_names(required_gestures)
+    columns: list[int] = [list(provider.GESTURES).index(name) for name in gesture_names]
+
+    detected: np.ndarray = np.array([
+        list(provider._detect_gestures(HandLandmarkPoints(frame), required_gestures).values()) for frame in frames
+    ])
+
+    assert list(provider._detect_gestures(HandLandmarkPoints(frames[0]), required_gestures)) == gesture_names
+    np.testing.assert_array_equal(detected, expected[:, columns])
+
+
+def test_context(provider: GestureProvider, frames: np.ndarray, expected: np.ndarray) -> None:
+    for frame, frame_expected in zip(frames, expected):
+        context = provider.context(HandLandmarkPoints(frame))
+        assert [context[name] for name in provider.GESTURES] == frame_expected.tolist()
+
+
+def test_negated_rules(frames: np.ndarray) -> None:
+    rules: dict[str, Rule] = dict(GestureProvider.GESTURE_RULES)
+    negated: Rule = parse_rule(
+        "not (five_fingers or two_fingers_index_middle or three_fingers_index_middle_ring or two_fingers_thumb_index "
+        "or three_fingers_thumb_index_middle or two_fingers_index_pinky) and not (fist_closed and hand_up)",
+        rules
+    )
+    engine: GestureEngine = GestureEngine({**rules, "negated": negated})
+
+    detected: np.ndarray = engine.evaluate(frames)[:, engine.names.index("negated")]
+
+    assert detected.any()
+    assert detected.tolist() == [engine.context(frame).evaluate(negated) for frame in frames]
+
+
+def test_nested_disjunctions(frames: np.ndarray) -> None:
+    # 4 ** 8 clauses in disjunctive normal form, compiled with the disjunctions as subrules instead
+    landmarks: list[RuleLandmark] = [getattr(points, name) for name in LANDMARK_NAMES]
+    nested: Rule = all_of(*(
+        any_of(*(landmarks[i + j].y < landmarks[i + j + 1].y for j in range(4)))
+        for i in range(8)
+    ))
+    engine: GestureEngine = GestureEngine({"nested": nested, "negated": ~nested})
+
+    detected: np.ndarray = engine.evaluate(frames)
+    context_detected: list[list[bool]] = [
+        [engine.context(frame).evaluate(rule) for rule in engine.rules.values()] for frame in frames
+    ]
+
+    assert detected[:, 0].any() and not detected[:, 0].all()
+    assert detected.tolist() == context_detected
@@ -0,0 +1,96 @@
+import asyncio
+import contextlib
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from touchless.hands import GestureStateChange, HandsProvider, HandTrackingData, HandType
+from touchless.utils.landmarks import LANDMARKS_SHAPE, HandLandmarkPoints
+
+
+class FakeCamera:
+    """A headless camera returning blank frames, the reads after the first one taking `read_time` seconds."""
+
+    headless: bool = True
+
+    def __init__(self, frames: int = 100, read_time: float = 0.0) -> None:
+        self.frames: int = frames
+        self.read_time: float = read_time
+        self.reads: int = 0
+        self.is_reading: bool = False
+        self.read_started: threading.Event = threading.Event()
+
+    def read(self) -> np.ndarray | None:
+        self.is_reading = True
+        self.reads += 1
+
+        if self.reads > 1:
+            self.read_started.set()
+            time.sleep(self.read_time)
+
+        self.is_reading = False
+        return np.zeros((48, 64, 3), dtype=np.uint8) if self.reads <= self.frames else None
+
+
+class FakeHandTrackingProvider:
+    """A tracking provider detecting a raised right hand (the middle finger tip above the wrist) in every frame."""
+
+    def __init__(self) -> None:
+        landmarks: np.ndarray = np.full(LANDMARKS_SHAPE, 0.5, dtype=np.float32)
+        landmarks[0, 1] = 0.9
+        self.keypoints: HandLandmarkPoints = HandLandmarkPoints(landmarks)
+
+    def update(self, frame: np.ndarray) -> dict[HandType, HandTrackingData]:
+        return {
+            HandType.RIGHT: HandTrackingData(is_hand_detected=True, keypoints=self.keypoints, timestamp_ns=1),
+            HandType.LEFT: HandTrackingData()
+        }
+
+
+@pytest.mark.parametrize("consumer_wait", [0.0, 10.0])
+def test_stream_cancel_waits_for_read(consumer_wait: float) -> None:
+    # Cancelled while the stream awaits the next frame, or while the consumer holds the current one
+    camera: FakeCamera = FakeCamera(read_time=0.3)
+    hands_provider: HandsProvider = HandsProvider(hand_tracking_provider=FakeHandTrackingProvider())
+
+    async def consume() -> None:
+        async with contextlib.aclosing(hands_provider.stream(camera)) as stream:
+            async for _ in stream:
+                await asyncio.sleep(consumer_wait)
+
+    async def main() -> None:
+        task: asyncio.Task = asyncio.create_task(consume())
+        while not camera.read_started.is_set():
+            await asyncio.sleep(0.01)
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert task.cancelled()
+        assert not camera.is_reading
+        assert not [thread for thread in threading.enumerate() if thread.name.startswith("touchless-stream")]
+
+    asyncio.run(main())
+
+
+def test_stream_callbacks_run_on_loop() -> None:
+    camera: FakeCamera = FakeCamera(frames=3)
+    hands_provider: HandsProvider = HandsProvider(hand_tracking_provider=FakeHandTrackingProvider())
+    callback_threads: list[int] = []
+
+    def callback(state_change: GestureStateChange) -> None:
+        callback_threads.append(threading.get_ident())
+
+    hands_provider.subscribe("hand_up", callback, HandType.RIGHT)
+
+    async def main() -> int:
+        frames: int = 0
+        async for _ in hands_provider.stream(camera):
+            frames += 1
+        await asyncio.sleep(0)
+        return frames
+
+    assert asyncio.run(main()) == 3
+    assert callback_threads == [threading.get_ident()]
@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from touchless.utils.landmarks import LANDMARKS_SHAPE, HandLandmarkPoints, LandmarkPoint, Point
+
+
+def test_array_read_only_after_access() -> None:
+    array: np.ndarray = np.zeros(LANDMARKS_SHAPE, dtype=np.float32)
+    points: HandLandmarkPoints = HandLandmarkPoints(array)
+
+    # Writable until the landmarks are accessed as Python floats
+    points.array[8] = (0.1, 0.2, 0.3)
+    assert points.index_tip == (pytest.approx(0.1), pytest.approx(0.2), pytest.approx(0.3))
+
+    with pytest.raises(ValueError):
+        points.array[8] = 0.0
+
+
+def test_landmark_point_equality() -> None:
+    point: LandmarkPoint = LandmarkPoint(0.5, 0.25, 0.0)
+
+    assert point == Point(x=0.5, y=0.25, z=0.0)
+    assert point == (0.5, 0.25, 0.0)
+    assert hash(point) == hash((0.5, 0.25, 0.0))
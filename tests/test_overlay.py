@@ -0,0 +1,49 @@
+import numpy as np
+
+from touchless.utils.overlay import ShapeOverlay, get_shape_extent
+from touchless.utils.shapes import SHAPES, render_shapes
+
+
+FRAME_SIZE: tuple[int, int] = (640, 480)
+
+SHAPES_WITH_GEOMETRY_CHANGES: list[dict] = [
+    *SHAPES,
+    {
+        "type": "circle",
+        "params": {
+            "default": {"center": (300, 300), "radius": 20, "color": (255, 0, 0)},
+            "on_select": {"radius": 60, "thickness": 5}
+        }
+    },
+    {
+        "type": "rectangle",
+        "params": {"default": {"pt1": (330, 280), "pt2": (380, 320), "color": (255, 255, 0), "thickness": 3}}
+    }
+]
+
+
+def test_shape_extent_covers_both_states() -> None:
+    x1, y1, x2, y2 = get_shape_extent(SHAPES_WITH_GEOMETRY_CHANGES[-2])
+
+    assert x1 <= 300 - 60 - 2 and y1 <= 300 - 60 - 2
+    assert x2 >= 300 + 60 + 3 and y2 >= 300 + 60 + 3
+    assert get_shape_extent(SHAPES_WITH_GEOMETRY_CHANGES[-1]) == (328, 278, 383, 323)
+
+
+def test_overlay_matches_render_shapes() -> None:
+    overlay: ShapeOverlay = ShapeOverlay(SHAPES_WITH_GEOMETRY_CHANGES, FRAME_SIZE)
+    rng: np.random.Generator = np.random.default_rng(0)
+    background: np.ndarray = rng.integers(0, 256, size=(FRAME_SIZE[1], FRAME_SIZE[0], 3), dtype=np.uint8)
+
+    pointers: list = [
+        None, (100, 100), (100, 100), (300, 300), [(350, 300), (185, 35)], (250, 300), None, [(100, 200), None]
+    ]
+
+    for pointer in pointers:
+        expected: np.ndarray = background.copy()
+        frame: np.ndarray = background.copy()
+
+        render_shapes(expected, SHAPES_WITH_GEOMETRY_CHANGES, pointer)
+        overlay.render(frame, pointer)
+
+        np.testing.assert_array_equal(frame, expected)
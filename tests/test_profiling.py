@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+import threading
+
+import numpy as np
+import pytest
+
+from touchless.hands import HandsProvider, HandTrackingProvider
+from touchless.profiling import FrameTracer, StageStats
+
+
+def test_stats_and_percentiles() -> None:
+    tracer: FrameTracer = FrameTracer(window_size=100)
+
+    # Durations of 1..200 ms, the statistics cover the last 100 spans
+    for duration_ms in range(1, 201):
+        tracer.record("inference", 0, duration_ms * 1_000_000)
+    with tracer.span("callbacks"):
+        pass
+
+    stats: StageStats = tracer.stats("inference")
+
+    assert tracer.stages == ["inference", "callbacks"]
+    assert stats.count == 200
+    assert stats.mean_ms == pytest.approx(150.5)
+    assert stats.p50_ms == pytest.approx(np.percentile(np.arange(101, 201), 50))
+    assert stats.max_ms == pytest.approx(200.0)
+    assert tracer.percentiles("inference", (0, 100)) == {0: pytest.approx(101.0), 100: pytest.approx(200.0)}
+    assert tracer.summary()["callbacks"].count == 1
+
+    tracer.reset()
+
+    assert tracer.stages == []
+    with pytest.raises(KeyError):
+        tracer.stats("inference")
+
+
+def test_export_chrome_trace(tmp_path: Path) -> None:
+    tracer: FrameTracer = FrameTracer(capacity=3)
+
+    for stage in ("capture", "inference", "gesture_detection", "callbacks"):
+        tracer.record(stage, tracer._origin_ns + 1_000, tracer._origin_ns + 3_000)
+
+    worker: threading.Thread = threading.Thread(target=tracer.record, args=("capture", tracer._origin_ns), name="grabber")
+    worker.start()
+    worker.join()
+
+    path: Path = tmp_path / "trace.json"
+    tracer.export_chrome_trace(path)
+    events: list[dict] = json.loads(path.read_text())["traceEvents"]
+    spans: list[dict] = [event for event in events if event["ph"] == "X"]
+
+    assert {event["args"]["name"] for event in events if event["ph"] == "M"} == {
+        threading.current_thread().name, "grabber"
+    }
+    # Only the last `capacity` spans are kept
+    assert [span["name"] for span in spans] == ["gesture_detection", "callbacks", "capture"]
+    assert spans[0]["ts"] == pytest.approx(1.0) and spans[0]["dur"] == pytest.approx(2.0)
+
+
+def test_tracer_attached_to_given_provider() -> None:
+    tracer: FrameTracer = FrameTracer()
+    hand_tracking_provider: HandTrackingProvider = HandTrackingProvider()
+
+    HandsProvider(hand_tracking_provider=hand_tracking_provider, tracer=tracer)
+
+    assert hand_tracking_provider.tracer is tracer
+
+    with pytest.raises(ValueError):
+        HandsProvider(hand_tracking_provider=hand_tracking_provider, tracer=FrameTracer())
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from touchless.hands import HandTrackingData, HandType
+from touchless.recording import HAND_CODES, RECORD_DTYPE, LandmarkRecorder, LandmarkRecording
+from touchless.utils.landmarks import LANDMARKS_SHAPE, HandLandmarkPoints
+
+
+def tracking_data(i: int) -> HandTrackingData:
+    landmarks: np.ndarray = np.arange(np.prod(LANDMARKS_SHAPE), dtype=np.float32).reshape(LANDMARKS_SHAPE) + i
+    return HandTrackingData(
+        is_hand_detected=True,
+        hand_confidence=0.5,
+        keypoints=HandLandmarkPoints(landmarks),
+        timestamp_ns=1000 + i
+    )
+
+
+def test_record_layout_aligned() -> None:
+    assert RECORD_DTYPE.itemsize % 8 == 0
+    for name in RECORD_DTYPE.names:
+        field_dtype, offset = RECORD_DTYPE.fields[name][:2]
+        assert offset % field_dtype.base.itemsize == 0
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    path: Path = tmp_path / "landmarks.bin"
+
+    with LandmarkRecorder(path, buffer_size=2) as recorder:
+        for i, hand_type in enumerate((HandType.RIGHT, HandType.LEFT, HandType.RIGHT)):
+            recorder.write(hand_type, tracking_data(i))
+        assert not recorder.write(HandType.LEFT, HandTrackingData())
+
+    # Reopened for appending
+    with LandmarkRecorder(path) as recorder:
+        assert len(recorder) == 3
+        recorder.write(HandType.RIGHT, tracking_data(3))
+
+    recording: LandmarkRecording = LandmarkRecording(path)
+
+    assert len(recording) == 4
+    assert isinstance(recording.records, np.memmap)
+    assert recording.landmarks.flags.aligned
+    assert recording.timestamp_ns.tolist() == [(1000 + i) * 1_000_000 for i in range(4)]
+    assert recording.hand.tolist() == [HAND_CODES[HandType.RIGHT], HAND_CODES[HandType.LEFT]] + [HAND_CODES[HandType.RIGHT]] * 2
+    assert recording.confidence.tolist() == [0.5] * 4
+    for i in range(4):
+        np.testing.assert_array_equal(recording.landmarks[i], tracking_data(i).keypoints.array)
+    assert len(recording.select(HandType.LEFT)) == 1
+
+
+def test_incomplete_record_truncated_with_warning(tmp_path: Path) -> None:
+    path: Path = tmp_path / "landmarks.bin"
+
+    with LandmarkRecorder(path) as recorder:
+        recorder.write(HandType.RIGHT, tracking_data(0))
+
+    with open(path, "ab") as file:
+        file.write(b"\0" * 10)
+
+    assert len(LandmarkRecording(path)) == 1
+
+    with pytest.warns(RuntimeWarning, match="incomplete record"):
+        recorder = LandmarkRecorder(path)
+
+    with recorder:
+        recorder.write(HandType.RIGHT, tracking_data(1))
+
+    assert LandmarkRecording(path).timestamp_ns.tolist() == [1000 * 1_000_000, 1001 * 1_000_000]
+
+
+def test_invalid_file(tmp_path: Path) -> None:
+    path: Path = tmp_path / "landmarks.bin"
+    path.write_bytes(b"not a recording file")
+
+    with pytest.raises(ValueError, match="not a landmark recording"):
+        LandmarkRecorder(path)
+
+    assert path.read_bytes() == b"not a recording file"
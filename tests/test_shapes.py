@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from touchless.utils.compiled_shapes import CompiledShapes, compile_shapes
+from touchless.utils.events import PackedShapes
+from touchless.utils.shapes import BATCH_HIT_TEST_MIN_TESTS, SHAPES, render_shapes
+
+
+def grid_shapes(count: int) -> list[dict]:
+    shapes: list[dict] = []
+
+    for i in range(count):
+        x, y = 20 + (i % 20) * 30, 20 + (i // 20) * 30
+        if i % 2:
+            params: dict = {"pt1": (x - 10, y - 10), "pt2": (x + 10, y + 10), "color": (0, 255, 0)}
+            shapes.append({"type": "rectangle", "params": {"default": params, "on_select": {"thickness": -1}}})
+        else:
+            params = {"center": (x, y), "radius": 12, "color": (0, 0, 255)}
+            shapes.append({"type": "circle", "params": {"default": params, "on_select": {"thickness": -1}}})
+
+    return shapes
+
+
+POINTERS: list[tuple[int, int] | None] = [(20, 20), (50, 50), None, (320, 140), (595, 80)]
+
+
+def test_compiled_packed_geometry() -> None:
+    shapes: list[dict] = grid_shapes(100)
+    compiled: CompiledShapes = compile_shapes(shapes)
+
+    assert len(compiled[:10]) == 10
+    np.testing.assert_array_equal(
+        PackedShapes(compiled).select(POINTERS), PackedShapes(shapes).select(POINTERS)
+    )
+
+
+@pytest.mark.parametrize("count, pointers", [
+    (len(SHAPES), (100, 100)),
+    (len(SHAPES), POINTERS),
+    (BATCH_HIT_TEST_MIN_TESTS, POINTERS)
+])
+def test_render_compiled_shapes(count: int, pointers: tuple[int, int] | list[tuple[int, int] | None]) -> None:
+    shapes: list[dict] = SHAPES if count == len(SHAPES) else grid_shapes(count)
+    expected: np.ndarray = np.zeros((480, 640, 3), dtype=np.uint8)
+    frame: np.ndarray = expected.copy()
+
+    render_shapes(expected, shapes, pointers)
+    render_shapes(frame, compile_shapes(shapes), pointers)
+
+    np.testing.assert_array_equal(frame, expected)
@@ -0,0 +1,482 @@
+import argparse
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+import multiprocessing as mp
+import os
+from pathlib import Path
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from touchless.camera import FrameReader
+from touchless.hands import GestureProvider, HandTrackingData, HandTrackingProvider, HandType
+from touchless.utils.landmarks import LANDMARKS_SHAPE
+
+
+VIDEO_EXTENSIONS: tuple[str, ...] = (".avi", ".mkv", ".mov", ".mp4", ".mpeg", ".mpg", ".webm")
+HAND_TYPES: tuple[HandType, ...] = (HandType.RIGHT, HandType.LEFT)
+
+
+@dataclass
+class FrameChunk:
+    """A class representing a range of frames of a video processed by a worker.
+
+    Attributes:
+        video (Path): Path to the video file.
+        start (int): Index of the first frame.
+        stop (int): Index after the last frame.
+    """
+
+    video: Path
+    start: int
+    stop: int
+
+
+@dataclass
+class ChunkResult:
+    """A class representing hand tracking results of a frame chunk.
+
+    Attributes:
+        chunk (FrameChunk): The processed chunk.
+        landmarks (np.ndarray): Float32 landmarks of shape (n, 2, 21, 3), NaN where no hand is detected.
+        confidence (np.ndarray): Float32 hand confidences of shape (n, 2), 0 where no hand is detected.
+        gestures (np.ndarray): Boolean gesture flags of shape (n, 2, n_gestures).
+    """
+
+    chunk: FrameChunk
+    landmarks: np.ndarray
+    confidence: np.ndarray
+    gestures: np.ndarray
+
+
+@dataclass
+class ChunkError:
+    """A class representing a frame chunk which failed to process.
+
+    Attributes:
+        chunk (FrameChunk): The chunk.
+        error (str): The exception type and message.
+    """
+
+    chunk: FrameChunk
+    error: str
+
+
+@dataclass
+class BatchResult:
+    """A class representing the results of a batch.
+
+    Attributes:
+        output_paths (list[Path]): Paths to the saved result files, in the order of the videos.
+            Results of videos with a failed chunk are not saved.
+        errors (list[ChunkError]): The failed chunks, in the order they failed.
+    """
+
+    output_paths: list[Path]
+    errors: list[ChunkError]
+
+
+@dataclass
+class BatchProgress:
+    """A class representing the progress of a batch.
+
+    Attributes:
+        frames_done (int): Number of processed frames.
+        frames_total (int): Estimated total number of frames (from the video headers).
+        videos_done (int): Number of completed videos.
+        videos_total (int): Total number of videos.
+        elapsed_s (float): Time since the batch started in seconds.
+        chunks_failed (int): Number of chunks which failed to process.
+    """
+
+    frames_done: int
+    frames_total: int
+    videos_done: int
+    videos_total: int
+    elapsed_s: float
+    chunks_failed: int = 0
+
+    @property
+    def fps(self) -> float:
+        """Gets the processing rate.
+
+        Returns:
+            float: Processed frames per second.
+        """
+        return self.frames_done / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+def _iter_videos(inputs: Iterable[str | Path]) -> Iterator[tuple[Path, Path]]:
+    """Iterates over video files and their paths relative to the input they were found in.
+
+    Args:
+        inputs (Iterable[str | Path]): Video files or directories, searched recursively for files
+            with `VIDEO_EXTENSIONS`.
+
+    Yields:
+        tuple[Path, Path]: The video file and its path relative to the input directory (its name for a file input).
+
+    Raises:
+        FileNotFoundError: If an input does not exist.
+    """
+    for path in map(Path, inputs):
+        if path.is_dir():
+            for video in sorted(p for p in path.rglob("*") if p.suffix.lower() in VIDEO_EXTENSIONS):
+                yield video, video.relative_to(path)
+        elif path.is_file():
+            yield path, Path(path.name)
+        else:
+            raise FileNotFoundError(f"No such file or directory: {path}")
+
+
+def find_videos(inputs: Iterable[str | Path]) -> list[Path]:
+    """Finds video files.
+
+    Args:
+        inputs (Iterable[str | Path]): Video files or directories, searched recursively for files
+            with `VIDEO_EXTENSIONS`.
+
+    Returns:
+        list[Path]: The video files.
+
+    Raises:
+        FileNotFoundError: If an input does not exist.
+    """
+    return [video for video, _ in _iter_videos(inputs)]
+
+
+def get_output_paths(inputs: Iterable[str | Path], output_dir: str | Path) -> dict[Path, Path]:
+    """Gets paths to the result files of videos.
+
+    Results mirror the layout of the input directories: `<dir>/a/x.mp4` is saved to `<output_dir>/a/x.npz`,
+    so videos with the same name in different subdirectories do not overwrite each other's results.
+    Results of video files given directly are saved to `<output_dir>/<video stem>.npz`.
+
+    Args:
+        inputs (Iterable[str | Path]): Video files or directories, searched recursively for files
+            with `VIDEO_EXTENSIONS`.
+        output_dir (str | Path): Directory to save results to.
+
+    Returns:
+        dict[Path, Path]: Result file paths by video file, in the order of the videos.
+
+    Raises:
+        FileNotFoundError: If an input does not exist.
+        ValueError: If results of different videos would be saved to the same file (e.g. `x.mp4` and `x.avi`).
+    """
+    output_paths: dict[Path, Path] = {}
+    videos_by_output: dict[Path, Path] = {}
+
+    for video, relative_path in _iter_videos(inputs):
+        output_path: Path = Path(output_dir) / relative_path.with_suffix(".npz")
+        other_video: Path = videos_by_output.setdefault(output_path, video)
+
+        if other_video.resolve() != video.resolve():
+            raise ValueError(f"Results of videos {other_video} and {video} would both be saved to {output_path}")
+
+        output_paths[video] = output_path
+
+    return output_paths
+
+
+def read_video_info(video: Path) -> tuple[int, float]:
+    """Reads the frame count and the frame rate from a video header.
+
+    Args:
+        video (Path): Path to the video file.
+
+    Returns:
+        tuple[int, float]: The frame count (0 if unknown) and the frame rate.
+    """
+    capture: cv2.VideoCapture = cv2.VideoCapture(str(video))
+    frame_count: int = max(int(capture.get(cv2.CAP_PROP_FRAME_COUNT)), 0)
+    fps: float = capture.get(cv2.CAP_PROP_FPS)
+    capture.release()
+
+    return frame_count, fps
+
+
+def split_video(video: Path, frame_count: int, chunk_size: int) -> list[FrameChunk]:
+    """Splits a video into frame chunks.
+
+    Args:
+        video (Path): Path to the video file.
+        frame_count (int): Number of frames in the video header.
+        chunk_size (int): Number of frames per chunk.
+
+    Returns:
+        list[FrameChunk]: The chunks. The last chunk is open-ended, so frames beyond the frame count
+            of the video header are processed as well.
+    """
+    starts: list[int] = list(range(0, frame_count, chunk_size)) or [0]
+    stops: list[int] = starts[1:] + [sys.maxsize]
+
+    return [FrameChunk(video, start, stop) for start, stop in zip(starts, stops)]
+
+
+def seek_frame(capture: cv2.VideoCapture, frame_index: int) -> bool:
+    """Seeks a video to a frame, so that the next read frame is the frame with the index.
+
+    Seeking with `CAP_PROP_POS_FRAMES` is inexact for some codecs (it may land on a nearby key frame),
+    so the position is checked after seeking and, when it is off, frames are decoded forward to the index
+    (from the start of the video if the position is past it).
+
+    Args:
+        capture (cv2.VideoCapture): The video capture.
+        frame_index (int): Index of the frame.
+
+    Returns:
+        bool: True if the video is positioned at the frame, False if the video is shorter.
+    """
+    if not frame_index:
+        return True
+
+    capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+    position: int = int(capture.get(cv2.CAP_PROP_POS_FRAMES))
+
+    if position == frame_index:
+        return True
+
+    if not 0 <= position < frame_index:
+        capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        position = 0
+
+    for _ in range(frame_index - position):
+        if not capture.grab():
+            return False
+
+    return True
+
+
+def process_chunk(chunk: FrameChunk, flip: bool = False) -> ChunkResult:
+    """Tracks hands and detects gestures in a frame chunk.
+
+    Args:
+        chunk (FrameChunk): The chunk.
+        flip (bool): Whether to horizontally flip the frames. Default is False.
+
+    Returns:
+        ChunkResult: The results.
+    """
+    capture: cv2.VideoCapture = cv2.VideoCapture(str(chunk.video))
+    frame_reader: FrameReader = FrameReader(capture, flip=flip)
+    hand_tracking_provider: HandTrackingProvider = HandTrackingProvider()
+    gesture_provider: GestureProvider = GestureProvider()
+
+    landmarks: list[np.ndarray] = []
+    confidence: list[np.ndarray] = []
+    frame: np.ndarray | None = None
+
+    for _ in range(chunk.start, chunk.stop if seek_frame(capture, chunk.start) else chunk.start):
+        if (frame := frame_reader.read(frame)) is None:
+            break
+
+        hands_tracking_data: dict[HandType, HandTrackingData] = hand_tracking_provider.update(frame)
+        frame_landmarks: np.ndarray = np.full((len(HAND_TYPES), *LANDMARKS_SHAPE), np.nan, dtype=np.float32)
+        frame_confidence: np.ndarray = np.zeros(len(HAND_TYPES), dtype=np.float32)
+
+        for i, hand_type in enumerate(HAND_TYPES):
+            data: HandTrackingData = hands_tracking_data[hand_type]
+            if data.is_hand_detected and data.keypoints is not None:
+                frame_landmarks[i] = data.keypoints.array
+                frame_confidence[i] = data.hand_confidence or 0.0
+
+        landmarks.append(frame_landmarks)
+        confidence.append(frame_confidence)
+
+    capture.release()
+
+    landmarks_array: np.ndarray = (
+        np.stack(landmarks) if landmarks else np.empty((0, len(HAND_TYPES), *LANDMARKS_SHAPE), dtype=np.float32)
+    )
+    gestures: np.ndarray = gesture_provider.detect_gestures_batch(
+        landmarks_array.reshape(-1, *LANDMARKS_SHAPE)
+    ).reshape(len(landmarks_array), len(HAND_TYPES), -1)
+
+    return ChunkResult(
+        chunk=chunk,
+        landmarks=landmarks_array,
+        confidence=np.stack(confidence) if confidence else np.empty((0, len(HAND_TYPES)), dtype=np.float32),
+        gestures=gestures
+    )
+
+
+def save_results(results: list[ChunkResult], path: Path, fps: float) -> None:
+    """Saves results of a video as a compressed `.npz` file.
+
+    The file contains `landmarks` (n, 2, 21, 3), `detected` (n, 2), `confidence` (n, 2), `gestures` (n, 2, n_gestures),
+    `gesture_names`, `hand_types` and `fps`. The hand axis is ordered as `hand_types` (right, left).
+
+    Args:
+        results (list[ChunkResult]): Results of all chunks of the video.
+        path (Path): Path to the output file.
+        fps (float): Frame rate of the video.
+    """
+    results = sorted(results, key=lambda result: result.chunk.start)
+    landmarks: np.ndarray = np.concatenate([result.landmarks for result in results])
+
+    np.savez_compressed(
+        path,
+        landmarks=landmarks,
+        detected=~np.isnan(landmarks[:, :, 0, 0]),
+        confidence=np.concatenate([result.confidence for result in results]),
+        gestures=np.concatenate([result.gestures for result in results]),
+        gesture_names=np.array(GestureProvider().gesture_names()),
+        hand_types=np.array([str(hand_type) for hand_type in HAND_TYPES]),
+        fps=np.float32(fps)
+    )
+
+
+def print_progress(progress: BatchProgress) -> None:
+    """Prints the progress of a batch to stderr on a single line.
+
+    Args:
+        progress (BatchProgress): The progress.
+    """
+    percent: float = 100 * progress.frames_done / progress.frames_total if progress.frames_total else 0.0
+    print(
+        f"\r{progress.frames_done}/{progress.frames_total} frames ({percent:.1f}%), "
+        f"{progress.videos_done}/{progress.videos_total} videos, "
+        f"{progress.fps:.1f} FPS, {progress.elapsed_s:.0f} s"
+        f"{f', {progress.chunks_failed} failed chunks' if progress.chunks_failed else ''}",
+        end="",
+        file=sys.stderr,
+        flush=True
+    )
+
+
+def process_videos(
+    inputs: Iterable[str | Path],
+    output_dir: str | Path,
+    workers: int | None = None,
+    chunk_size: int = 500,
+    flip: bool = False,
+    progress: Callable[[BatchProgress], None] | None = print_progress
+) -> BatchResult:
+    """Processes video files in parallel chunks and saves per-frame landmark and gesture arrays.
+
+    Each video is split into chunks of `chunk_size` frames, which are processed by a pool of worker processes.
+    Hand tracking restarts at every chunk. The results of a video are saved (see `save_results`) as soon as all
+    its chunks are done, to the path mirroring the video path relative to its input (see `get_output_paths`).
+    A chunk which fails (e.g. a corrupt video) is reported in the batch errors and the batch continues,
+    the results of its video are not saved.
+
+    Args:
+        inputs (Iterable[str | Path]): Video files or directories of videos.
+        output_dir (str | Path): Directory to save results to, created if it does not exist.
+        workers (int | None): Number of worker processes, or None for the number of CPUs.
+        chunk_size (int): Number of frames per chunk. Default is 500.
+        flip (bool): Whether to horizontally flip the frames. Default is False.
+        progress (Callable[[BatchProgress], None] | None): Progress callback called after every chunk,
+            or None. Default is `print_progress`.
+
+    Returns:
+        BatchResult: Paths to the saved result files and the failed chunks.
+
+    Raises:
+        ValueError: If results of different videos would be saved to the same file.
+    """
+    output_paths: dict[Path, Path] = get_output_paths(inputs, output_dir)
+    videos: list[Path] = list(output_paths)
+
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    for output_path in output_paths.values():
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    video_info: dict[Path, tuple[int, float]] = {video: read_video_info(video) for video in videos}
+    chunks: dict[Path, list[FrameChunk]] = {
+        video: split_video(video, frame_count, chunk_size) for video, (frame_count, _) in video_info.items()
+    }
+    frames_total: int = sum(frame_count for frame_count, _ in video_info.values())
+    results: dict[Path, list[ChunkResult]] = {video: [] for video in videos}
+    failed_chunks: dict[Path, int] = {video: 0 for video in videos}
+    errors: list[ChunkError] = []
+    videos_done: int = 0
+    frames_done: int = 0
+    started_at: float = time.perf_counter()
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn")) as executor:
+        futures: dict[Future, FrameChunk] = {
+            executor.submit(process_chunk, chunk, flip): chunk for chunk_list in chunks.values() for chunk in chunk_list
+        }
+
+        for future in as_completed(futures):
+            chunk: FrameChunk = futures[future]
+            video: Path = chunk.video
+
+            try:
+                result: ChunkResult = future.result()
+            except Exception as error:
+                errors.append(ChunkError(chunk, f"{type(error).__name__}: {error}"))
+                failed_chunks[video] += 1
+            else:
+                results[video].append(result)
+                frames_done += len(result.landmarks)
+
+            if len(results[video]) + failed_chunks[video] == len(chunks[video]):
+                video_results: list[ChunkResult] = results.pop(video)
+                if not failed_chunks[video]:
+                    save_results(video_results, output_paths[video], video_info[video][1])
+                videos_done += 1
+
+            if progress is not None:
+                progress(BatchProgress(
+                    frames_done=frames_done,
+                    frames_total=max(frames_total, frames_done),
+                    videos_done=videos_done,
+                    videos_total=len(videos),
+                    elapsed_s=time.perf_counter() - started_at,
+                    chunks_failed=len(errors)
+                ))
+
+    failed_videos: set[Path] = {video for video, failed in failed_chunks.items() if failed}
+
+    return BatchResult(
+        output_paths=[output_path for video, output_path in output_paths.items() if video not in failed_videos],
+        errors=errors
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Runs the batch processor from the command line."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="touchless-batch",
+        description="Track hands and detect gestures in video files, saving per-frame arrays as .npz files."
+    )
+    parser.add_argument("inputs", nargs="+", help="Video files or directories of videos")
+    parser.add_argument("-o", "--output-dir", default="landmarks", help="Output directory (default: landmarks)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Number of worker processes (default: CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Frames per chunk (default: 500)")
+    parser.add_argument("--flip", action="store_true", help="Horizontally flip the frames")
+    parser.add_argument("--quiet", action="store_true", help="Do not report progress")
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    batch_result: BatchResult = process_videos(
+        args.inputs,
+        args.output_dir,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        flip=args.flip,
+        progress=None if args.quiet else print_progress
+    )
+
+    if not args.quiet:
+        print(file=sys.stderr)
+
+    for path in batch_result.output_paths:
+        print(path)
+
+    for chunk_error in batch_result.errors:
+        chunk: FrameChunk = chunk_error.chunk
+        print(f"{chunk.video}: chunk from frame {chunk.start} failed: {chunk_error.error}", file=sys.stderr)
+
+    if batch_result.errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
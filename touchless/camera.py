@@ -1,8 +1,17 @@
+from collections.abc import Callable
 from dataclasses import dataclass
+from multiprocessing import synchronize
+import signal
+import threading
+import time
+from types import FrameType
 
 import cv2
 import numpy as np
 
+from touchless.profiling import FrameTracer
+from touchless.utils.buffers import FrameBufferPool
+
 
 @dataclass
 class Resolution:
@@ -17,6 +26,160 @@ class Resolution:
     height: int
 
 
+class FrameReader:
+    """A class for reading (and flipping) frames from an OpenCV capture, optionally into given buffers."""
+
+    def __init__(self, capture: cv2.VideoCapture, flip: bool = False) -> None:
+        """Initializes the FrameReader.
+
+        Args:
+            capture (cv2.VideoCapture): An opened OpenCV capture to read frames from.
+            flip (bool): Whether to horizontally flip the captured frames. Default is False.
+        """
+        self._capture: cv2.VideoCapture = capture
+        self._flip: bool = flip
+        self._raw_frame: np.ndarray | None = None
+        self._frame_shape: tuple[int, ...] | None = None
+
+    def read(self, dst: np.ndarray | None = None) -> np.ndarray | None:
+        """Reads a frame.
+
+        Args:
+            dst (np.ndarray | None): A buffer to write the frame into. A new array is allocated if it is None
+                or does not match the frame shape. When flipping, the raw frame is captured into a reused internal buffer.
+
+        Returns:
+            np.ndarray | None: The frame (`dst` if it was used), or None if there was an error.
+        """
+        frame: np.ndarray | None
+
+        if not self._flip:
+            status, frame = self._capture.read(dst)
+        else:
+            status, self._raw_frame = self._capture.read(self._raw_frame)
+            frame = cv2.flip(self._raw_frame, 1, dst=dst) if status else None
+
+        if not status or frame is None:
+            return None
+
+        self._frame_shape = frame.shape
+        return frame
+
+    @property
+    def frame_shape(self) -> tuple[int, ...] | None:
+        """Gets the shape of the last read frame.
+
+        Returns:
+            tuple[int, ...] | None: The frame shape, or None if no frame was read yet.
+        """
+        return self._frame_shape
+
+
+class FrameGrabber:
+    """A class for reading frames from an OpenCV capture in a background thread.
+
+    The grabber keeps only the latest frame: a frame which is not read before the next one
+    is captured is dropped and counted.
+    """
+
+    def __init__(self, frame_reader: FrameReader, buffer_pool: FrameBufferPool | None = None) -> None:
+        """Initializes the FrameGrabber.
+
+        Args:
+            frame_reader (FrameReader): The reader to read frames with.
+            buffer_pool (FrameBufferPool | None): A pool of at least 3 buffers to capture frames into, or None
+                to allocate a new array per frame. Buffers of the pending frame and the last read frame are never
+                reused, so a frame returned by `read` stays valid until the next `read` call. Default is None.
+
+        Raises:
+            ValueError: If the buffer pool has less than 3 buffers.
+        """
+        if buffer_pool is not None and buffer_pool.size < 3:
+            raise ValueError(f"Frame grabber needs a buffer pool of at least 3 buffers, got {buffer_pool.size}")
+
+        self._frame_reader: FrameReader = frame_reader
+        self._buffer_pool: FrameBufferPool | None = buffer_pool
+        self._frame: np.ndarray | None = None
+        self._read_frame: np.ndarray | None = None
+        self._dropped_frames: int = 0
+        self._finished: bool = False
+        self._condition: threading.Condition = threading.Condition()
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(target=self._run, name="touchless-frame-grabber", daemon=True)
+
+    def start(self) -> None:
+        """Starts capturing frames in the background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops capturing frames and waits for the background thread to finish."""
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def read(self, timeout: float | None = None) -> np.ndarray | None:
+        """Reads the latest captured frame, waiting for a new one if it has already been read.
+
+        Args:
+            timeout (float | None): Maximum time in seconds to wait for a new frame, or None to wait forever.
+
+        Returns:
+            np.ndarray | None: The latest frame, or None if the capture is finished or the timeout expired.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._frame is not None or self._finished, timeout)
+            frame: np.ndarray | None = self._frame
+            self._frame = None
+
+            if frame is not None:
+                self._read_frame = frame
+
+        return frame
+
+    @property
+    def dropped_frames(self) -> int:
+        """Gets the number of captured frames which were replaced by a newer frame before being read.
+
+        Returns:
+            int: The number of dropped frames.
+        """
+        return self._dropped_frames
+
+    @property
+    def is_finished(self) -> bool:
+        """Checks if the capture is finished (stopped or no more frames can be read).
+
+        Returns:
+            bool: True if the capture is finished, False otherwise.
+        """
+        return self._finished
+
+    def _run(self) -> None:
+        """Reads frames until stopped or the capture fails."""
+        while not self._stop_event.is_set():
+            dst: np.ndarray | None = None
+
+            if self._buffer_pool is not None and self._frame_reader.frame_shape is not None:
+                with self._condition:
+                    in_use: tuple[np.ndarray | None, ...] = (self._frame, self._read_frame)
+                dst = self._buffer_pool.acquire(self._frame_reader.frame_shape, exclude=in_use)
+
+            frame: np.ndarray | None = self._frame_reader.read(dst)
+
+            if frame is None:
+                break
+
+            with self._condition:
+                if self._frame is not None:
+                    self._dropped_frames += 1
+                self._frame = frame
+                self._condition.notify_all()
+
+        with self._condition:
+            self._finished = True
+            self._condition.notify_all()
+
+
 class Camera:
     """A class for capturing video using OpenCV."""
 
@@ -27,7 +190,14 @@ class Camera:
         height: int = 480,
         stop_capture_keys: tuple[int, ...] = (27,),
         codec_fourcc: str = "MJPG",
-        flip: bool = True
+        flip: bool = True,
+        threaded: bool = False,
+        read_timeout: float | None = 1.0,
+        buffer_pool_size: int = 0,
+        headless: bool = False,
+        stop_event: threading.Event | synchronize.Event | None = None,
+        stop_signals: tuple[int, ...] = (),
+        tracer: FrameTracer | None = None
     ) -> None:
         """Initializes the Camera object.
 
@@ -38,6 +208,23 @@ class Camera:
             stop_capture_keys (tuple[int, ...]): Keys to stop the video capture. Default is (27,) for the 'Esc' key.
             codec_fourcc (str): FourCC code representing the codec for video writing. Default is "MJPG".
             flip (bool): Whether to horizontally flip the captured frames. Default is True.
+            threaded (bool): Whether to capture frames in a background thread. The `read` method then returns
+                the latest captured frame and frames which were not read in time are dropped. Default is False.
+            read_timeout (float | None): Maximum time in seconds `read` waits for a new frame in threaded mode,
+                or None to wait forever. Default is 1.0.
+            buffer_pool_size (int): Number of pre-allocated buffers frames are captured (and flipped) into,
+                or 0 to allocate new arrays for every frame. A frame returned by `read` is overwritten after
+                `buffer_pool_size - 1` more reads, so copy frames which are kept longer. In threaded mode at least
+                3 buffers are used and a frame stays valid until the next `read` call. Default is 0.
+            headless (bool): Whether to run without HighGUI: `read` does not poll keys with `cv2.waitKey`
+                (`stop_capture_keys` are ignored), use `stop`, `stop_event` or `stop_signals` instead. Default is False.
+            stop_event (threading.Event | synchronize.Event | None): An event which stops the capture when set,
+                e.g. from another thread or process. Default is None (an internal event set by `stop`).
+            stop_signals (tuple[int, ...]): Signals (e.g. `signal.SIGINT`, `signal.SIGTERM`) which stop the capture.
+                Handlers are installed for the camera lifetime, so the camera must be created in the main thread.
+                Default is () (no handlers).
+            tracer (FrameTracer | None): A tracer recording the "poll_keys" and "capture" stages of `read`,
+                or None. Default is None.
         """
         self._cap = cv2.VideoCapture(ocv_capture)
         self._set_resolution(width, height)
@@ -47,26 +234,76 @@ class Camera:
         self._active: bool = self._cap.isOpened()
         self._stop_capture_keys: tuple[int, ...] = stop_capture_keys
         self._release_status: str = ""
+        self._read_timeout: float | None = read_timeout
+        self._frame_reader: FrameReader = FrameReader(self._cap, flip=self._flip)
+        self._buffer_pool: FrameBufferPool | None = None
+        self._frame_grabber: FrameGrabber | None = None
+        self._headless: bool = headless
+        self._stop_event: threading.Event | synchronize.Event = stop_event if stop_event is not None else threading.Event()
+        self._stop_status: str = "Stop on event"
+        self._prev_signal_handlers: dict[int, Callable | int | None] = {
+            sig: signal.signal(sig, self._on_stop_signal) for sig in stop_signals
+        }
+        self._tracer: FrameTracer | None = tracer
+
+        if buffer_pool_size > 0:
+            self._buffer_pool = FrameBufferPool(max(buffer_pool_size, 3) if threaded else buffer_pool_size)
+
+        if threaded and self._active:
+            self._frame_grabber = FrameGrabber(self._frame_reader, buffer_pool=self._buffer_pool)
+            self._frame_grabber.start()
 
     def read(self) -> np.ndarray | None:
         """Reads a frame from the camera.
 
         Returns:
-            np.ndarray | None: The captured frame, or None if there was an error or a stop key was pressed.
+            np.ndarray | None: The captured frame, or None if there was an error or the capture was stopped.
         """
-        key: int = cv2.waitKey(1)
-
-        if key in self._stop_capture_keys:
+        if self._stop_event.is_set():
             self._release()
-            self._release_status = f"Stop on key {key}"
+            self._release_status = self._stop_status
             return None
-        
-        status, frame = self._cap.read()
-        if status and self._flip:
-            frame = cv2.flip(frame, 1)
+
+        tracer: FrameTracer | None = self._tracer
+
+        if not self._headless:
+            start_ns: int = time.perf_counter_ns() if tracer is not None else 0
+            key: int = cv2.waitKey(1)
+            if tracer is not None:
+                tracer.record("poll_keys", start_ns)
+
+            if key in self._stop_capture_keys:
+                self._release()
+                self._release_status = f"Stop on key {key}"
+                return None
+
+        start_ns = time.perf_counter_ns() if tracer is not None else 0
+        frame: np.ndarray | None
+
+        if self._frame_grabber is not None:
+            frame = self._read_latest()
+        else:
+            dst: np.ndarray | None = None
+            if self._buffer_pool is not None and self._frame_reader.frame_shape is not None:
+                dst = self._buffer_pool.acquire(self._frame_reader.frame_shape)
+            frame = self._frame_reader.read(dst)
+
+        if tracer is not None:
+            tracer.record("capture", start_ns)
 
         return frame
 
+    def stop(self, status: str = "Stop on request") -> None:
+        """Requests the capture to stop, the camera is released on the next `read` call.
+
+        Safe to call from another thread or a signal handler.
+
+        Args:
+            status (str): The release status to report. Default is "Stop on request".
+        """
+        self._stop_status = status
+        self._stop_event.set()
+
     @property
     def is_active(self) -> bool:
         """Checks if the camera is active.
@@ -76,6 +313,15 @@ class Camera:
         """
         return self._active
 
+    @property
+    def headless(self) -> bool:
+        """Checks if the camera runs without OpenCV HighGUI calls (no key handling).
+
+        Returns:
+            bool: True if the camera is headless, False otherwise.
+        """
+        return self._headless
+
     @property
     def resolution(self) -> Resolution:
         """Gets the resolution of the camera.
@@ -94,6 +340,17 @@ class Camera:
         """
         return self._release_status
     
+    @property
+    def dropped_frames(self) -> int:
+        """Gets the number of frames dropped in threaded mode because a newer frame was captured before reading.
+
+        Returns:
+            int: The number of dropped frames (always 0 if not in threaded mode).
+        """
+        if self._frame_grabber is None:
+            return 0
+        return self._frame_grabber.dropped_frames
+
     @property
     def fps(self) -> int:
         """Gets the frames per second (FPS) of the camera.
@@ -117,7 +374,44 @@ class Camera:
         height: int = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         self._resolution: Resolution = Resolution(width, height)
 
+    def _read_latest(self) -> np.ndarray | None:
+        """Reads the latest frame captured by the background frame grabber.
+
+        Returns:
+            np.ndarray | None: The latest frame, or None if there was no new frame in time or the capture is finished.
+        """
+        frame_grabber: FrameGrabber | None = self._frame_grabber
+
+        if frame_grabber is None:
+            return None
+
+        frame: np.ndarray | None = frame_grabber.read(self._read_timeout)
+
+        if frame is None and frame_grabber.is_finished:
+            self._release()
+            self._release_status = "Stop on capture end"
+
+        return frame
+
+    def _on_stop_signal(self, signum: int, frame: FrameType | None) -> None:
+        """Handles a stop signal.
+
+        Args:
+            signum (int): The signal number.
+            frame (FrameType | None): The interrupted stack frame.
+        """
+        self.stop(f"Stop on signal {signal.Signals(signum).name}")
+
     def _release(self) -> None:
         """Releases the camera resources."""
         self._active = False
+
+        if self._frame_grabber is not None:
+            self._frame_grabber.stop()
+
+        if threading.current_thread() is threading.main_thread():
+            for sig, handler in self._prev_signal_handlers.items():
+                signal.signal(sig, handler if handler is not None else signal.SIG_DFL)
+            self._prev_signal_handlers = {}
+
         self._cap.release()
@@ -3,3 +3,4 @@ from .fingers import *
 from .clicks import *
 from .geometry import *
 from .pinches import *
+from .dynamic import *
@@ -1,9 +1,17 @@
-from touchless.gestures.fingers import two_fingers_4_8, two_fingers_8_12
+from touchless.gestures.engine import Rule, evaluate_rule
+from touchless.gestures.rules import (
+    CLICK_4_6,
+    CLICK_4_6_DIST_THRESHOLD,
+    CLICK_6_8,
+    CLICK_8_12,
+    CLICK_8_12_DIST_THRESHOLD,
+    click_4_6_rule,
+    click_8_12_rule
+)
 from touchless.utils.landmarks import HandLandmarkPoints
-from touchless.utils.math_utils import euclidean
 
 
-def click_8_12(points: HandLandmarkPoints, dist_threshold: float = 0.05) -> bool:
+def click_8_12(points: HandLandmarkPoints, dist_threshold: float = CLICK_8_12_DIST_THRESHOLD) -> bool:
     """Detect if a click gesture (index and middle fingers close together) is performed.
     
     Args:
@@ -14,18 +22,11 @@ def click_8_12(points: HandLandmarkPoints, dist_threshold: float = 0.05) -> bool
         bool: True if the click gesture is detected, False otherwise.
     """
 
-    dist: float = euclidean(
-        pt1=(points.index_tip.x, points.index_tip.y),
-        pt2=(points.middle_tip.x, points.middle_tip.y)
-    )
-    
-    return (
-        two_fingers_8_12(points) and
-        dist < dist_threshold
-    )
+    rule: Rule = CLICK_8_12 if dist_threshold == CLICK_8_12_DIST_THRESHOLD else click_8_12_rule(dist_threshold)
+    return evaluate_rule(rule, points)
 
 
-def click_4_6(points: HandLandmarkPoints, dist_threshold: float = 0.04) -> bool:
+def click_4_6(points: HandLandmarkPoints, dist_threshold: float = CLICK_4_6_DIST_THRESHOLD) -> bool:
     """Detect if a click gesture (thumb and index fingers close together) is performed.
     
     Args:
@@ -36,15 +37,8 @@ def click_4_6(points: HandLandmarkPoints, dist_threshold: float = 0.04) -> bool:
         bool: True if the click gesture is detected, False otherwise.
     """
 
-    dist: float = euclidean(
-        pt1=(points.thumb_tip.x, points.thumb_tip.y),
-        pt2=(points.index_pip.x, points.index_pip.y)
-    )
-
-    return (
-        two_fingers_4_8(points) and
-        dist < dist_threshold
-    )
+    rule: Rule = CLICK_4_6 if dist_threshold == CLICK_4_6_DIST_THRESHOLD else click_4_6_rule(dist_threshold)
+    return evaluate_rule(rule, points)
 
 
 def click_6_8(points: HandLandmarkPoints) -> bool:
@@ -57,11 +51,4 @@ def click_6_8(points: HandLandmarkPoints) -> bool:
         bool: True if the click gesture is detected, False otherwise.
     """
 
-    return (
-        points.thumb_tip.x > points.index_pip.x and
-        points.thumb_tip.y > points.middle_pip.y and
-        points.middle_mcp.y < points.middle_tip.y and
-        points.ring_mcp.y < points.ring_tip.y and
-        points.pinky_mcp.y < points.pinky_tip.y and
-        (points.index_dip.y <= points.index_tip.y < points.index_mcp.y)
-    )
+    return evaluate_rule(CLICK_6_8, points)
@@ -0,0 +1,252 @@
+import ast
+from collections.abc import Mapping
+import json
+from pathlib import Path
+from typing import Any
+
+from touchless.gestures.engine import AXES, Condition, Coord, Dist, GestureEngine, Operand, Rule, all_of, any_of
+from touchless.utils.landmarks import LANDMARK_NAMES
+
+
+COMPARISON_OPS: dict[type, str] = {ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">="}
+
+
+class RuleSyntaxError(ValueError):
+    """An error raised for invalid gesture rule expressions and specifications."""
+
+
+def parse_rule(expression: str, rules: Mapping[str, Rule] | None = None) -> Rule:
+    """Parse a gesture rule expression.
+
+    Expressions compare landmark coordinates (`index_tip.y`), distances in the (x, y) plane
+    (`dist(thumb_tip, index_tip)`) and numbers with `<`, `<=`, `>` and `>=` (chained comparisons are
+    supported), and combine comparisons with `and`, `or`, `not` (or `&`, `|`, `~` with parenthesized
+    comparisons), e.g. "index_tip.y < index_pip.y and dist(thumb_tip, index_tip) < 0.03".
+    Other rules can be referenced by name, e.g. "two_fingers_index_middle and dist(index_tip, middle_tip) < 0.05".
+
+    Args:
+        expression (str): The rule expression.
+        rules (Mapping[str, Rule] | None): Rules which can be referenced by name.
+
+    Returns:
+        Rule: The rule.
+
+    Raises:
+        RuleSyntaxError: If the expression is invalid.
+    """
+    try:
+        tree: ast.Expression = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise RuleSyntaxError(f"Invalid rule expression {expression!r}: {e.msg}") from None
+
+    return _RuleBuilder(expression, rules or {}).rule(tree.body)
+
+
+def load_rules(source: Mapping[str, Any] | str | Path, rules: Mapping[str, Rule] | None = None) -> dict[str, Rule]:
+    """Load gesture rules from a specification.
+
+    The specification maps gesture names to rules, optionally under a "gestures" key. A rule is an expression
+    (see `parse_rule`), a list of rules which must all hold, or a mapping with a single "all", "any" or "not" key.
+    Gestures may reference each other (in any order) and the given rules by name.
+
+    Args:
+        source (Mapping[str, Any] | str | Path): The specification, or path to a JSON or YAML (requires PyYAML) file.
+        rules (Mapping[str, Rule] | None): Rules which can be referenced by name, e.g. `GestureProvider.GESTURE_RULES`.
+
+    Returns:
+        dict[str, Rule]: The loaded rules by gesture name, in the specification order.
+
+    Raises:
+        RuleSyntaxError: If the specification is invalid or gesture references are cyclic.
+    """
+    spec: Any = _read_spec(Path(source)) if isinstance(source, str | Path) else source
+
+    if isinstance(spec, Mapping) and "gestures" in spec:
+        spec = spec["gestures"]
+
+    if not isinstance(spec, Mapping):
+        raise RuleSyntaxError("Gesture rules specification must map gesture names to rules")
+
+    return _SpecLoader(spec, rules or {}).load()
+
+
+def load_engine(source: Mapping[str, Any] | str | Path, rules: Mapping[str, Rule] | None = None) -> GestureEngine:
+    """Load gesture rules from a specification and compile them (see `load_rules`).
+
+    Args:
+        source (Mapping[str, Any] | str | Path): The specification, or path to a JSON or YAML file.
+        rules (Mapping[str, Rule] | None): Rules which can be referenced by name.
+
+    Returns:
+        GestureEngine: The engine evaluating the loaded gestures.
+    """
+    return GestureEngine(load_rules(source, rules))
+
+
+def _read_spec(path: Path) -> Any:
+    """Read a JSON or YAML rules specification file.
+
+    Args:
+        path (Path): Path to the file.
+
+    Returns:
+        Any: The specification.
+
+    Raises:
+        ImportError: If the file is YAML and PyYAML is not installed.
+    """
+    text: str = path.read_text()
+
+    if path.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("Loading YAML gesture rules requires PyYAML: pip install touchless[yaml]") from None
+        return yaml.safe_load(text)
+
+    return json.loads(text)
+
+
+class _RuleBuilder:
+    """A builder of rules from parsed expression nodes."""
+
+    def __init__(self, expression: str, rules: Mapping[str, Rule]) -> None:
+        self._expression: str = expression
+        self._rules: Mapping[str, Rule] = rules
+
+    def rule(self, node: ast.expr) -> Rule:
+        if isinstance(node, ast.BoolOp):
+            combine = all_of if isinstance(node.op, ast.And) else any_of
+            return combine(*map(self.rule, node.values))
+
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd | ast.BitOr):
+            combine = all_of if isinstance(node.op, ast.BitAnd) else any_of
+            return combine(self.rule(node.left), self.rule(node.right))
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not | ast.Invert):
+            return ~self.rule(node.operand)
+
+        if isinstance(node, ast.Compare):
+            operands: list[Operand | float] = [self.operand(node.left), *map(self.operand, node.comparators)]
+            conditions: list[Rule] = []
+
+            for lhs, op, rhs in zip(operands, node.ops, operands[1:]):
+                if type(op) not in COMPARISON_OPS:
+                    raise self.error(node, "only <, <=, > and >= comparisons are supported")
+                try:
+                    conditions.append(Condition(lhs, COMPARISON_OPS[type(op)], rhs))
+                except ValueError as e:
+                    raise self.error(node, str(e)) from None
+
+            return conditions[0] if len(conditions) == 1 else all_of(*conditions)
+
+        if isinstance(node, ast.Name):
+            if node.id not in self._rules:
+                raise self.error(node, f"unknown rule {node.id!r}")
+            return self._rules[node.id]
+
+        raise self.error(node, "expected a comparison, a rule name or a combination of them")
+
+    def operand(self, node: ast.expr) -> Operand | float:
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            if node.value.id not in LANDMARK_NAMES:
+                raise self.error(node, f"unknown landmark {node.value.id!r}")
+            if node.attr not in AXES:
+                raise self.error(node, f"unknown axis {node.attr!r}")
+            return Coord(node.value.id, node.attr)
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "dist":
+            names: list[ast.Name] = [arg for arg in node.args if isinstance(arg, ast.Name)]
+            if len(node.args) != 2 or node.keywords or len(names) != 2:
+                raise self.error(node, "dist() takes two landmark names")
+            for name in names:
+                if name.id not in LANDMARK_NAMES:
+                    raise self.error(name, f"unknown landmark {name.id!r}")
+            return Dist(names[0].id, names[1].id)
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub | ast.UAdd):
+            value: Operand | float = self.operand(node.operand)
+            if isinstance(value, float):
+                return -value if isinstance(node.op, ast.USub) else value
+
+        if isinstance(node, ast.Constant) and isinstance(node.value, int | float) and not isinstance(node.value, bool):
+            return float(node.value)
+
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd | ast.BitOr):
+            raise self.error(node, "parenthesize comparisons combined with '&' and '|', or use 'and' and 'or'")
+
+        raise self.error(node, "expected a landmark coordinate, dist(landmark, landmark) or a number")
+
+    def error(self, node: ast.AST, message: str) -> RuleSyntaxError:
+        return RuleSyntaxError(f"Invalid rule expression {self._expression!r} at column {node.col_offset + 1}: {message}")
+
+
+class _SpecLoader:
+    """A loader of rules specifications, resolving references between gestures."""
+
+    def __init__(self, spec: Mapping[str, Any], rules: Mapping[str, Rule]) -> None:
+        self._spec: Mapping[str, Any] = spec
+        self._external_rules: Mapping[str, Rule] = rules
+        self._rules: dict[str, Rule] = {}
+        self._loading: list[str] = []
+
+    def load(self) -> dict[str, Rule]:
+        for name in self._spec:
+            self._load_gesture(name)
+        return {name: self._rules[name] for name in self._spec}
+
+    def _load_gesture(self, name: str) -> Rule:
+        if name in self._rules:
+            return self._rules[name]
+
+        if name in self._loading:
+            raise RuleSyntaxError(f"Cyclic gesture references: {' -> '.join([*self._loading, name])}")
+
+        self._loading.append(name)
+        self._rules[name] = self._load_rule(self._spec[name], name)
+        self._loading.pop()
+
+        return self._rules[name]
+
+    def _load_rule(self, spec: Any, name: str) -> Rule:
+        if isinstance(spec, str):
+            return parse_rule(spec, _References(self))
+
+        if isinstance(spec, list) and spec:
+            return all_of(*(self._load_rule(item, name) for item in spec))
+
+        if isinstance(spec, Mapping) and len(spec) == 1:
+            key, value = next(iter(spec.items()))
+
+            if key in ("all", "any") and isinstance(value, list) and value:
+                rules: list[Rule] = [self._load_rule(item, name) for item in value]
+                return all_of(*rules) if key == "all" else any_of(*rules)
+
+            if key == "not":
+                return ~self._load_rule(value, name)
+
+        raise RuleSyntaxError(
+            f"Invalid rule of gesture {name!r}: expected an expression, a non-empty list "
+            f"or a mapping with a single 'all', 'any' or 'not' key, got {spec!r}"
+        )
+
+
+class _References(Mapping):
+    """A mapping resolving rule names to specification gestures (loaded on demand) or external rules."""
+
+    def __init__(self, loader: _SpecLoader) -> None:
+        self._loader: _SpecLoader = loader
+
+    def __getitem__(self, name: str) -> Rule:
+        if name in self._loader._spec:
+            return self._loader._load_gesture(name)
+        return self._loader._external_rules[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._loader._spec or name in self._loader._external_rules
+
+    def __iter__(self):
+        return iter({**self._loader._external_rules, **self._loader._spec})
+
+    def __len__(self) -> int:
+        return len(set(self._loader._external_rules) | set(self._loader._spec))
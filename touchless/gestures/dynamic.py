@@ -0,0 +1,482 @@
+from collections import deque
+import math
+
+from mediapipe.python.solutions.hands import HandLandmark
+import numpy as np
+
+from touchless.utils.landmarks import LANDMARKS_SHAPE
+
+
+class LandmarkWindow:
+    """A fixed-size ring buffer of hand landmark arrays and their timestamps.
+
+    Samples are numbered by a running index, the window holds the last `size` of them.
+    """
+
+    def __init__(self, size: int = 30) -> None:
+        """Initializes the LandmarkWindow.
+
+        Args:
+            size (int): Maximum number of samples in the window. Default is 30.
+
+        Raises:
+            ValueError: If the size is less than 3.
+        """
+        if size < 3:
+            raise ValueError(f"Window size must be at least 3, got {size}")
+
+        self._size: int = size
+        self._landmarks: np.ndarray = np.zeros((size, *LANDMARKS_SHAPE), dtype=np.float32)
+        self._timestamps_ns: np.ndarray = np.zeros(size, dtype=np.int64)
+        self._count: int = 0
+        self._next_index: int = 0
+
+    def append(self, landmarks: np.ndarray, timestamp_ns: int) -> int:
+        """Appends a sample, replacing the oldest one if the window is full.
+
+        Args:
+            landmarks (np.ndarray): Landmarks array of shape (21, 3).
+            timestamp_ns (int): Time of the sample in nanoseconds.
+
+        Returns:
+            int: Index of the sample.
+        """
+        index: int = self._next_index
+        self._landmarks[index % self._size] = landmarks
+        self._timestamps_ns[index % self._size] = timestamp_ns
+        self._count = min(self._count + 1, self._size)
+        self._next_index += 1
+
+        return index
+
+    def clear(self) -> None:
+        """Removes all samples (the sample indexes keep running)."""
+        self._count = 0
+
+    def landmarks(self, index: int) -> np.ndarray:
+        """Gets landmarks of a sample in the window.
+
+        Args:
+            index (int): Index of the sample.
+
+        Returns:
+            np.ndarray: A (21, 3) view of the sample landmarks.
+        """
+        return self._landmarks[index % self._size]
+
+    def timestamp_ns(self, index: int) -> int:
+        """Gets the timestamp of a sample in the window.
+
+        Args:
+            index (int): Index of the sample.
+
+        Returns:
+            int: Time of the sample in nanoseconds.
+        """
+        return int(self._timestamps_ns[index % self._size])
+
+    def to_array(self) -> np.ndarray:
+        """Gets the landmarks of the window samples, oldest first.
+
+        Returns:
+            np.ndarray: A copy of the landmarks, shape (n, 21, 3).
+        """
+        indexes: np.ndarray = np.arange(self.oldest_index, self._next_index) % self._size
+        return self._landmarks[indexes]
+
+    @property
+    def size(self) -> int:
+        """Gets the maximum number of samples.
+
+        Returns:
+            int: The window size.
+        """
+        return self._size
+
+    @property
+    def oldest_index(self) -> int:
+        """Gets the index of the oldest sample in the window.
+
+        Returns:
+            int: The index (equals `newest_index + 1` if the window is empty).
+        """
+        return self._next_index - self._count
+
+    @property
+    def newest_index(self) -> int:
+        """Gets the index of the newest sample in the window.
+
+        Returns:
+            int: The index.
+        """
+        return self._next_index - 1
+
+    @property
+    def duration_ns(self) -> int:
+        """Gets the time between the oldest and the newest samples.
+
+        Returns:
+            int: The duration in nanoseconds.
+        """
+        if self._count < 2:
+            return 0
+        return self.timestamp_ns(self.newest_index) - self.timestamp_ns(self.oldest_index)
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class TrajectoryStats:
+    """A class maintaining statistics of a landmark trajectory over a `LandmarkWindow`.
+
+    Path length and winding (signed turning angle in the image plane) are running sums: each update adds
+    the contribution of the new sample and removes the one of the sample which left the window,
+    so updates cost O(1) regardless of the window size.
+    """
+
+    def __init__(self, window: LandmarkWindow, landmark: int, min_step: float = 0.005) -> None:
+        """Initializes the TrajectoryStats.
+
+        Args:
+            window (LandmarkWindow): The window, must be updated before this statistics.
+            landmark (int): Index of the tracked landmark.
+            min_step (float): Steps shorter than this do not change the winding, so jitter of a still
+                hand does not add up to turns. Default is 0.005.
+        """
+        self._window: LandmarkWindow = window
+        self._landmark: int = landmark
+        self._min_step: float = min_step
+        self._steps: np.ndarray = np.zeros(window.size, dtype=np.float64)
+        self._turns: np.ndarray = np.zeros(window.size, dtype=np.float64)
+        self._oldest_index: int = 0
+        self._path_length: float = 0.0
+        self._winding: float = 0.0
+
+    def update(self) -> None:
+        """Updates the statistics with the newest sample of the window."""
+        window: LandmarkWindow = self._window
+        size: int = window.size
+        newest: int = window.newest_index
+        oldest: int = window.oldest_index
+
+        if len(window) == 1:
+            self._path_length = self._winding = 0.0
+            self._oldest_index = oldest
+            return
+
+        # Contributions which depend on samples that left the window
+        while self._oldest_index < oldest:
+            self._path_length -= self._steps[(self._oldest_index + 1) % size]
+            if self._oldest_index + 2 < newest:
+                self._winding -= self._turns[(self._oldest_index + 2) % size]
+            self._oldest_index += 1
+
+        step: np.ndarray = self._point(newest) - self._point(newest - 1)
+        step_length: float = math.hypot(step[0], step[1])
+        self._steps[newest % size] = step_length
+        self._path_length += step_length
+
+        turn: float = 0.0
+        if newest - 2 >= oldest:
+            previous_step: np.ndarray = self._point(newest - 1) - self._point(newest - 2)
+            if step_length >= self._min_step and math.hypot(previous_step[0], previous_step[1]) >= self._min_step:
+                turn = math.atan2(
+                    previous_step[0] * step[1] - previous_step[1] * step[0],
+                    previous_step[0] * step[0] + previous_step[1] * step[1]
+                )
+
+        self._turns[newest % size] = turn
+        self._winding += turn
+
+    @property
+    def displacement(self) -> np.ndarray:
+        """Gets the displacement from the oldest to the newest sample.
+
+        Returns:
+            np.ndarray: The (x, y, z) displacement.
+        """
+        if len(self._window) < 2:
+            return np.zeros(3)
+        return self._point(self._window.newest_index) - self._point(self._window.oldest_index)
+
+    @property
+    def path_length(self) -> float:
+        """Gets the length of the trajectory in the image plane.
+
+        Returns:
+            float: The path length.
+        """
+        return self._path_length if len(self._window) > 1 else 0.0
+
+    @property
+    def winding(self) -> float:
+        """Gets the signed turning angle of the trajectory in the image plane.
+
+        Returns:
+            float: The angle in radians, positive for clockwise turns on screen (the y axis points down).
+        """
+        return self._winding if len(self._window) > 2 else 0.0
+
+    @property
+    def speed(self) -> float:
+        """Gets the average speed of the displacement in the image plane.
+
+        Returns:
+            float: The speed per second.
+        """
+        duration_ns: int = self._window.duration_ns
+        if duration_ns <= 0:
+            return 0.0
+        return math.hypot(*self.displacement[:2]) / (duration_ns / 1e9)
+
+    def _point(self, index: int) -> np.ndarray:
+        return self._window.landmarks(index)[self._landmark].astype(np.float64)
+
+
+class ExcursionStats:
+    """A class maintaining the sliding window maximum of a scalar series, to detect excursions (there and back).
+
+    The maximum is kept with a monotonic deque, so updates cost O(1) amortized.
+    """
+
+    def __init__(self, window: LandmarkWindow) -> None:
+        """Initializes the ExcursionStats.
+
+        Args:
+            window (LandmarkWindow): The window defining the samples in range, must be updated before this statistics.
+        """
+        self._window: LandmarkWindow = window
+        self._values: np.ndarray = np.zeros(window.size, dtype=np.float64)
+        self._maximums: deque[int] = deque()
+
+    def update(self, value: float) -> None:
+        """Updates the statistics with the value of the newest sample of the window.
+
+        Args:
+            value (float): The value.
+        """
+        newest: int = self._window.newest_index
+        oldest: int = self._window.oldest_index
+        self._values[newest % self._window.size] = value
+
+        while self._maximums and (self._maximums[0] < oldest or self._maximums[0] > newest):
+            self._maximums.popleft()
+        while self._maximums and self._values[self._maximums[-1] % self._window.size] <= value:
+            self._maximums.pop()
+        self._maximums.append(newest)
+
+    def excursion(self) -> tuple[float, float, int]:
+        """Gets the rise from the oldest sample to the maximum and the return from the maximum to the newest sample.
+
+        Returns:
+            tuple[float, float, int]: The rise, the return and the time from the oldest sample to the maximum in nanoseconds.
+        """
+        window: LandmarkWindow = self._window
+
+        if len(window) < 3 or not self._maximums:
+            return 0.0, 0.0, 0
+
+        peak_index: int = self._maximums[0]
+        peak: float = self._values[peak_index % window.size]
+
+        return (
+            peak - self._values[window.oldest_index % window.size],
+            peak - self._values[window.newest_index % window.size],
+            window.timestamp_ns(peak_index) - window.timestamp_ns(window.oldest_index)
+        )
+
+
+class DynamicGestureTracker:
+    """A class tracking hand motion over a sliding landmark window for dynamic gesture detection.
+
+    Keeps the ring buffer of landmarks of a hand and incremental statistics used by the dynamic gesture
+    functions: the palm (middle finger MCP) and index tip trajectories, the index tip depth
+    and the index tip height relative to its MCP. Use one tracker per hand.
+    """
+
+    def __init__(self, window_size: int = 30) -> None:
+        """Initializes the DynamicGestureTracker.
+
+        Args:
+            window_size (int): Number of frames in the window. Default is 30 (1 second at 30 FPS).
+        """
+        self.window: LandmarkWindow = LandmarkWindow(window_size)
+        self.palm: TrajectoryStats = TrajectoryStats(self.window, HandLandmark.MIDDLE_FINGER_MCP)
+        self.index_tip: TrajectoryStats = TrajectoryStats(self.window, HandLandmark.INDEX_FINGER_TIP)
+        # MediaPipe z decreases towards the camera, so pushing the finger forward raises -z
+        self.index_depth: ExcursionStats = ExcursionStats(self.window)
+        # The y axis points down, so bending the finger down raises tip.y - mcp.y
+        self.index_bend: ExcursionStats = ExcursionStats(self.window)
+
+    def update(self, landmarks: np.ndarray, timestamp_ns: int) -> None:
+        """Updates the tracker with landmarks of a frame.
+
+        Args:
+            landmarks (np.ndarray): Landmarks array of shape (21, 3).
+            timestamp_ns (int): Time of the frame in nanoseconds.
+        """
+        self.window.append(landmarks, timestamp_ns)
+        self.palm.update()
+        self.index_tip.update()
+
+        index_tip: np.ndarray = landmarks[HandLandmark.INDEX_FINGER_TIP]
+        index_mcp: np.ndarray = landmarks[HandLandmark.INDEX_FINGER_MCP]
+        self.index_depth.update(-float(index_tip[2]))
+        self.index_bend.update(float(index_tip[1] - index_mcp[1]))
+
+    def reset(self) -> None:
+        """Clears the window, e.g. when the hand is lost or a dynamic gesture has been detected."""
+        self.window.clear()
+
+
+def _swipe(tracker: DynamicGestureTracker, axis: int, sign: int, min_distance: float, min_speed: float, min_straightness: float) -> bool:
+    """Detect if the palm moved far, fast and straight enough along an axis direction."""
+    displacement: np.ndarray = tracker.palm.displacement
+    distance: float = math.hypot(displacement[0], displacement[1])
+
+    return (
+        sign * displacement[axis] >= min_distance and
+        abs(displacement[axis]) >= abs(displacement[1 - axis]) and
+        tracker.palm.speed >= min_speed and
+        distance >= min_straightness * tracker.palm.path_length
+    )
+
+
+def swipe_left(tracker: DynamicGestureTracker, min_distance: float = 0.2, min_speed: float = 0.25, min_straightness: float = 0.8) -> bool:
+    """Detect if a swipe to the left is performed.
+
+    Args:
+        tracker (DynamicGestureTracker): The hand motion tracker.
+        min_distance (float, optional): Minimum palm displacement. Defaults to 0.2.
+        min_speed (float, optional): Minimum average palm speed per second. Defaults to 0.25.
+        min_straightness (float, optional): Minimum ratio of the displacement to the path length. Defaults to 0.8.
+
+    Returns:
+        bool: True if the swipe is detected, False otherwise.
+    """
+    return _swipe(tracker, 0, -1, min_distance, min_speed, min_straightness)
+
+
+def swipe_right(tracker: DynamicGestureTracker, min_distance: float = 0.2, min_speed: float = 0.25, min_straightness: float = 0.8) -> bool:
+    """Detect if a swipe to the right is performed.
+
+    Args:
+        tracker (DynamicGestureTracker): The hand motion tracker.
+        min_distance (float, optional): Minimum palm displacement. Defaults to 0.2.
+        min_speed (float, optional): Minimum average palm speed per second. Defaults to 0.25.
+        min_straightness (float, optional): Minimum ratio of the displacement to the path length. Defaults to 0.8.
+
+    Returns:
+        bool: True if the swipe is detected, False otherwise.
+    """
+    return _swipe(tracker, 0, 1, min_distance, min_speed, min_straightness)
+
+
+def swipe_up(tracker: DynamicGestureTracker, min_distance: float = 0.2, min_speed: float = 0.25, min_straightness: float = 0.8) -> bool:
+    """Detect if a swipe up is performed.
+
+    Args:
+        tracker (DynamicGestureTracker): The hand motion tracker.
+        min_distance (float, optional): Minimum palm displacement. Defaults to 0.2.
+        min_speed (float, optional): Minimum average palm speed per second. Defaults to 0.25.
+        min_straightness (float, optional): Minimum ratio of the displacement to the path length. Defaults to 0.8.
+
+    Returns:
+        bool: True if the swipe is detected, False otherwise.
+    """
+    return _swipe(tracker, 1, -1, min_distance, min_speed, min_straightness)
+
+
+def swipe_down(tracker: DynamicGestureTracker, min_distance: float = 0.2, min_speed: float = 0.25, min_straightness: float = 0.8) -> bool:
+    """Detect if a swipe down is performed.
+
+    Args:
+        tracker (DynamicGestureTracker): The hand motion tracker.
+        min_distance (float, optional): Minimum palm displacement. Defaults to 0.2.
+        min_speed (float, optional): Minimum average palm speed per second. Defaults to 0.25.
+        min_straightness (float, optional): Minimum ratio of the displacement to the path length. Defaults to 0.8.
+
+    Returns:
+        bool: True if the swipe is detected, False otherwise.
+    """
+    return _swipe(tracker, 1, 1, min_distance, min_speed, min_straightness)
+
+
+def circle_clockwise(tracker: DynamicGestureTracker, min_turn: float = 1.5 * math.pi, min_path_length: float = 0.3) -> bool:
+    """Detect if the index tip draws a clockwise circle (on screen).
+
+    Args:
+        tracker (DynamicGestureTracker): The hand motion tracker.
+        min_turn (float, optional): Minimum turning angle in radians. Defaults to 1.5 * pi.
+        min_path_length (float, optional): Minimum length of the index tip path. Defaults to 0.3.
+
+    Returns:
+        bool: True if the circle is detected, False otherwise.
+    """
+    return tracker.index_tip.winding >= min_turn and tracker.index_tip.path_length >= min_path_length
+
+
+def circle_counterclockwise(tracker: DynamicGestureTracker, min_turn: float = 1.5 * math.pi, min_path_length: float = 0.3) -> bool:
+    """Detect if the index tip draws a counterclockwise circle (on screen).
+
+    Args:
+        tracker (DynamicGestureTracker): The hand motion tracker.
+        min_turn (float, optional): Minimum turning angle in radians. Defaults to 1.5 * pi.
+        min_path_length (float, optional): Minimum length of the index tip path. Defaults to 0.3.
+
+    Returns:
+        bool: True if the circle is detected, False otherwise.
+    """
+    return -tracker.index_tip.winding >= min_turn and tracker.index_tip.path_length >= min_path_length
+
+
+def air_tap(tracker: DynamicGestureTracker, min_depth: float = 0.04, min_return: float = 0.7, max_drift: float = 0.05) -> bool:
+    """Detect if an air tap (index tip pushed towards the camera and back) is performed.
+
+    Args:
+        tracker (DynamicGestureTracker): The hand motion tracker.
+        min_depth (float, optional): Minimum push depth (MediaPipe z units). Defaults to 0.04.
+        min_return (float, optional): Minimum fraction of the depth the tip must return. Defaults to 0.7.
+        max_drift (float, optional): Maximum palm displacement in the image plane. Defaults to 0.05.
+
+    Returns:
+        bool: True if the air tap is detected, False otherwise.
+    """
+    rise, back, _ = tracker.index_depth.excursion()
+    displacement: np.ndarray = tracker.palm.displacement
+
+    return (
+        rise >= min_depth and
+        back >= min_return * rise and
+        math.hypot(displacement[0], displacement[1]) <= max_drift
+    )
+
+
+def dynamic_click(
+    tracker: DynamicGestureTracker,
+    min_depth: float = 0.04,
+    min_return: float = 0.7,
+    max_press_ms: float = 400.0,
+    max_drift: float = 0.03
+) -> bool:
+    """Detect if a dynamic click (index tip bent down towards its MCP and back up) is performed.
+
+    Args:
+        tracker (DynamicGestureTracker): The hand motion tracker.
+        min_depth (float, optional): Minimum downward movement of the tip relative to the MCP. Defaults to 0.04.
+        min_return (float, optional): Minimum fraction of the movement the tip must return. Defaults to 0.7.
+        max_press_ms (float, optional): Maximum time from the window start to the lowest tip position. Defaults to 400.0.
+        max_drift (float, optional): Maximum horizontal index tip displacement, so other index tip motions
+            (e.g. circles) are not clicks. Defaults to 0.03.
+
+    Returns:
+        bool: True if the dynamic click is detected, False otherwise.
+    """
+    rise, back, rise_ns = tracker.index_bend.excursion()
+
+    return (
+        rise >= min_depth and
+        back >= min_return * rise and
+        rise_ns <= max_press_ms * 1e6 and
+        abs(tracker.index_tip.displacement[0]) <= max_drift
+    )
@@ -0,0 +1,748 @@
+from collections.abc import Iterable, Mapping
+from itertools import product
+
+import math
+
+import numpy as np
+
+from touchless.utils.landmarks import LANDMARK_NAMES, LANDMARKS_SHAPE, HandLandmarkPoints
+
+
+AXES: tuple[str, ...] = ("x", "y", "z")
+
+# Conjunctions whose disjunctive normal form would have more clauses keep their disjunctions as subrules
+MAX_RULE_CLAUSES: int = 64
+
+# Every condition is normalized to one of these operators by swapping its sides
+INVERTED_OPS: dict[str, str] = {"<": ">=", "<=": ">", ">": "<=", ">=": "<"}
+SWAPPED_OPS: dict[str, str] = {">": "<", ">=": "<="}
+
+
+class Operand:
+    """A base class for values compared in gesture rules."""
+
+    __slots__ = ()
+
+    @property
+    def key(self) -> tuple:
+        """Gets the key identifying equal operands across rules.
+
+        Returns:
+            tuple: The operand key.
+        """
+        raise NotImplementedError
+
+    def __lt__(self, other: "Operand | float") -> "Condition":
+        return Condition(self, "<", other)
+
+    def __le__(self, other: "Operand | float") -> "Condition":
+        return Condition(self, "<=", other)
+
+    def __gt__(self, other: "Operand | float") -> "Condition":
+        return Condition(self, ">", other)
+
+    def __ge__(self, other: "Operand | float") -> "Condition":
+        return Condition(self, ">=", other)
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+
+class Coord(Operand):
+    """A single landmark coordinate, e.g. `index_tip.y`."""
+
+    __slots__ = ("landmark", "axis", "landmark_index", "axis_index", "key")
+
+    def __init__(self, landmark: str, axis: str) -> None:
+        """Initializes the Coord operand.
+
+        Args:
+            landmark (str): The landmark name (see `LANDMARK_NAMES`).
+            axis (str): The coordinate axis: "x", "y" or "z".
+
+        Raises:
+            ValueError: If the landmark or the axis is unknown.
+        """
+        if landmark not in LANDMARK_NAMES:
+            raise ValueError(f"Unknown landmark: {landmark}")
+        if axis not in AXES:
+            raise ValueError(f"Unknown axis: {axis}")
+
+        self.landmark: str = landmark
+        self.axis: str = axis
+        # Resolved once, so evaluation only indexes the landmarks
+        self.landmark_index: int = LANDMARK_NAMES.index(landmark)
+        self.axis_index: int = AXES.index(axis)
+        self.key: tuple = ("coord", landmark, axis)
+
+    @property
+    def index(self) -> int:
+        """Gets the index of the coordinate in a flattened (21 * 3) landmarks array.
+
+        Returns:
+            int: The flat coordinate index.
+        """
+        return self.landmark_index * len(AXES) + self.axis_index
+
+    def __repr__(self) -> str:
+        return f"{self.landmark}.{self.axis}"
+
+
+class Dist(Operand):
+    """The Euclidean distance between two landmarks in the (x, y) plane (see `math_utils.euclidean`)."""
+
+    __slots__ = ("landmark1", "landmark2", "landmark_index1", "landmark_index2", "key")
+
+    def __init__(self, landmark1: str, landmark2: str) -> None:
+        """Initializes the Dist operand.
+
+        Args:
+            landmark1 (str): The first landmark name.
+            landmark2 (str): The second landmark name.
+
+        Raises:
+            ValueError: If a landmark is unknown.
+        """
+        for landmark in (landmark1, landmark2):
+            if landmark not in LANDMARK_NAMES:
+                raise ValueError(f"Unknown landmark: {landmark}")
+
+        self.landmark1: str = landmark1
+        self.landmark2: str = landmark2
+        self.landmark_index1: int = LANDMARK_NAMES.index(landmark1)
+        self.landmark_index2: int = LANDMARK_NAMES.index(landmark2)
+        self.key: tuple = ("dist", landmark1, landmark2)
+
+    def __repr__(self) -> str:
+        return f"dist({self.landmark1}, {self.landmark2})"
+
+
+class RuleLandmark:
+    """A landmark handle used to build rules, e.g. `points.index_tip.y`."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        if name not in LANDMARK_NAMES:
+            raise AttributeError(f"Unknown landmark: {name}")
+        self.name: str = name
+
+    @property
+    def x(self) -> Coord:
+        return Coord(self.name, "x")
+
+    @property
+    def y(self) -> Coord:
+        return Coord(self.name, "y")
+
+    @property
+    def z(self) -> Coord:
+        return Coord(self.name, "z")
+
+
+class RulePoints:
+    """A namespace of landmark handles mirroring the `HandLandmarkPoints` attributes."""
+
+    def __getattr__(self, name: str) -> RuleLandmark:
+        return RuleLandmark(name)
+
+
+points: RulePoints = RulePoints()
+
+
+def dist(landmark1: RuleLandmark | str, landmark2: RuleLandmark | str) -> Dist:
+    """Build the (x, y) distance operand between two landmarks.
+
+    Args:
+        landmark1 (RuleLandmark | str): The first landmark (handle or name).
+        landmark2 (RuleLandmark | str): The second landmark (handle or name).
+
+    Returns:
+        Dist: The distance operand.
+    """
+    name1: str = landmark1.name if isinstance(landmark1, RuleLandmark) else landmark1
+    name2: str = landmark2.name if isinstance(landmark2, RuleLandmark) else landmark2
+    return Dist(name1, name2)
+
+
+class Rule:
+    """A base class for boolean gesture rules combined with `&`, `|` and `~`."""
+
+    __slots__ = ()
+
+    @property
+    def key(self) -> tuple:
+        """Gets the key identifying equal rules.
+
+        Returns:
+            tuple: The rule key.
+        """
+        raise NotImplementedError
+
+    def clauses(self) -> list[tuple["Condition | Subrule", ...]]:
+        """Gets the rule in disjunctive normal form.
+
+        Negated compound rules (`Not`) and the disjunctions of conjunctions which would expand to more than
+        `MAX_RULE_CLAUSES` clauses are kept as literals (`Subrule`), so the form does not grow exponentially.
+
+        Returns:
+            list[tuple[Condition | Subrule, ...]]: Clauses (conjunctions of conditions and subrules),
+                the rule holds if any clause holds.
+        """
+        raise NotImplementedError
+
+    def __and__(self, other: "Rule") -> "Rule":
+        return AllOf(self, other)
+
+    def __or__(self, other: "Rule") -> "Rule":
+        return AnyOf(self, other)
+
+    def __invert__(self) -> "Rule":
+        raise NotImplementedError
+
+    def __bool__(self) -> bool:
+        raise TypeError("Gesture rules have no truth value, combine them with '&', '|' and '~'")
+
+
+class Condition(Rule):
+    """A comparison of two operands (or an operand and a constant)."""
+
+    __slots__ = ("lhs", "op", "rhs", "key")
+
+    def __init__(self, lhs: Operand | float, op: str, rhs: Operand | float) -> None:
+        """Initializes the Condition.
+
+        Args:
+            lhs (Operand | float): The left operand.
+            op (str): The comparison operator: "<", "<=", ">" or ">=".
+            rhs (Operand | float): The right operand.
+
+        Raises:
+            ValueError: If the operator is unknown or both operands are constants.
+        """
+        if op not in INVERTED_OPS:
+            raise ValueError(f"Unknown comparison operator: {op}")
+        if not isinstance(lhs, Operand) and not isinstance(rhs, Operand):
+            raise ValueError("At least one side of a condition must be a landmark operand")
+
+        if op in SWAPPED_OPS:
+            lhs, op, rhs = rhs, SWAPPED_OPS[op], lhs
+
+        self.lhs: Operand | float = lhs
+        self.op: str = op
+        self.rhs: Operand | float = rhs
+        # Identifies equal conditions across rules
+        self.key: tuple = (_operand_key(lhs), op, _operand_key(rhs))
+
+    def clauses(self) -> list[tuple["Condition | Subrule", ...]]:
+        return [(self,)]
+
+    def __invert__(self) -> "Condition":
+        return Condition(self.lhs, INVERTED_OPS[self.op], self.rhs)
+
+    def __repr__(self) -> str:
+        return f"{self.lhs!r} {self.op} {self.rhs!r}"
+
+
+class AllOf(Rule):
+    """A conjunction of rules."""
+
+    __slots__ = ("rules",)
+
+    def __init__(self, *rules: Rule) -> None:
+        self.rules: tuple[Rule, ...] = rules
+
+    @property
+    def key(self) -> tuple:
+        return ("all", tuple(rule.key for rule in self.rules))
+
+    def clauses(self) -> list[tuple["Condition | Subrule", ...]]:
+        rule_clauses: list[list[tuple[Condition | Subrule, ...]]] = [rule.clauses() for rule in self.rules]
+
+        if math.prod(map(len, rule_clauses)) > MAX_RULE_CLAUSES:
+            rule_clauses = [
+                clauses if len(clauses) == 1 else [(Subrule(rule),)] for rule, clauses in zip(self.rules, rule_clauses)
+            ]
+
+        return [
+            tuple(literal for clause in clauses for literal in clause)
+            for clauses in product(*rule_clauses)
+        ]
+
+    def __invert__(self) -> Rule:
+        return Not(self)
+
+    def __repr__(self) -> str:
+        return "(" + " & ".join(map(repr, self.rules)) + ")"
+
+
+class AnyOf(Rule):
+    """A disjunction of rules."""
+
+    __slots__ = ("rules",)
+
+    def __init__(self, *rules: Rule) -> None:
+        self.rules: tuple[Rule, ...] = rules
+
+    @property
+    def key(self) -> tuple:
+        return ("any", tuple(rule.key for rule in self.rules))
+
+    def clauses(self) -> list[tuple["Condition | Subrule", ...]]:
+        return [clause for rule in self.rules for clause in rule.clauses()]
+
+    def __invert__(self) -> Rule:
+        return Not(self)
+
+    def __repr__(self) -> str:
+        return "(" + " | ".join(map(repr, self.rules)) + ")"
+
+
+class Subrule(Rule):
+    """A compound rule used as a single literal of the clauses of other rules.
+
+    `GestureEngine` evaluates the rule as an intermediate result before the clauses which use it,
+    instead of expanding it into their disjunctive normal form.
+    """
+
+    __slots__ = ("rule",)
+
+    def __init__(self, rule: Rule) -> None:
+        self.rule: Rule = rule
+
+    @property
+    def key(self) -> tuple:
+        return ("rule", self.rule.key)
+
+    def clauses(self) -> list[tuple["Condition | Subrule", ...]]:
+        return [(self,)]
+
+    def __invert__(self) -> Rule:
+        return Not(self.rule)
+
+    def __repr__(self) -> str:
+        return repr(self.rule)
+
+
+class Not(Subrule):
+    """A negation of a compound rule.
+
+    Negations are not pushed down to the conditions (which would expand the disjunctive normal form
+    exponentially), `GestureEngine` evaluates the negated rule as an intermediate result instead.
+    Single conditions are negated by inverting the comparison (see `Condition.__invert__`).
+    """
+
+    __slots__ = ()
+
+    @property
+    def key(self) -> tuple:
+        return ("not", self.rule.key)
+
+    def __invert__(self) -> Rule:
+        return self.rule
+
+    def __repr__(self) -> str:
+        return f"~{self.rule!r}"
+
+
+def all_of(*rules: Rule) -> Rule:
+    """Combine rules with logical AND.
+
+    Args:
+        *rules (Rule): The rules to combine.
+
+    Returns:
+        Rule: The conjunction of the rules.
+    """
+    return AllOf(*rules)
+
+
+def any_of(*rules: Rule) -> Rule:
+    """Combine rules with logical OR.
+
+    Args:
+        *rules (Rule): The rules to combine.
+
+    Returns:
+        Rule: The disjunction of the rules.
+    """
+    return AnyOf(*rules)
+
+
+def _operand_key(operand: Operand | float) -> tuple:
+    """Get the key of an operand or a constant.
+
+    Args:
+        operand (Operand | float): The operand.
+
+    Returns:
+        tuple: The operand key.
+    """
+    if isinstance(operand, Operand):
+        return operand.key
+    return ("const", float(operand))
+
+
+def evaluate_rule(rule: Rule, points: HandLandmarkPoints | np.ndarray) -> bool:
+    """Evaluate a gesture rule for a single hand.
+
+    Args:
+        rule (Rule): The gesture rule.
+        points (HandLandmarkPoints | np.ndarray): The hand landmark points or a (21, 3) landmarks array.
+
+    Returns:
+        bool: True if the rule holds, False otherwise.
+    """
+    return GestureContext({}, points).evaluate(rule)
+
+
+class GestureContext:
+    """A lazy per-frame gesture evaluation context for a single hand.
+
+    Gestures are evaluated on access only, walking their rules with short-circuiting. Coordinates are read
+    from the landmarks converted to Python floats once per frame, distances and results of rules shared by
+    several gestures (e.g. `TWO_FINGERS_8_12` in `CLICK_8_12`) are memoized, so asking for one gesture costs
+    only its own dependencies and shared subexpressions are computed once per frame.
+    """
+
+    __slots__ = ("_rules", "_rows", "_dists", "_results")
+
+    def __init__(self, rules: Mapping[str, Rule], points: HandLandmarkPoints | np.ndarray) -> None:
+        """Initializes the GestureContext.
+
+        Args:
+            rules (Mapping[str, Rule]): Gesture rules by gesture name.
+            points (HandLandmarkPoints | np.ndarray): The hand landmark points or a (21, 3) landmarks array.
+        """
+        self._rules: Mapping[str, Rule] = rules
+        self._rows: list[list[float]] = (
+            points.rows if isinstance(points, HandLandmarkPoints) else np.asarray(points, dtype=np.float32).tolist()
+        )
+        self._dists: dict[tuple, float] = {}
+        self._results: dict[int, bool] = {}
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Gets the names of the gestures which can be evaluated.
+
+        Returns:
+            tuple[str, ...]: The gesture names.
+        """
+        return tuple(self._rules)
+
+    def detect(self, names: Iterable[str] | None = None) -> dict[str, bool]:
+        """Evaluate gestures.
+
+        Args:
+            names (Iterable[str] | None): Names of the gestures to evaluate, or None for all.
+
+        Returns:
+            dict[str, bool]: Detection flags by gesture name.
+        """
+        return {name: self[name] for name in (self._rules if names is None else names)}
+
+    def evaluate(self, rule: Rule) -> bool:
+        """Evaluate a rule, reusing results computed in this context.
+
+        Args:
+            rule (Rule): The rule.
+
+        Returns:
+            bool: True if the rule holds, False otherwise.
+        """
+        if isinstance(rule, Condition):
+            # Comparisons are cheaper to repeat than to memoize
+            lhs: Operand | float = rule.lhs
+            rhs: Operand | float = rule.rhs
+            lhs_value: float = self._rows[lhs.landmark_index][lhs.axis_index] if type(lhs) is Coord else self.value(lhs)
+            rhs_value: float = self._rows[rhs.landmark_index][rhs.axis_index] if type(rhs) is Coord else self.value(rhs)
+            return lhs_value < rhs_value if rule.op == "<" else lhs_value <= rhs_value
+
+        rule_id: int = id(rule)
+        result: bool | None = self._results.get(rule_id)
+        if result is None:
+            if isinstance(rule, AllOf):
+                result = True
+                for subrule in rule.rules:
+                    if not self.evaluate(subrule):
+                        result = False
+                        break
+            elif isinstance(rule, AnyOf):
+                result = False
+                for subrule in rule.rules:
+                    if self.evaluate(subrule):
+                        result = True
+                        break
+            elif isinstance(rule, Not):
+                result = not self.evaluate(rule.rule)
+            elif isinstance(rule, Subrule):
+                result = self.evaluate(rule.rule)
+            else:
+                raise TypeError(f"Unsupported rule: {rule!r}")
+            self._results[rule_id] = result
+        return result
+
+    def value(self, operand: Operand | float) -> float:
+        """Get the value of an operand, reusing distances computed in this context.
+
+        Args:
+            operand (Operand | float): The operand or a constant.
+
+        Returns:
+            float: The value.
+        """
+        if isinstance(operand, Coord):
+            return self._rows[operand.landmark_index][operand.axis_index]
+
+        if isinstance(operand, Dist):
+            value: float | None = self._dists.get(operand.key)
+            if value is None:
+                x1, y1, _ = self._rows[operand.landmark_index1]
+                x2, y2, _ = self._rows[operand.landmark_index2]
+                value = self._dists[operand.key] = math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
+            return value
+
+        if isinstance(operand, Operand):
+            raise TypeError(f"Unsupported operand: {operand!r}")
+
+        return operand
+
+    def __getitem__(self, name: str) -> bool:
+        return self.evaluate(self._rules[name])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._rules
+
+
+class GestureEngine:
+    """A gesture rules compiler and vectorized evaluator.
+
+    Rules are compiled once into the set of unique coordinates, distances and conditions they use.
+    Evaluation computes every unique condition for all landmarks in a few NumPy operations and
+    combines them into gestures with two matrix products (conditions -> clauses -> gestures).
+    Subrules (negated compound rules and large disjunctions, see `Rule.clauses`) are evaluated in stages
+    before the gestures, as intermediate columns which the clauses use like conditions.
+    """
+
+    def __init__(self, rules: Mapping[str, Rule]) -> None:
+        """Initializes and compiles the GestureEngine.
+
+        Args:
+            rules (Mapping[str, Rule]): Gesture rules by gesture name.
+        """
+        self._rules: dict[str, Rule] = dict(rules)
+        self._names: tuple[str, ...] = tuple(self._rules)
+        self._compile()
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Gets the gesture names in the order of the evaluation result columns.
+
+        Returns:
+            tuple[str, ...]: The gesture names.
+        """
+        return self._names
+
+    @property
+    def rules(self) -> dict[str, Rule]:
+        """Gets the compiled gesture rules.
+
+        Returns:
+            dict[str, Rule]: Gesture rules by gesture name.
+        """
+        return dict(self._rules)
+
+    def subset(self, names: Iterable[str]) -> "GestureEngine":
+        """Create an engine for a subset of the gestures.
+
+        Args:
+            names (Iterable[str]): Gesture names to keep, unknown names are ignored.
+
+        Returns:
+            GestureEngine: The engine evaluating only the given gestures (in this engine order).
+        """
+        names = set(names)
+        return GestureEngine({name: rule for name, rule in self._rules.items() if name in names})
+
+    def evaluate(self, landmarks: np.ndarray) -> np.ndarray:
+        """Evaluate all gestures.
+
+        Args:
+            landmarks (np.ndarray): Landmarks array of shape (..., 21, 3), e.g. (21, 3) for a single hand
+                or (N, 21, 3) for a batch. NaN landmarks never satisfy a condition (but a negated compound
+                rule holds when its rule does not).
+
+        Returns:
+            np.ndarray: Boolean array of shape (..., n_gestures), columns ordered as `names`.
+        """
+        landmarks = np.asarray(landmarks)
+
+        if landmarks.shape[-2:] != LANDMARKS_SHAPE:
+            raise ValueError(f"Expected landmarks array of shape (..., {LANDMARKS_SHAPE[0]}, {LANDMARKS_SHAPE[1]}), got {landmarks.shape}")
+
+        batch_shape: tuple[int, ...] = landmarks.shape[:-2]
+        # Float64 keeps results identical to the scalar rules computed on Python floats
+        flat: np.ndarray = landmarks.reshape(*batch_shape, -1)
+        coords: np.ndarray = flat[..., self._coord_index].astype(np.float64)
+
+        xy: np.ndarray = landmarks[..., :2].astype(np.float64)
+        deltas: np.ndarray = xy[..., self._dist_index1, :] - xy[..., self._dist_index2, :]
+        dists: np.ndarray = np.sqrt(np.square(deltas).sum(axis=-1))
+
+        values: np.ndarray = np.concatenate([coords, dists], axis=-1)
+        literals: np.ndarray = np.concatenate([
+            values[..., self._lt_lhs] < values[..., self._lt_rhs],
+            values[..., self._le_lhs] <= values[..., self._le_rhs],
+            values[..., self._lt_const_lhs] < self._lt_const,
+            self._gt_const < values[..., self._gt_const_rhs],
+            values[..., self._le_const_lhs] <= self._le_const,
+            self._ge_const <= values[..., self._ge_const_rhs],
+        ], axis=-1).astype(np.float32)
+        clauses: np.ndarray = np.zeros((*batch_shape, 0), dtype=np.float32)
+
+        # Each stage adds the clauses whose literals are known and the subrules made of known clauses
+        for clause_matrix, clause_sizes, subrule_matrix, negated in self._stages:
+            stage_clauses: np.ndarray = (literals @ clause_matrix) == clause_sizes
+            clauses = np.concatenate([clauses, stage_clauses.astype(np.float32)], axis=-1)
+            subrules: np.ndarray = ((clauses @ subrule_matrix) > 0) != negated
+            literals = np.concatenate([literals, subrules.astype(np.float32)], axis=-1)
+
+        clauses = np.concatenate([clauses, ((literals @ self._clause_matrix) == self._clause_sizes).astype(np.float32)], axis=-1)
+        return (clauses @ self._gesture_matrix) > 0
+
+    def detect(self, points: HandLandmarkPoints) -> dict[str, bool]:
+        """Evaluate all gestures for a single hand.
+
+        Args:
+            points (HandLandmarkPoints): The hand landmark points.
+
+        Returns:
+            dict[str, bool]: Detection flags by gesture name.
+        """
+        return dict(zip(self._names, self.evaluate(points.array).tolist()))
+
+    def context(self, points: HandLandmarkPoints | np.ndarray) -> GestureContext:
+        """Create a lazy evaluation context of the engine gestures for a single hand.
+
+        Prefer the context over `detect` when only a few gestures are needed for a frame.
+
+        Args:
+            points (HandLandmarkPoints | np.ndarray): The hand landmark points or a (21, 3) landmarks array.
+
+        Returns:
+            GestureContext: The context.
+        """
+        return GestureContext(self._rules, points)
+
+    def _compile(self) -> None:
+        """Compile the rules into operand indices, condition groups, subrule stages and clause/gesture matrices."""
+
+        coords: dict[tuple, Coord] = {}
+        dists: dict[tuple, Dist] = {}
+        conditions: dict[tuple, Condition] = {}
+        # Stage of each clause and subrule: clauses of stage k use subrules of stages up to k,
+        # subrules of stage k + 1 are made of clauses of stages up to k
+        clause_stages: dict[frozenset[tuple], int] = {}
+        subrules: dict[tuple, tuple[int, list[frozenset[tuple]], bool]] = {}
+
+        def add_rule(rule: Rule) -> list[frozenset[tuple]]:
+            clause_keys: list[frozenset[tuple]] = []
+
+            for clause in rule.clauses():
+                stage: int = 0
+
+                for literal in clause:
+                    if isinstance(literal, Subrule):
+                        stage = max(stage, add_subrule(literal))
+                        continue
+
+                    conditions.setdefault(literal.key, literal)
+                    for operand in (literal.lhs, literal.rhs):
+                        if isinstance(operand, Coord):
+                            coords.setdefault(operand.key, operand)
+                        elif isinstance(operand, Dist):
+                            dists.setdefault(operand.key, operand)
+
+                clause_key: frozenset[tuple] = frozenset(literal.key for literal in clause)
+                clause_stages.setdefault(clause_key, stage)
+                clause_keys.append(clause_key)
+
+            return clause_keys
+
+        def add_subrule(subrule: Subrule) -> int:
+            if subrule.key not in subrules:
+                clause_keys: list[frozenset[tuple]] = add_rule(subrule.rule)
+                stage: int = 1 + max((clause_stages[key] for key in clause_keys), default=0)
+                subrules[subrule.key] = (stage, clause_keys, isinstance(subrule, Not))
+            return subrules[subrule.key][0]
+
+        gesture_clauses: list[list[frozenset[tuple]]] = [add_rule(rule) for rule in self._rules.values()]
+
+        value_index: dict[tuple, int] = {key: i for i, key in enumerate([*coords, *dists])}
+        self._coord_index: np.ndarray = np.array([coord.index for coord in coords.values()], dtype=np.intp)
+        self._dist_index1: np.ndarray = np.array([d.landmark_index1 for d in dists.values()], dtype=np.intp)
+        self._dist_index2: np.ndarray = np.array([d.landmark_index2 for d in dists.values()], dtype=np.intp)
+
+        groups: dict[str, list[Condition]] = {name: [] for name in ("lt", "le", "lt_const", "gt_const", "le_const", "ge_const")}
+
+        for condition in conditions.values():
+            if not isinstance(condition.rhs, Operand):
+                groups[f"{'lt' if condition.op == '<' else 'le'}_const"].append(condition)
+            elif not isinstance(condition.lhs, Operand):
+                groups[f"{'gt' if condition.op == '<' else 'ge'}_const"].append(condition)
+            else:
+                groups["lt" if condition.op == "<" else "le"].append(condition)
+
+        def operand_indices(group: list[Condition], side: str) -> np.ndarray:
+            return np.array([value_index[getattr(c, side).key] for c in group], dtype=np.intp)
+
+        def constants(group: list[Condition], side: str) -> np.ndarray:
+            return np.array([getattr(c, side) for c in group], dtype=np.float64)
+
+        self._lt_lhs = operand_indices(groups["lt"], "lhs")
+        self._lt_rhs = operand_indices(groups["lt"], "rhs")
+        self._le_lhs = operand_indices(groups["le"], "lhs")
+        self._le_rhs = operand_indices(groups["le"], "rhs")
+        self._lt_const_lhs = operand_indices(groups["lt_const"], "lhs")
+        self._lt_const = constants(groups["lt_const"], "rhs")
+        self._gt_const_rhs = operand_indices(groups["gt_const"], "rhs")
+        self._gt_const = constants(groups["gt_const"], "lhs")
+        self._le_const_lhs = operand_indices(groups["le_const"], "lhs")
+        self._le_const = constants(groups["le_const"], "rhs")
+        self._ge_const_rhs = operand_indices(groups["ge_const"], "rhs")
+        self._ge_const = constants(groups["ge_const"], "lhs")
+
+        # Columns of literals (conditions, then subrules) and clauses in the order they are evaluated
+        literal_keys: list[tuple] = [
+            *(condition.key for group in groups.values() for condition in group),
+            *sorted(subrules, key=lambda key: subrules[key][0])
+        ]
+        literal_index: dict[tuple, int] = {key: i for i, key in enumerate(literal_keys)}
+        clause_keys: list[frozenset[tuple]] = sorted(clause_stages, key=clause_stages.__getitem__)
+        clause_index: dict[frozenset[tuple], int] = {key: i for i, key in enumerate(clause_keys)}
+
+        def clause_matrix(stage: int) -> tuple[np.ndarray, np.ndarray]:
+            stage_clauses: list[frozenset[tuple]] = [key for key in clause_keys if clause_stages[key] == stage]
+            n_literals: int = len(conditions) + sum(subrule_stage <= stage for subrule_stage, _, _ in subrules.values())
+            matrix: np.ndarray = np.zeros((n_literals, len(stage_clauses)), dtype=np.float32)
+            for i, clause_key in enumerate(stage_clauses):
+                matrix[[literal_index[key] for key in clause_key], i] = 1
+            return matrix, matrix.sum(axis=0)
+
+        n_stages: int = max((subrule_stage for subrule_stage, _, _ in subrules.values()), default=0)
+        self._stages: list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = []
+
+        for stage in range(n_stages):
+            stage_subrules: list[tuple] = [key for key in literal_keys[len(conditions):] if subrules[key][0] == stage + 1]
+            n_clauses: int = sum(clause_stage <= stage for clause_stage in clause_stages.values())
+            subrule_matrix: np.ndarray = np.zeros((n_clauses, len(stage_subrules)), dtype=np.float32)
+            for i, subrule_key in enumerate(stage_subrules):
+                subrule_matrix[[clause_index[key] for key in subrules[subrule_key][1]], i] = 1
+            negated: np.ndarray = np.array([subrules[key][2] for key in stage_subrules], dtype=bool)
+            self._stages.append((*clause_matrix(stage), subrule_matrix, negated))
+
+        self._clause_matrix, self._clause_sizes = clause_matrix(n_stages)
+
+        self._gesture_matrix: np.ndarray = np.zeros((len(clause_keys), len(self._names)), dtype=np.float32)
+        for gesture_i, rule_clauses in enumerate(gesture_clauses):
+            self._gesture_matrix[[clause_index[key] for key in rule_clauses], gesture_i] = 1
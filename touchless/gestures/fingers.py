@@ -1,3 +1,12 @@
+from touchless.gestures.engine import evaluate_rule
+from touchless.gestures.rules import (
+    FIVE_FINGERS,
+    THREE_FINGERS_4_8_12,
+    THREE_FINGERS_8_12_16,
+    TWO_FINGERS_4_8,
+    TWO_FINGERS_8_12,
+    TWO_FINGERS_8_20
+)
 from touchless.utils.landmarks import HandLandmarkPoints
 
 
@@ -11,14 +20,7 @@ def two_fingers_4_8(points: HandLandmarkPoints) -> bool:
         bool: True if thumb and index fingers are detected, False otherwise.
     """
 
-    return (
-        points.thumb_tip.x < points.index_pip.x and
-        points.thumb_mcp.y > points.thumb_tip.y and
-        points.index_mcp.y > points.index_tip.y and
-        points.middle_mcp.y < points.middle_tip.y and
-        points.ring_mcp.y < points.ring_tip.y and
-        points.pinky_mcp.y < points.pinky_tip.y
-    )
+    return evaluate_rule(TWO_FINGERS_4_8, points)
 
 
 def two_fingers_8_12(points: HandLandmarkPoints) -> bool:
@@ -31,13 +33,7 @@ def two_fingers_8_12(points: HandLandmarkPoints) -> bool:
         bool: True if index and middle fingers are detected, False otherwise.
     """
 
-    return (
-        points.thumb_tip.x > points.index_pip.x and
-        points.index_tip.y < points.index_pip.y and
-        points.middle_tip.y < points.middle_pip.y and
-        points.ring_tip.y > points.ring_pip.y and
-        points.pinky_tip.y > points.pinky_pip.y
-    )
+    return evaluate_rule(TWO_FINGERS_8_12, points)
 
 
 def two_fingers_8_20(points: HandLandmarkPoints) -> bool:
@@ -50,13 +46,7 @@ def two_fingers_8_20(points: HandLandmarkPoints) -> bool:
         bool: True if index and pinky fingers are detected, False otherwise.
     """
 
-    return(
-        points.thumb_tip.x > points.index_pip.x and
-        points.index_tip.y < points.index_mcp.y and
-        points.middle_tip.y > points.middle_pip.y and
-        points.ring_tip.y > points.ring_pip.y and
-        points.pinky_tip.y < points.pinky_mcp.y
-    )
+    return evaluate_rule(TWO_FINGERS_8_20, points)
 
 
 def three_fingers_4_8_12(points: HandLandmarkPoints) -> bool:
@@ -69,14 +59,7 @@ def three_fingers_4_8_12(points: HandLandmarkPoints) -> bool:
         bool: True if thumb, index and middle fingers are detected, False otherwise.
     """
 
-    return (
-        points.thumb_tip.x < points.index_pip.x and
-        points.thumb_mcp.y > points.thumb_tip.y and
-        points.index_mcp.y > points.index_tip.y and
-        points.middle_mcp.y > points.middle_tip.y and
-        points.ring_mcp.y < points.ring_tip.y and
-        points.pinky_mcp.y < points.pinky_tip.y
-    )
+    return evaluate_rule(THREE_FINGERS_4_8_12, points)
 
 
 def three_fingers_8_12_16(points: HandLandmarkPoints) -> bool:
@@ -89,13 +72,7 @@ def three_fingers_8_12_16(points: HandLandmarkPoints) -> bool:
         bool: True if index, middle and ring fingers are detected, False otherwise.
     """
 
-    return (
-        points.thumb_tip.x > points.index_pip.x and
-        points.index_tip.y < points.index_pip.y and
-        points.middle_tip.y < points.middle_pip.y and
-        points.ring_tip.y < points.ring_pip.y and
-        points.pinky_tip.y > points.pinky_pip.y
-    )
+    return evaluate_rule(THREE_FINGERS_8_12_16, points)
 
 
 def five_fingers(points: HandLandmarkPoints) -> bool:
@@ -108,11 +85,4 @@ def five_fingers(points: HandLandmarkPoints) -> bool:
         bool: True if all fingers are extended, False otherwise.
     """
 
-    return (
-        points.thumb_tip.y < points.thumb_mcp.y and
-        points.index_tip.y < points.index_pip.y and
-        points.middle_tip.y < points.middle_pip.y and
-        points.ring_tip.y < points.ring_pip.y and
-        points.pinky_tip.y < points.pinky_pip.y and
-        (points.thumb_tip.x < points.index_tip.x < points.middle_tip.x < points.ring_tip.x < points.pinky_tip.x)
-    )
+    return evaluate_rule(FIVE_FINGERS, points)
@@ -1,6 +1,12 @@
 import cv2
 import numpy as np
-from touchless.utils.math_utils import euclidean, angle_between_vectors
+from touchless.utils.math_utils import (
+    angle_between_vectors,
+    angle_between_vectors_batch,
+    dist_from_triangle_0_5_17_to_camera_batch,
+    euclidean,
+    heron_area_by_points_batch
+)
 from touchless.utils.landmarks import HandLandmarkPoints
 
 
@@ -75,3 +81,50 @@ def vertical_angle(vertex: tuple[int, int], pointer: tuple[int, int], frame_heig
         angle = -angle
 
     return angle
+
+
+def vertical_angle_batch(
+    vertex: tuple[int, int],
+    pointers: np.ndarray,
+    frame_height: int,
+    accuracy: int | None = None
+) -> np.ndarray:
+    """Calculate the vertical angles between a vertex and pointers (array counterpart of `vertical_angle`).
+
+    Args:
+        vertex (tuple[int, int]): The vertex coordinates (x, y).
+        pointers (np.ndarray): The pointers coordinates of shape (N, 2).
+        frame_height (int): The height of the frame.
+        accuracy (int | None, optional): The number of decimal places for rounding the results,
+            or None not to round. Defaults to None.
+
+    Returns:
+        np.ndarray: The vertical angles of shape (N,), negative in the left half-plane.
+    """
+    pointers = np.asarray(pointers, dtype=np.float64)
+    angle: np.ndarray = angle_between_vectors_batch(np.array((0, frame_height)), pointers - vertex, accuracy=accuracy)
+
+    return np.where(pointers[:, 0] < vertex[0], -angle, angle)
+
+
+def dist_to_camera_batch(
+    landmarks: np.ndarray,
+    img_size: tuple[int, int],
+    accuracy: int | None = None
+) -> np.ndarray:
+    """Calculate distances from hands to camera by the area of the wrist, index and pinky fingers MCP triangle.
+
+    Args:
+        landmarks (np.ndarray): Landmarks arrays of shape (N, 21, 3), e.g. `LandmarkRecording.landmarks`.
+        img_size (tuple[int, int]): The size of the image (width, height).
+        accuracy (int | None, optional): The number of decimal places for rounding the results,
+            or None not to round. Defaults to None.
+
+    Returns:
+        np.ndarray: Distances to camera of shape (N,).
+    """
+    # Triangle vertices in whole pixels, as the landmarks are converted for drawing
+    vertices: np.ndarray = np.trunc(np.asarray(landmarks, dtype=np.float64)[:, [0, 5, 17], :2] * img_size)
+    area: np.ndarray = heron_area_by_points_batch(vertices[:, 0], vertices[:, 1], vertices[:, 2], accuracy=3)
+
+    return dist_from_triangle_0_5_17_to_camera_batch(area, accuracy)
@@ -1,3 +1,5 @@
+from touchless.gestures.engine import evaluate_rule
+from touchless.gestures.rules import FIST_CLOSED, HAND_DOWN, HAND_UP
 from touchless.utils.landmarks import HandLandmarkPoints
 
 
@@ -11,21 +13,7 @@ def fist_closed(points: HandLandmarkPoints) -> bool:
         bool: True if the hand is in a closed fist gesture, False otherwise.
     """
 
-    if hand_up(points):
-        return (
-            points.index_mcp.y < points.index_tip.y and
-            points.middle_mcp.y < points.middle_tip.y and
-            points.ring_mcp.y < points.ring_tip.y and
-            points.pinky_mcp.y < points.pinky_tip.y
-        )
-
-    if hand_down(points):
-        return (
-            points.index_pip.y > points.index_tip.y and
-            points.middle_pip.y > points.middle_tip.y and
-            points.ring_pip.y > points.ring_tip.y and
-            points.pinky_pip.y > points.pinky_tip.y
-        )
+    return evaluate_rule(FIST_CLOSED, points)
 
 
 def hand_down(points: HandLandmarkPoints) -> bool:
@@ -38,7 +26,7 @@ def hand_down(points: HandLandmarkPoints) -> bool:
         bool: True if the hand is facing downwards, False otherwise.
     """
 
-    return points.middle_tip.y > points.wrist.y
+    return evaluate_rule(HAND_DOWN, points)
 
 
 def hand_up(points: HandLandmarkPoints) -> bool:
@@ -51,4 +39,4 @@ def hand_up(points: HandLandmarkPoints) -> bool:
         bool: True if the hand is facing upwards, False otherwise.
     """
 
-    return points.middle_tip.y < points.wrist.y
+    return evaluate_rule(HAND_UP, points)
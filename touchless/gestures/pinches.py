@@ -1,3 +1,5 @@
+from touchless.gestures.engine import evaluate_rule
+from touchless.gestures.rules import PINCH_4_8, PINCH_4_12, PINCH_4_16, PINCH_4_20
 from touchless.utils.landmarks import HandLandmarkPoints
 from touchless.utils.math_utils import euclidean
 
@@ -44,14 +46,7 @@ def pinch_4_8(points: HandLandmarkPoints) -> bool:
         bool: True if the hand is in 4-8 pinch gesture, False otherwise.
     """
 
-    thumb_index_dist, thumb_middle_dist, thumb_ring_dist, thumb_pinky_dist = get_dists_for_all_fingers(points)
-
-    return (
-        thumb_index_dist < 0.03 and
-        thumb_middle_dist > 0.05 and
-        thumb_ring_dist > 0.05 and
-        thumb_pinky_dist > 0.05
-    )
+    return evaluate_rule(PINCH_4_8, points)
 
 
 def pinch_4_12(points: HandLandmarkPoints) -> bool:
@@ -65,14 +60,7 @@ def pinch_4_12(points: HandLandmarkPoints) -> bool:
         bool: True if the hand is in 4-12 pinch gesture, False otherwise.
     """
 
-    thumb_index_dist, thumb_middle_dist, thumb_ring_dist, thumb_pinky_dist = get_dists_for_all_fingers(points)
-
-    return (
-        thumb_middle_dist < 0.03 and
-        thumb_index_dist > 0.05 and
-        thumb_ring_dist > 0.05 and
-        thumb_pinky_dist > 0.05
-    )
+    return evaluate_rule(PINCH_4_12, points)
 
 
 def pinch_4_16(points: HandLandmarkPoints) -> bool:
@@ -86,14 +74,7 @@ def pinch_4_16(points: HandLandmarkPoints) -> bool:
         bool: True if the hand is in 4-16 pinch gesture, False otherwise.
     """
 
-    thumb_index_dist, thumb_middle_dist, thumb_ring_dist, thumb_pinky_dist = get_dists_for_all_fingers(points)
-
-    return (
-        thumb_ring_dist < 0.03 and
-        thumb_index_dist > 0.05 and
-        thumb_middle_dist > 0.05 and
-        thumb_pinky_dist > 0.05
-    )
+    return evaluate_rule(PINCH_4_16, points)
 
 
 def pinch_4_20(points: HandLandmarkPoints) -> bool:
@@ -107,11 +88,4 @@ def pinch_4_20(points: HandLandmarkPoints) -> bool:
         bool: True if the hand is in 4-20 pinch gesture, False otherwise.
     """
 
-    thumb_index_dist, thumb_middle_dist, thumb_ring_dist, thumb_pinky_dist = get_dists_for_all_fingers(points)
-
-    return (
-        thumb_pinky_dist < 0.03 and
-        thumb_index_dist > 0.05 and
-        thumb_middle_dist > 0.05 and
-        thumb_ring_dist > 0.05
-    )
+    return evaluate_rule(PINCH_4_20, points)
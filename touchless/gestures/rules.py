@@ -0,0 +1,153 @@
+from touchless.gestures.engine import Dist, Rule, all_of, dist, points
+
+
+# Definitions of the built-in gestures, evaluated together by `GestureEngine`.
+# The gesture functions (e.g. `touchless.gestures.fingers.two_fingers_4_8`) evaluate these rules for a single hand.
+
+TWO_FINGERS_4_8: Rule = all_of(
+    points.thumb_tip.x < points.index_pip.x,
+    points.thumb_mcp.y > points.thumb_tip.y,
+    points.index_mcp.y > points.index_tip.y,
+    points.middle_mcp.y < points.middle_tip.y,
+    points.ring_mcp.y < points.ring_tip.y,
+    points.pinky_mcp.y < points.pinky_tip.y
+)
+
+TWO_FINGERS_8_12: Rule = all_of(
+    points.thumb_tip.x > points.index_pip.x,
+    points.index_tip.y < points.index_pip.y,
+    points.middle_tip.y < points.middle_pip.y,
+    points.ring_tip.y > points.ring_pip.y,
+    points.pinky_tip.y > points.pinky_pip.y
+)
+
+TWO_FINGERS_8_20: Rule = all_of(
+    points.thumb_tip.x > points.index_pip.x,
+    points.index_tip.y < points.index_mcp.y,
+    points.middle_tip.y > points.middle_pip.y,
+    points.ring_tip.y > points.ring_pip.y,
+    points.pinky_tip.y < points.pinky_mcp.y
+)
+
+THREE_FINGERS_4_8_12: Rule = all_of(
+    points.thumb_tip.x < points.index_pip.x,
+    points.thumb_mcp.y > points.thumb_tip.y,
+    points.index_mcp.y > points.index_tip.y,
+    points.middle_mcp.y > points.middle_tip.y,
+    points.ring_mcp.y < points.ring_tip.y,
+    points.pinky_mcp.y < points.pinky_tip.y
+)
+
+THREE_FINGERS_8_12_16: Rule = all_of(
+    points.thumb_tip.x > points.index_pip.x,
+    points.index_tip.y < points.index_pip.y,
+    points.middle_tip.y < points.middle_pip.y,
+    points.ring_tip.y < points.ring_pip.y,
+    points.pinky_tip.y > points.pinky_pip.y
+)
+
+FIVE_FINGERS: Rule = all_of(
+    points.thumb_tip.y < points.thumb_mcp.y,
+    points.index_tip.y < points.index_pip.y,
+    points.middle_tip.y < points.middle_pip.y,
+    points.ring_tip.y < points.ring_pip.y,
+    points.pinky_tip.y < points.pinky_pip.y,
+    points.thumb_tip.x < points.index_tip.x,
+    points.index_tip.x < points.middle_tip.x,
+    points.middle_tip.x < points.ring_tip.x,
+    points.ring_tip.x < points.pinky_tip.x
+)
+
+CLICK_8_12_DIST_THRESHOLD: float = 0.05
+CLICK_4_6_DIST_THRESHOLD: float = 0.04
+
+
+def click_8_12_rule(dist_threshold: float = CLICK_8_12_DIST_THRESHOLD) -> Rule:
+    """Get the rule of the click gesture of index and middle fingers close together.
+
+    Args:
+        dist_threshold (float): The distance threshold for considering the fingers as clicked. Default is 0.05.
+
+    Returns:
+        Rule: The gesture rule.
+    """
+    return TWO_FINGERS_8_12 & (dist(points.index_tip, points.middle_tip) < dist_threshold)
+
+
+def click_4_6_rule(dist_threshold: float = CLICK_4_6_DIST_THRESHOLD) -> Rule:
+    """Get the rule of the click gesture of thumb and index fingers close together.
+
+    Args:
+        dist_threshold (float): The distance threshold for considering the fingers as clicked. Default is 0.04.
+
+    Returns:
+        Rule: The gesture rule.
+    """
+    return TWO_FINGERS_4_8 & (dist(points.thumb_tip, points.index_pip) < dist_threshold)
+
+
+CLICK_8_12: Rule = click_8_12_rule()
+
+CLICK_4_6: Rule = click_4_6_rule()
+
+CLICK_6_8: Rule = all_of(
+    points.thumb_tip.x > points.index_pip.x,
+    points.thumb_tip.y > points.middle_pip.y,
+    points.middle_mcp.y < points.middle_tip.y,
+    points.ring_mcp.y < points.ring_tip.y,
+    points.pinky_mcp.y < points.pinky_tip.y,
+    points.index_dip.y <= points.index_tip.y,
+    points.index_tip.y < points.index_mcp.y
+)
+
+HAND_DOWN: Rule = points.middle_tip.y > points.wrist.y
+
+HAND_UP: Rule = points.middle_tip.y < points.wrist.y
+
+FIST_CLOSED: Rule = (
+    HAND_UP & all_of(
+        points.index_mcp.y < points.index_tip.y,
+        points.middle_mcp.y < points.middle_tip.y,
+        points.ring_mcp.y < points.ring_tip.y,
+        points.pinky_mcp.y < points.pinky_tip.y
+    ) |
+    HAND_DOWN & all_of(
+        points.index_pip.y > points.index_tip.y,
+        points.middle_pip.y > points.middle_tip.y,
+        points.ring_pip.y > points.ring_tip.y,
+        points.pinky_pip.y > points.pinky_tip.y
+    )
+)
+
+THUMB_INDEX_DIST: Dist = dist(points.thumb_tip, points.index_tip)
+THUMB_MIDDLE_DIST: Dist = dist(points.thumb_tip, points.middle_tip)
+THUMB_RING_DIST: Dist = dist(points.thumb_tip, points.ring_tip)
+THUMB_PINKY_DIST: Dist = dist(points.thumb_tip, points.pinky_tip)
+
+PINCH_4_8: Rule = all_of(
+    THUMB_INDEX_DIST < 0.03,
+    THUMB_MIDDLE_DIST > 0.05,
+    THUMB_RING_DIST > 0.05,
+    THUMB_PINKY_DIST > 0.05
+)
+
+PINCH_4_12: Rule = all_of(
+    THUMB_MIDDLE_DIST < 0.03,
+    THUMB_INDEX_DIST > 0.05,
+    THUMB_RING_DIST > 0.05,
+    THUMB_PINKY_DIST > 0.05
+)
+
+PINCH_4_16: Rule = all_of(
+    THUMB_RING_DIST < 0.03,
+    THUMB_INDEX_DIST > 0.05,
+    THUMB_MIDDLE_DIST > 0.05,
+    THUMB_PINKY_DIST > 0.05
+)
+
+PINCH_4_20: Rule = all_of(
+    THUMB_PINKY_DIST < 0.03,
+    THUMB_INDEX_DIST > 0.05,
+    THUMB_MIDDLE_DIST > 0.05,
+    THUMB_RING_DIST > 0.05
+)
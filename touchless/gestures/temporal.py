@@ -0,0 +1,201 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+import enum
+import time
+
+from touchless.hands import HandGesture
+
+
+class GesturePhase(enum.StrEnum):
+    """An enumeration representing phases of a gesture event."""
+    BEGIN = "begin"
+    HOLD = "hold"
+    END = "end"
+
+
+@dataclass
+class GestureEvent:
+    """A class representing a gesture transition.
+
+    Attributes:
+        name (str): The gesture name.
+        phase (GesturePhase): The gesture phase.
+        timestamp_ns (int): Time of the event in nanoseconds.
+        duration_ns (int): Time since the gesture began in nanoseconds (0 for BEGIN).
+    """
+
+    name: str
+    phase: GesturePhase
+    timestamp_ns: int
+    duration_ns: int = 0
+
+
+@dataclass
+class GestureTiming:
+    """A class representing temporal filtering parameters of a gesture.
+
+    Attributes:
+        smoothing (float): Exponential smoothing factor of the per-frame detections in (0, 1],
+            1 disables smoothing. Default is 0.5.
+        begin_threshold (float): Smoothed score at which the gesture begins. Default is 0.7.
+        end_threshold (float): Smoothed score at which the gesture ends, below `begin_threshold`
+            for hysteresis. Default is 0.3.
+        min_duration_ms (float): Time the score must stay above `begin_threshold` before the gesture begins.
+            Default is 0.0.
+        cooldown_ms (float): Time after the gesture ends during which it cannot begin again. Default is 0.0.
+        hold_interval_ms (float | None): Interval of HOLD events while the gesture is active,
+            or None for no HOLD events. Default is None.
+    """
+
+    smoothing: float = 0.5
+    begin_threshold: float = 0.7
+    end_threshold: float = 0.3
+    min_duration_ms: float = 0.0
+    cooldown_ms: float = 0.0
+    hold_interval_ms: float | None = None
+
+
+class _GestureState:
+    """A class representing the temporal state of a gesture."""
+
+    __slots__ = ("timing", "score", "is_active", "candidate_since_ns", "started_ns", "last_hold_ns", "cooldown_until_ns")
+
+    def __init__(self, timing: GestureTiming) -> None:
+        self.timing: GestureTiming = timing
+        self.score: float = 0.0
+        self.is_active: bool = False
+        self.candidate_since_ns: int | None = None
+        self.started_ns: int = 0
+        self.last_hold_ns: int = 0
+        self.cooldown_until_ns: int = 0
+
+
+class GestureStateMachine:
+    """A class turning per-frame gesture detections into BEGIN, HOLD and END events.
+
+    Detections of each gesture are smoothed exponentially. A gesture begins when the smoothed score
+    stays at or above the begin threshold for the minimum duration (and the cooldown has passed), and ends
+    when the score falls to the end threshold. Single-frame flickers therefore neither begin nor end a gesture.
+    Each update costs O(1) per tracked gesture. Use one state machine per hand.
+    """
+
+    def __init__(
+        self,
+        timing: GestureTiming | None = None,
+        gesture_timings: Mapping[str, GestureTiming] | None = None
+    ) -> None:
+        """Initializes the GestureStateMachine.
+
+        Args:
+            timing (GestureTiming | None): Default timing parameters, or None for `GestureTiming()`.
+            gesture_timings (Mapping[str, GestureTiming] | None): Timing parameters by gesture name,
+                overriding the default ones.
+        """
+        self._timing: GestureTiming = timing or GestureTiming()
+        self._gesture_timings: dict[str, GestureTiming] = dict(gesture_timings or {})
+        self._states: dict[str, _GestureState] = {}
+
+    def update(
+        self,
+        detections: Mapping[str, bool] | Iterable[HandGesture],
+        timestamp_ns: int | None = None
+    ) -> list[GestureEvent]:
+        """Updates the gesture states with detections of a frame.
+
+        Gestures which were seen before and are missing from the detections (e.g. the hand is not detected)
+        count as not detected.
+
+        Args:
+            detections (Mapping[str, bool] | Iterable[HandGesture]): Detection flags by gesture name,
+                or hand gestures (e.g. `Hand.gestures`).
+            timestamp_ns (int | None): Time of the frame in nanoseconds, or None for the current time.
+
+        Returns:
+            list[GestureEvent]: Events of the gesture transitions on this frame.
+        """
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+
+        if not isinstance(detections, Mapping):
+            detections = {gesture.name: bool(gesture.data.is_detected) for gesture in detections}
+
+        for name in detections:
+            if name not in self._states:
+                self._states[name] = _GestureState(self._gesture_timings.get(name, self._timing))
+
+        events: list[GestureEvent] = []
+
+        for name, state in self._states.items():
+            event: GestureEvent | None = self._update_state(name, state, detections.get(name, False), timestamp_ns)
+            if event is not None:
+                events.append(event)
+
+        return events
+
+    def is_active(self, name: str) -> bool:
+        """Checks if a gesture is active (has begun and not ended).
+
+        Args:
+            name (str): The gesture name.
+
+        Returns:
+            bool: True if the gesture is active, False otherwise.
+        """
+        state: _GestureState | None = self._states.get(name)
+        return state is not None and state.is_active
+
+    @property
+    def active_gestures(self) -> list[str]:
+        """Gets the active gestures.
+
+        Returns:
+            list[str]: Names of the active gestures.
+        """
+        return [name for name, state in self._states.items() if state.is_active]
+
+    def reset(self) -> None:
+        """Resets all gesture states (without END events)."""
+        self._states.clear()
+
+    @staticmethod
+    def _update_state(name: str, state: _GestureState, is_detected: bool, timestamp_ns: int) -> GestureEvent | None:
+        """Updates the state of a gesture.
+
+        Args:
+            name (str): The gesture name.
+            state (_GestureState): The gesture state.
+            is_detected (bool): Whether the gesture is detected on the frame.
+            timestamp_ns (int): Time of the frame in nanoseconds.
+
+        Returns:
+            GestureEvent | None: The event of the gesture transition, or None if there is no transition.
+        """
+        timing: GestureTiming = state.timing
+        state.score += timing.smoothing * (float(is_detected) - state.score)
+
+        if state.is_active:
+            if state.score <= timing.end_threshold:
+                state.is_active = False
+                state.cooldown_until_ns = timestamp_ns + int(timing.cooldown_ms * 1e6)
+                return GestureEvent(name, GesturePhase.END, timestamp_ns, timestamp_ns - state.started_ns)
+
+            if timing.hold_interval_ms is not None and timestamp_ns - state.last_hold_ns >= timing.hold_interval_ms * 1e6:
+                state.last_hold_ns = timestamp_ns
+                return GestureEvent(name, GesturePhase.HOLD, timestamp_ns, timestamp_ns - state.started_ns)
+
+            return None
+
+        if state.score < timing.begin_threshold or timestamp_ns < state.cooldown_until_ns:
+            state.candidate_since_ns = None
+            return None
+
+        if state.candidate_since_ns is None:
+            state.candidate_since_ns = timestamp_ns
+
+        if timestamp_ns - state.candidate_since_ns < timing.min_duration_ms * 1e6:
+            return None
+
+        state.is_active = True
+        state.candidate_since_ns = None
+        state.started_ns = state.last_hold_ns = timestamp_ns
+        return GestureEvent(name, GesturePhase.BEGIN, timestamp_ns)
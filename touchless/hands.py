@@ -1,20 +1,35 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import AsyncIterator, Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 import enum
+from functools import partial
+import math
+import threading
 import time
 from typing import Any, NamedTuple
 
 import cv2
 from google.protobuf.internal.containers import RepeatedCompositeFieldContainer
-from mediapipe.python.solutions.hands import HandLandmark, Hands
+from mediapipe.python.solutions.hands import Hands
 import numpy as np
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from touchless.gestures.clicks import *
+from touchless.gestures.dynamic import *
+from touchless.gestures.engine import GestureContext, GestureEngine, Rule, evaluate_rule
 from touchless.gestures.fingers import *
 from touchless.gestures.hand import *
 from touchless.gestures.pinches import *
+from touchless.gestures.rules import *
 
-from touchless.utils.landmarks import Point, HandLandmarkPoints
+from touchless.camera import Camera
+from touchless.motion import LandmarkPredictor
+from touchless.profiling import FrameTracer
+from touchless.scheduler import InferenceDecision, InferenceScheduler
+from touchless.utils.landmarks import HandLandmarkPoints
+
+# Tracking data timestamps are in milliseconds (`int(time.time() * 1000)`), motion models use nanoseconds
+NS_PER_MS: int = 1_000_000
 
 
 class HandType(enum.StrEnum):
@@ -25,10 +40,13 @@ class HandType(enum.StrEnum):
 
 class HandTrackingData(BaseModel):
     """A class representing hand tracking data."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     is_hand_detected: bool = False
     hand_confidence: float | None = None
     keypoints: HandLandmarkPoints | None = None
     timestamp_ns: int | None = None
+    is_predicted: bool = False
 
 
 class GestureTrackingData(BaseModel):
@@ -54,10 +72,158 @@ class Hand(BaseModel):
     gestures: list[HandGesture] = []
 
 
+class GestureTransition(enum.Flag):
+    """An enumeration representing transitions of a gesture state."""
+    STARTED = enum.auto()
+    ENDED = enum.auto()
+
+
+class GestureStateChange(BaseModel):
+    """A class representing a change of a gesture state of a hand."""
+    hand: Hand
+    gesture: str
+    transition: GestureTransition
+    timestamp_ns: int
+
+
+class GestureSubscription(BaseModel):
+    """A class representing a subscription to gesture state changes."""
+    gesture: str
+    callback: Callable[[GestureStateChange], Any]
+    hand_types: frozenset[HandType]
+    transitions: GestureTransition
+
+
+class HandTrackingPredictor:
+    """A class predicting hand tracking data between inference results.
+
+    Each hand is tracked by a `LandmarkPredictor` (constant velocity alpha-beta filter), so landmarks
+    can be queried at any time, e.g. at the display rate while inference runs at the camera rate.
+    The confidence of predicted data decays with the time since the last inference result.
+    Updates and predictions are locked, so the tracking thread can update the predictor while
+    the display thread queries it.
+    """
+
+    def __init__(self, **predictor_params: float) -> None:
+        """Initializes the HandTrackingPredictor.
+
+        Args:
+            **predictor_params (float): Parameters of the `LandmarkPredictor` of each hand.
+        """
+        self._predictors: dict[HandType, LandmarkPredictor] = {
+            hand_type: LandmarkPredictor(**predictor_params) for hand_type in HandType
+        }
+        self._lock: threading.Lock = threading.Lock()
+
+    def update(self, hands_tracking_data: dict[HandType, HandTrackingData]) -> None:
+        """Updates the predictors with inference results.
+
+        Args:
+            hands_tracking_data (dict[HandType, HandTrackingData]): Tracking data for each hand type.
+                Predicted data is ignored, an undetected hand resets its predictor.
+        """
+
+        with self._lock:
+            for hand_type, data in hands_tracking_data.items():
+                if data.is_predicted:
+                    continue
+
+                if data.is_hand_detected and data.keypoints is not None and data.timestamp_ns is not None:
+                    self._predictors[hand_type].update(
+                        data.keypoints.array,
+                        data.timestamp_ns * NS_PER_MS,
+                        1.0 if data.hand_confidence is None else data.hand_confidence
+                    )
+                else:
+                    self._predictors[hand_type].reset()
+
+    def predict(self, timestamp_ns: int | None = None) -> dict[HandType, HandTrackingData]:
+        """Predicts tracking data of each hand.
+
+        Args:
+            timestamp_ns (int | None): Time of the prediction in milliseconds (as `HandTrackingData.timestamp_ns`,
+                `time.time()` clock), or None for the current time.
+
+        Returns:
+            dict[HandType, HandTrackingData]: Dictionary of predicted tracking data for each hand type.
+        """
+
+        prediction_ns: int = time.time_ns() if timestamp_ns is None else timestamp_ns * NS_PER_MS
+        hands_tracking_data: dict[HandType, HandTrackingData] = {}
+
+        for hand_type, predictor in self._predictors.items():
+            with self._lock:
+                prediction: tuple[np.ndarray, float] | None = predictor.predict(prediction_ns)
+
+            if prediction is None:
+                hands_tracking_data[hand_type] = HandTrackingData()
+                continue
+
+            landmarks, confidence = prediction
+            hands_tracking_data[hand_type] = HandTrackingData(
+                is_hand_detected=True,
+                hand_confidence=confidence,
+                keypoints=HandLandmarkPoints(landmarks),
+                timestamp_ns=prediction_ns // NS_PER_MS,
+                is_predicted=True
+            )
+
+        return hands_tracking_data
+
+
 class HandTrackingProvider:
-    """A class for hand tracking."""
-    def __init__(self) -> None:
+    """A class for hand tracking.
+
+    In ROI tracking mode, once hands are found, the next frame is cropped to a padded box around
+    their landmarks before inference and the landmarks are mapped back to full-frame coordinates.
+    The full frame is processed when no hand is found in the crop and every `roi_refresh_interval` frames
+    (to pick up hands entering the frame).
+
+    With an `InferenceScheduler`, inference may run on a downscaled frame and only on some frames;
+    landmarks of the skipped frames are predicted from the previous inference results.
+    With a `HandTrackingPredictor`, inference results update the predictor, which can then be queried
+    between frames (e.g. a pointer drawn at the display rate).
+    """
+    def __init__(
+            self,
+            roi_tracking: bool = False,
+            roi_padding: float = 0.5,
+            roi_refresh_interval: int = 30,
+            scheduler: InferenceScheduler | None = None,
+            predictor: HandTrackingPredictor | None = None,
+            tracer: FrameTracer | None = None
+        ) -> None:
+        """Initializes the HandTrackingProvider.
+
+        Args:
+            roi_tracking (bool): Whether to crop frames to the region of the last detected hands. Default is False.
+            roi_padding (float): Padding added to each side of the hands bounding box, relative to its longest side.
+                Default is 0.5.
+            roi_refresh_interval (int): Process the full frame at least every N frames in ROI tracking mode. Default is 30.
+            scheduler (InferenceScheduler | None): A scheduler adapting the inference resolution and frequency to
+                the load, or None to run full-resolution inference on every frame. Default is None.
+            predictor (HandTrackingPredictor | None): A predictor updated with the inference results, or None.
+                Default is None (a new predictor if a scheduler is given).
+            tracer (FrameTracer | None): A tracer recording the "hand_tracking", "color_conversion", "inference"
+                and "landmark_conversion" stages, or None. Default is None.
+        """
         self._hands_processor = Hands()
+        self._rgb_buffer: np.ndarray = np.empty(0, dtype=np.uint8)
+
+        self._roi_tracking: bool = roi_tracking
+        self._roi_padding: float = roi_padding
+        self._roi_refresh_interval: int = roi_refresh_interval
+        # Crops are processed by a separate graph, so that switching between crops and full frames
+        # does not break the landmarks tracking of each graph
+        self._roi_hands_processor: Hands | None = Hands() if roi_tracking else None
+        self._roi: tuple[float, float, float, float] | None = None
+        self._roi_frames: int = 0
+
+        self._scheduler: InferenceScheduler | None = scheduler
+        self._predictor: HandTrackingPredictor | None = predictor
+        if predictor is None and scheduler is not None:
+            self._predictor = HandTrackingPredictor()
+        self._tracer: FrameTracer | None = tracer
 
     def update(self, frame: np.ndarray) -> dict[HandType, HandTrackingData]:
         """Updates hand tracking data.
@@ -68,9 +234,167 @@ class HandTrackingProvider:
         Returns:
             dict[HandType, HandTrackingData]: Dictionary of tracking data for each hand type.
         """
-        
-        img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        hands_results: NamedTuple = self._hands_processor.process(img)
+
+        if self._tracer is None:
+            return self._update(frame)
+
+        start_ns: int = time.perf_counter_ns()
+        hands_tracking_data: dict[HandType, HandTrackingData] = self._update(frame)
+        self._tracer.record("hand_tracking", start_ns)
+
+        return hands_tracking_data
+
+    def _update(self, frame: np.ndarray) -> dict[HandType, HandTrackingData]:
+        """Updates hand tracking data, running inference as decided by the scheduler.
+
+        Args:
+            frame (np.ndarray): The frame to process.
+
+        Returns:
+            dict[HandType, HandTrackingData]: Dictionary of tracking data for each hand type.
+        """
+
+        scheduler: InferenceScheduler | None = self._scheduler
+        predictor: HandTrackingPredictor | None = self._predictor
+        hands_tracking_data: dict[HandType, HandTrackingData]
+
+        if scheduler is None:
+            hands_tracking_data = self._detect(frame)
+        else:
+            decision: InferenceDecision = scheduler.decide()
+
+            if not decision.run_inference:
+                # Set together with the scheduler
+                assert predictor is not None
+                return predictor.predict()
+
+            start_ns: int = time.perf_counter_ns()
+
+            if decision.scale < 1.0:
+                frame = cv2.resize(frame, None, fx=decision.scale, fy=decision.scale, interpolation=cv2.INTER_AREA)
+
+            hands_tracking_data = self._detect(frame)
+            scheduler.record(decision, (time.perf_counter_ns() - start_ns) / 1e6)
+
+        if predictor is not None:
+            predictor.update(hands_tracking_data)
+
+        return hands_tracking_data
+
+    @property
+    def scheduler(self) -> InferenceScheduler | None:
+        """Gets the inference scheduler.
+
+        Returns:
+            InferenceScheduler | None: The scheduler, or None if inference runs on every frame.
+        """
+        return self._scheduler
+
+    @property
+    def tracer(self) -> FrameTracer | None:
+        """Gets the tracer recording the hand tracking stages.
+
+        Returns:
+            FrameTracer | None: The tracer, or None if tracing is disabled.
+        """
+        return self._tracer
+
+    @tracer.setter
+    def tracer(self, tracer: FrameTracer | None) -> None:
+        """Sets the tracer recording the hand tracking stages.
+
+        Args:
+            tracer (FrameTracer | None): The tracer, or None to disable tracing.
+        """
+        self._tracer = tracer
+
+    @property
+    def predictor(self) -> HandTrackingPredictor | None:
+        """Gets the predictor updated with the inference results.
+
+        Returns:
+            HandTrackingPredictor | None: The predictor, or None if inference results are not predicted from.
+        """
+        return self._predictor
+
+    def _detect(self, frame: np.ndarray) -> dict[HandType, HandTrackingData]:
+        """Detects hands in a frame, in its region of the last detected hands in ROI tracking mode.
+
+        Args:
+            frame (np.ndarray): The frame to process.
+
+        Returns:
+            dict[HandType, HandTrackingData]: Dictionary of tracking data for each hand type.
+        """
+
+        if not self._roi_tracking:
+            return self._track(frame)
+
+        hands_tracking_data: dict[HandType, HandTrackingData] | None = None
+
+        if self._roi is not None and self._roi_frames < self._roi_refresh_interval:
+            hands_tracking_data = self._track(frame, self._roi)
+            self._roi_frames += 1
+
+            if not any(data.is_hand_detected for data in hands_tracking_data.values()):
+                hands_tracking_data = None
+
+        if hands_tracking_data is None:
+            hands_tracking_data = self._track(frame)
+            self._roi_frames = 0
+
+        self._roi = self._get_roi(hands_tracking_data, frame.shape[1], frame.shape[0])
+
+        return hands_tracking_data
+
+    @property
+    def roi(self) -> tuple[float, float, float, float] | None:
+        """Gets the region which the next frame is cropped to in ROI tracking mode.
+
+        Returns:
+            tuple[float, float, float, float] | None: The normalized region (x1, y1, x2, y2), or None for the full frame.
+        """
+        return self._roi
+
+    def _track(
+            self,
+            frame: np.ndarray,
+            roi: tuple[float, float, float, float] | None = None
+        ) -> dict[HandType, HandTrackingData]:
+        """Detects hands in a frame or its region.
+
+        Args:
+            frame (np.ndarray): The frame to process.
+            roi (tuple[float, float, float, float] | None): The normalized region (x1, y1, x2, y2) to process,
+                or None for the full frame.
+
+        Returns:
+            dict[HandType, HandTrackingData]: Dictionary of tracking data for each hand type, in full-frame coordinates.
+        """
+
+        hands_processor: Hands = self._hands_processor
+        frame_size: tuple[int, int] = (frame.shape[1], frame.shape[0])
+        roi_px: tuple[int, int, int, int] | None = None
+
+        if roi is not None:
+            width, height = frame_size
+            roi_px = (int(roi[0] * width), int(roi[1] * height), math.ceil(roi[2] * width), math.ceil(roi[3] * height))
+            x1, y1, x2, y2 = roi_px
+            frame = frame[y1:y2, x1:x2]
+            hands_processor = self._roi_hands_processor
+
+        tracer: FrameTracer | None = self._tracer
+        start_ns: int = time.perf_counter_ns() if tracer is not None else 0
+
+        img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._get_rgb_buffer(frame.shape))
+        if tracer is not None:
+            tracer.record("color_conversion", start_ns)
+            start_ns = time.perf_counter_ns()
+
+        hands_results: NamedTuple = hands_processor.process(img)
+        if tracer is not None:
+            tracer.record("inference", start_ns)
+            start_ns = time.perf_counter_ns()
         
         multi_hand_landmarks = hands_results.multi_hand_landmarks
         multi_handedness = hands_results.multi_handedness
@@ -81,24 +405,21 @@ class HandTrackingProvider:
         }
 
         if multi_hand_landmarks is None:
+            if tracer is not None:
+                tracer.record("landmark_conversion", start_ns)
             return hands_tracking_data
         
         for i, hand_landmarks in enumerate(multi_hand_landmarks):
-            
-            points: dict[str, Point] = {}
-            landmarks: RepeatedCompositeFieldContainer = hand_landmarks.landmark
-
-            for landmark_field_info in HandLandmarkPoints.model_fields.values():
-                landmark_name: str = landmark_field_info.alias
-                landmark = landmarks[getattr(HandLandmark, landmark_name).value]
-                point: Point = Point(x=landmark.x, y=landmark.y, z=landmark.z)
-                points[landmark_name] = point
 
-            keypoints: HandLandmarkPoints = HandLandmarkPoints(**points)
+            landmarks: RepeatedCompositeFieldContainer = hand_landmarks.landmark
+            keypoints: HandLandmarkPoints = HandLandmarkPoints.from_landmarks(landmarks)
             hand_type_name: str = multi_handedness[i].classification[0].label.lower()
             hand_confidence: float = multi_handedness[i].classification[0].score
             timestamp_ns: int = int(time.time() * 1000)
 
+            if roi_px is not None:
+                self._map_from_roi(keypoints.array, roi_px, frame_size)
+
             hands_tracking_data[HandType(hand_type_name)] = HandTrackingData(
                 is_hand_detected=True,
                 hand_confidence=hand_confidence,
@@ -106,35 +427,174 @@ class HandTrackingProvider:
                 timestamp_ns=timestamp_ns
             )
 
+        if tracer is not None:
+            tracer.record("landmark_conversion", start_ns)
+
         return hands_tracking_data
 
+    def _get_rgb_buffer(self, shape: tuple[int, ...]) -> np.ndarray:
+        """Gets a contiguous reused buffer for the RGB image.
+
+        Args:
+            shape (tuple[int, ...]): The image shape.
+
+        Returns:
+            np.ndarray: The buffer of the given shape.
+        """
+
+        size: int = int(np.prod(shape))
+
+        if self._rgb_buffer.size < size:
+            self._rgb_buffer = np.empty(size, dtype=np.uint8)
+
+        return self._rgb_buffer[:size].reshape(shape)
+
+    def _get_roi(
+            self,
+            hands_tracking_data: dict[HandType, HandTrackingData],
+            frame_width: int,
+            frame_height: int
+        ) -> tuple[float, float, float, float] | None:
+        """Gets the padded bounding box of the detected hands.
+
+        Args:
+            hands_tracking_data (dict[HandType, HandTrackingData]): Tracking data in full-frame coordinates.
+            frame_width (int): The frame width.
+            frame_height (int): The frame height.
+
+        Returns:
+            tuple[float, float, float, float] | None: The normalized region (x1, y1, x2, y2),
+                or None if no hand is detected.
+        """
+
+        keypoints: list[np.ndarray] = [
+            data.keypoints.array[:, :2] for data in hands_tracking_data.values() if data.keypoints is not None
+        ]
+
+        if not keypoints:
+            return None
+
+        points: np.ndarray = np.concatenate(keypoints) * (frame_width, frame_height)
+        (x1, y1), (x2, y2) = points.min(axis=0), points.max(axis=0)
+        padding: float = max(x2 - x1, y2 - y1) * self._roi_padding
+
+        return (
+            max(float(x1 - padding) / frame_width, 0.0),
+            max(float(y1 - padding) / frame_height, 0.0),
+            min(float(x2 + padding) / frame_width, 1.0),
+            min(float(y2 + padding) / frame_height, 1.0)
+        )
+
+    @staticmethod
+    def _map_from_roi(landmarks: np.ndarray, roi: tuple[int, int, int, int], frame_size: tuple[int, int]) -> None:
+        """Maps landmarks normalized to a region to full-frame normalized coordinates (in place).
+
+        Args:
+            landmarks (np.ndarray): Landmarks array of shape (21, 3).
+            roi (tuple[int, int, int, int]): The region (x1, y1, x2, y2) in pixels.
+            frame_size (tuple[int, int]): The full frame size (width, height).
+        """
+
+        x1, y1, x2, y2 = roi
+        width, height = frame_size
+
+        landmarks[:, 0] = (landmarks[:, 0] * (x2 - x1) + x1) / width
+        landmarks[:, 1] = (landmarks[:, 1] * (y2 - y1) + y1) / height
+        # Landmarks depth has roughly the same scale as x
+        landmarks[:, 2] *= (x2 - x1) / width
+
 
 class GestureProvider:
-    """A class for detecting gestures."""
+    """A class for detecting gestures.
+
+    Gestures are defined by rules in `GESTURE_RULES` (see `touchless.gestures.rules`) and evaluated together
+    by a `GestureEngine`; gestures defined by a `GESTURES` callable only are evaluated by it.
+
+    Dynamic (motion) gestures in `DYNAMIC_GESTURES` are evaluated over a sliding window of frames
+    of each hand, by `detect_gestures` only and only when they are listed in the required gestures.
+    Once a dynamic gesture is detected, the window of the hand is cleared, so a motion is reported once.
+    """
 
     NAME: str = "rules_defined_gesture_provider"
     GESTURE_CONFIDENCE: float = 0.5
-    GESTURES: dict[str, Callable] = {
-        "click_index_middle": click_8_12,
-        "click_thumb_index": click_4_6,
-        "click_index_tip_down_pip": click_6_8,
-
-        "two_fingers_thumb_index": two_fingers_4_8,
-        "two_fingers_index_middle": two_fingers_8_12,
-        "two_fingers_index_pinky": two_fingers_8_20,
-        "three_fingers_thumb_index_middle": three_fingers_4_8_12,
-        "three_fingers_index_middle_ring": three_fingers_8_12_16,
-        "five_fingers": five_fingers,
-
-        "fist_closed": fist_closed,
-        "hand_down": hand_down,
-        "hand_up": hand_up,
-
-        "pinch_thumb_index": pinch_4_8,
-        "pinch_thumb_middle": pinch_4_12,
-        "pinch_thumb_ring": pinch_4_16,
-        "pinch_thumb_pinky": pinch_4_20
+    GESTURE_RULES: dict[str, Rule] = {
+        "click_index_middle": CLICK_8_12,
+        "click_thumb_index": CLICK_4_6,
+        "click_index_tip_down_pip": CLICK_6_8,
+
+        "two_fingers_thumb_index": TWO_FINGERS_4_8,
+        "two_fingers_index_middle": TWO_FINGERS_8_12,
+        "two_fingers_index_pinky": TWO_FINGERS_8_20,
+        "three_fingers_thumb_index_middle": THREE_FINGERS_4_8_12,
+        "three_fingers_index_middle_ring": THREE_FINGERS_8_12_16,
+        "five_fingers": FIVE_FINGERS,
+
+        "fist_closed": FIST_CLOSED,
+        "hand_down": HAND_DOWN,
+        "hand_up": HAND_UP,
+
+        "pinch_thumb_index": PINCH_4_8,
+        "pinch_thumb_middle": PINCH_4_12,
+        "pinch_thumb_ring": PINCH_4_16,
+        "pinch_thumb_pinky": PINCH_4_20
     }
+    # Single hand callables of the rules (see `touchless.gestures.rules`), gestures may also be defined by a callable only
+    GESTURES: dict[str, Callable] = {name: partial(evaluate_rule, rule) for name, rule in GESTURE_RULES.items()}
+
+    DYNAMIC_GESTURES: dict[str, Callable] = {
+        "swipe_left": swipe_left,
+        "swipe_right": swipe_right,
+        "swipe_up": swipe_up,
+        "swipe_down": swipe_down,
+
+        "circle_clockwise": circle_clockwise,
+        "circle_counterclockwise": circle_counterclockwise,
+
+        "air_tap": air_tap,
+        "dynamic_click": dynamic_click
+    }
+    DYNAMIC_WINDOW_SIZE: int = 30
+    # Up to this many required gestures of a single hand are evaluated lazily (see `GestureContext`): the lazy walk
+    # costs about 2 us per gesture and the vectorized pass about 50 us whatever their number, so they break even
+    # around 32 gestures (batches are always evaluated by the vectorized pass)
+    LAZY_EVALUATION_MAX_GESTURES: int = 32
+
+    def __init__(self, gesture_rules: Mapping[str, Rule] | None = None) -> None:
+        """Initializes the GestureProvider.
+
+        Args:
+            gesture_rules (Mapping[str, Rule] | None): Custom gesture rules by gesture name, e.g. loaded
+                with `touchless.gestures.dsl.load_rules`, added to (or replacing) the built-in gestures.
+        """
+        self._engine: GestureEngine = GestureEngine({
+            name: rule for name, rule in self.GESTURE_RULES.items() if name in self.GESTURES
+        })
+        self._engines: dict[tuple[str, ...], GestureEngine] = {}
+        self._gesture_spaces: dict[tuple[str, ...], dict[str, Callable]] = {}
+        self._dynamic_trackers: dict[HandType, DynamicGestureTracker] = {}
+
+        if gesture_rules:
+            self.register_rules(gesture_rules)
+
+    def register_rules(self, gesture_rules: Mapping[str, Rule]) -> None:
+        """Adds custom gestures defined by rules to this provider (built-in gestures with the same names are replaced).
+
+        The gestures are compiled together with the built-in ones, so shared terms are evaluated once.
+
+        Args:
+            gesture_rules (Mapping[str, Rule]): Gesture rules by gesture name.
+        """
+
+        self.GESTURE_RULES = {**self.GESTURE_RULES, **gesture_rules}
+        self.GESTURES = {
+            **self.GESTURES,
+            **{name: partial(evaluate_rule, rule) for name, rule in gesture_rules.items()}
+        }
+        self._engine = GestureEngine({
+            name: rule for name, rule in self.GESTURE_RULES.items() if name in self.GESTURES
+        })
+        self._engines.clear()
+        self._gesture_spaces.clear()
     
     def detect_gestures(self, hand: Hand) -> list[HandGesture]:
         """Detects gestures from hand landmarks.
@@ -146,9 +606,120 @@ class GestureProvider:
             list[HandGesture]: List of the hand gestures.
         """
 
-        keypoints: HandLandmarkPoints = hand.data.keypoints
+        return self.to_hand_gestures(self.detect(hand, hand.required_gestures))
+
+    def detect(self, hand: Hand, required_gestures: list[str] | None = None) -> dict[str, bool]:
+        """Detects gestures of a hand as flags, without creating gesture objects.
+
+        Args:
+            hand (Hand): Hand which to detect gestures for.
+            required_gestures (list[str] | None): List of required gestures, or None for all (except dynamic ones).
+
+        Returns:
+            dict[str, bool]: Detection flags by gesture name, empty if no hand is detected.
+        """
+
+        detections: dict[str, bool] = self._detect_gestures(hand.data.keypoints, required_gestures)
+
+        if required_gestures is not None and any(name in self.DYNAMIC_GESTURES for name in required_gestures):
+            detections.update(self._detect_dynamic_gestures(hand, required_gestures))
+
+        return detections
+
+    def detect_gestures_batch(
+            self,
+            landmarks: np.ndarray,
+            required_gestures: list[str] | None = None,
+            chunk_size: int = 65536
+        ) -> np.ndarray:
+        """Detects gestures for a batch of hand landmarks (e.g. recorded frames).
+
+        Args:
+            landmarks (np.ndarray): Landmarks array of shape (N, 21, 3). Frames without a hand may be filled with NaN,
+                no gesture is detected for them.
+            required_gestures (list[str] | None): List of required gestures, or None for all.
+            chunk_size (int): Number of frames evaluated at once, bounds the memory used for intermediate arrays.
+                Default is 65536.
+
+        Returns:
+            np.ndarray: Boolean array of shape (N, n_gestures), columns ordered as `gesture_names(required_gestures)`.
+        """
+
+        landmarks = np.asarray(landmarks, dtype=np.float32)
+        gesture_names: list[str] = self.gesture_names(required_gestures)
+        engine: GestureEngine = self._get_engine(tuple(gesture_names))
+        detected: np.ndarray = np.zeros((len(landmarks), len(gesture_names)), dtype=bool)
+
+        compiled_columns: list[int] = [gesture_names.index(name) for name in engine.names]
+        for start in range(0, len(landmarks), chunk_size):
+            detected[start:start + chunk_size, compiled_columns] = engine.evaluate(landmarks[start:start + chunk_size])
+
+        for column, gesture_name in enumerate(gesture_names):
+            if gesture_name not in engine.names:
+                gesture_callable: Callable = self.GESTURES[gesture_name]
+                detected[:, column] = [bool(gesture_callable(HandLandmarkPoints(frame))) for frame in landmarks]
+
+        # Negated rules may hold for NaN landmarks
+        detected[np.isnan(landmarks).all(axis=(1, 2))] = False
+
+        return detected
+
+    def gesture_names(self, required_gestures: list[str] | None = None) -> list[str]:
+        """Gets names of the gestures which are detected, in the order of detection results.
+
+        Args:
+            required_gestures (list[str] | None): List of required gestures, or None for all.
+
+        Returns:
+            list[str]: The gesture names.
+        """
+
+        if required_gestures is None:
+            return list(self.GESTURES)
+
+        return [name for name in self.GESTURES if name in required_gestures]
+
+    def context(self, keypoints: HandLandmarkPoints) -> GestureContext:
+        """Creates a lazy evaluation context of the rule defined gestures for a single hand.
+
+        Gestures are computed only when accessed (e.g. `context["click_index_middle"]`), sharing
+        intermediate results, which is cheaper than `detect_gestures` when a few gestures are needed.
+
+        Args:
+            keypoints (HandLandmarkPoints): The hand landmarks.
+
+        Returns:
+            GestureContext: The context.
+        """
+
+        return self._engine.context(keypoints)
 
-        return self._detect_gestures(keypoints, hand.required_gestures)
+    def to_hand_gestures(self, detections: dict[str, bool], timestamp_ns: int | None = None) -> list[HandGesture]:
+        """Creates hand gestures of this provider from detection flags.
+
+        Args:
+            detections (dict[str, bool]): Detection flags by gesture name.
+            timestamp_ns (int | None): Time of the detection in milliseconds, or None for the current time.
+
+        Returns:
+            list[HandGesture]: List of the hand gestures, in the order of `detections`.
+        """
+
+        if timestamp_ns is None:
+            timestamp_ns = int(time.time() * 1000)
+
+        return [
+            HandGesture(
+                name=gesture_name,
+                data=GestureTrackingData(
+                    is_detected=is_detected,
+                    gesture_confidence=self.GESTURE_CONFIDENCE,
+                    timestamp_ns=timestamp_ns
+                ),
+                provider=self.name
+            )
+            for gesture_name, is_detected in detections.items()
+        ]
 
     @property
     def name(self) -> str:
@@ -159,7 +730,7 @@ class GestureProvider:
         """
         return self.NAME
 
-    def _detect_gestures(self, keypoints: HandLandmarkPoints | None, required_gestures: list[str] | None) -> list[HandGesture]:
+    def _detect_gestures(self, keypoints: HandLandmarkPoints | None, required_gestures: list[str] | None) -> dict[str, bool]:
         """Detects specific gestures from hand landmarks.
 
         Args:
@@ -167,46 +738,126 @@ class GestureProvider:
             required_gestures (list[str] | None): List of required gestures, or None for all.
 
         Returns:
-            list[HandGesture]: A list of detected hand gestures.
+            dict[str, bool]: Detection flags by gesture name, in the order of `GESTURES`.
         """
 
-        detected_gestures: list[HandGesture] = []
-
         if keypoints is None:
-            return detected_gestures
+            return {}
 
         gestures_space: dict[str, Callable] = self.GESTURES
 
         if required_gestures is not None:
-            gestures_space = {k: v for k, v in gestures_space.items() if k in required_gestures}
+            required: tuple[str, ...] = tuple(required_gestures)
+            if required not in self._gesture_spaces:
+                self._gesture_spaces[required] = {k: v for k, v in gestures_space.items() if k in required}
+            gestures_space = self._gesture_spaces[required]
+
+        engine: GestureEngine = self._get_engine(tuple(gestures_space))
+        detections: dict[str, bool] = (
+            engine.context(keypoints).detect()
+            if len(engine.names) <= self.LAZY_EVALUATION_MAX_GESTURES
+            else engine.detect(keypoints)
+        )
 
         for gesture_name, gesture_callable in gestures_space.items():
-            gesture: HandGesture = HandGesture(
-                name=gesture_name,
-                data=GestureTrackingData(
-                    is_detected=gesture_callable(keypoints),
-                    gesture_confidence=self.GESTURE_CONFIDENCE,
-                    timestamp_ns=int(time.time() * 1000)
-                ),
-                provider=self.name
-            )
-            detected_gestures.append(gesture)
+            if gesture_name not in detections:
+                detections[gesture_name] = bool(gesture_callable(keypoints))
+
+        return {name: detections[name] for name in gestures_space}
+
+    def _detect_dynamic_gestures(self, hand: Hand, required_gestures: list[str]) -> dict[str, bool]:
+        """Detects required dynamic gestures of a hand.
+
+        The motion tracker of the hand is updated once per hand tracking timestamp, so dynamic gestures
+        can be detected in several calls for the same frame.
+
+        Args:
+            hand (Hand): Hand which to detect gestures for.
+            required_gestures (list[str]): List of required gestures.
+
+        Returns:
+            dict[str, bool]: Detection flags by dynamic gesture name, empty if no hand is detected.
+        """
 
-        return detected_gestures
+        tracker: DynamicGestureTracker | None = self._dynamic_trackers.get(hand.type)
+
+        if tracker is None:
+            tracker = self._dynamic_trackers[hand.type] = DynamicGestureTracker(self.DYNAMIC_WINDOW_SIZE)
+
+        if hand.data.keypoints is None:
+            tracker.reset()
+            return {}
+
+        timestamp_ns: int = time.time_ns() if hand.data.timestamp_ns is None else hand.data.timestamp_ns * NS_PER_MS
+        window: LandmarkWindow = tracker.window
+
+        if not len(window) or window.timestamp_ns(window.newest_index) != timestamp_ns:
+            tracker.update(hand.data.keypoints.array, timestamp_ns)
+
+        detections: dict[str, bool] = {
+            gesture_name: bool(gesture_callable(tracker))
+            for gesture_name, gesture_callable in self.DYNAMIC_GESTURES.items()
+            if gesture_name in required_gestures
+        }
+
+        if any(detections.values()):
+            tracker.reset()
+
+        return detections
+
+    def _get_engine(self, gesture_names: tuple[str, ...]) -> GestureEngine:
+        """Gets the compiled engine for the given gestures.
+
+        Args:
+            gesture_names (tuple[str, ...]): Names of the gestures to evaluate.
+
+        Returns:
+            GestureEngine: The engine evaluating the compiled subset of the gestures.
+        """
+
+        if len(gesture_names) == len(self.GESTURES):
+            return self._engine
+
+        if gesture_names not in self._engines:
+            self._engines[gesture_names] = self._engine.subset(gesture_names)
+
+        return self._engines[gesture_names]
 
 
 class HandsProvider:
 
     def __init__(self,
             right_hand_gestures: list[str] | None = None,
-            left_hand_gestures: list[str] | None = None
+            left_hand_gestures: list[str] | None = None,
+            hand_tracking_provider: HandTrackingProvider | None = None,
+            gesture_provider: GestureProvider | None = None,
+            tracer: FrameTracer | None = None
         ) -> None:
 
         self._right_hand_gestures: list[str] | None = right_hand_gestures
         self._left_hand_gestures: list[str] | None = left_hand_gestures
 
-        self._hand_tracking_provider = HandTrackingProvider()
-        self._gesture_provider: GestureProvider = GestureProvider()
+        if hand_tracking_provider is None:
+            hand_tracking_provider = HandTrackingProvider(tracer=tracer)
+        elif tracer is not None and isinstance(hand_tracking_provider, HandTrackingProvider):
+            # The tracking stages of a given provider are recorded to the same tracer
+            if hand_tracking_provider.tracer is None:
+                hand_tracking_provider.tracer = tracer
+            elif hand_tracking_provider.tracer is not tracer:
+                raise ValueError("The hand tracking provider records to a different tracer than the HandsProvider")
+
+        self._hand_tracking_provider: HandTrackingProvider = hand_tracking_provider
+        # E.g. GestureProvider(load_rules("gestures.yaml")) to detect custom gestures
+        self._gesture_provider: GestureProvider = gesture_provider or GestureProvider()
+
+        self._subscriptions: dict[HandType, dict[str, list[GestureSubscription]]] = {
+            HandType.RIGHT: {},
+            HandType.LEFT: {}
+        }
+        self._active_gestures: dict[HandType, set[str]] = {HandType.RIGHT: set(), HandType.LEFT: set()}
+        # The event loop of a running `stream`, which subscription callbacks are scheduled on
+        self._callback_loop: asyncio.AbstractEventLoop | None = None
+        self._tracer: FrameTracer | None = tracer
 
     def update(self,
             frame: np.ndarray,
@@ -214,6 +865,9 @@ class HandsProvider:
             left_hand_gestures: bool = False
         ) -> None:
 
+        tracer: FrameTracer | None = self._tracer
+        update_start_ns: int = time.perf_counter_ns() if tracer is not None else 0
+
         self._right_hand: Hand = Hand(type=HandType.RIGHT, required_gestures=self._right_hand_gestures)
         self._left_hand: Hand = Hand(type=HandType.LEFT, required_gestures=self._left_hand_gestures)
         
@@ -221,11 +875,127 @@ class HandsProvider:
         self._right_hand.data = hands_tracking_data[self._right_hand.type]
         self._left_hand.data = hands_tracking_data[self._left_hand.type]
 
-        if right_hand_gestures:
-            self._right_hand.gestures = self._gesture_provider.detect_gestures(self._right_hand)
+        for hand, with_gestures in ((self._right_hand, right_hand_gestures), (self._left_hand, left_hand_gestures)):
+            detections: dict[str, bool] = {}
+            start_ns: int = time.perf_counter_ns() if tracer is not None else 0
+
+            if with_gestures:
+                detections = self._gesture_provider.detect(hand, hand.required_gestures)
+                hand.gestures = self._gesture_provider.to_hand_gestures(detections)
+
+            if self._subscriptions[hand.type]:
+                subscribed_gestures: list[str] = [
+                    name for name in self._subscriptions[hand.type] if name not in detections
+                ]
+                if subscribed_gestures:
+                    detections = detections | self._gesture_provider.detect(hand, subscribed_gestures)
+
+                if tracer is not None:
+                    tracer.record("gesture_detection", start_ns)
+                    start_ns = time.perf_counter_ns()
+
+                self._dispatch(hand, detections)
+
+                if tracer is not None:
+                    tracer.record("callbacks", start_ns)
+            elif tracer is not None and with_gestures:
+                tracer.record("gesture_detection", start_ns)
+
+        if tracer is not None:
+            tracer.record("update", update_start_ns)
+
+    def subscribe(self,
+            gesture: str,
+            callback: Callable[[GestureStateChange], Any],
+            hand_types: HandType | list[HandType] | None = None,
+            transitions: GestureTransition = GestureTransition.STARTED
+        ) -> GestureSubscription:
+        """Subscribes a callback to state changes of a gesture.
+
+        Subscribed gestures are evaluated on every `update` (whether or not gesture lists are requested),
+        and the callback is called only when the gesture starts or ends being detected.
+
+        Args:
+            gesture (str): The gesture name (see `GestureProvider.GESTURES` and `GestureProvider.DYNAMIC_GESTURES`).
+            callback (Callable[[GestureStateChange], Any]): The callback.
+            hand_types (HandType | list[HandType] | None): Hands to watch, or None for both.
+            transitions (GestureTransition): Transitions to report. Default is GestureTransition.STARTED.
+
+        Returns:
+            GestureSubscription: The subscription, to unsubscribe with.
+
+        Raises:
+            ValueError: If the gesture is unknown.
+        """
+
+        if gesture not in self._gesture_provider.GESTURES and gesture not in self._gesture_provider.DYNAMIC_GESTURES:
+            raise ValueError(f"Unknown gesture: {gesture}")
+
+        if hand_types is None:
+            hand_types = list(HandType)
+        elif isinstance(hand_types, HandType):
+            hand_types = [hand_types]
+
+        subscription: GestureSubscription = GestureSubscription(
+            gesture=gesture,
+            callback=callback,
+            hand_types=frozenset(hand_types),
+            transitions=transitions
+        )
+
+        for hand_type in subscription.hand_types:
+            self._subscriptions[hand_type].setdefault(gesture, []).append(subscription)
+
+        return subscription
 
-        if left_hand_gestures:
-            self._left_hand.gestures = self._gesture_provider.detect_gestures(self._left_hand)
+    def unsubscribe(self, subscription: GestureSubscription) -> None:
+        """Removes a subscription. Gestures without subscriptions are no longer evaluated.
+
+        Args:
+            subscription (GestureSubscription): The subscription returned by `subscribe`.
+        """
+
+        for hand_type in subscription.hand_types:
+            subscriptions: list[GestureSubscription] = self._subscriptions[hand_type].get(subscription.gesture, [])
+            self._subscriptions[hand_type][subscription.gesture] = [s for s in subscriptions if s is not subscription]
+
+            if not self._subscriptions[hand_type][subscription.gesture]:
+                del self._subscriptions[hand_type][subscription.gesture]
+                self._active_gestures[hand_type].discard(subscription.gesture)
+
+    def _dispatch(self, hand: Hand, detections: dict[str, bool]) -> None:
+        """Calls subscribers of the gestures whose state changed.
+
+        Args:
+            hand (Hand): The hand.
+            detections (dict[str, bool]): Detection flags by gesture name, missing gestures are not detected.
+        """
+
+        active_gestures: set[str] = self._active_gestures[hand.type]
+        timestamp_ns: int = int(time.time() * 1000) if hand.data.timestamp_ns is None else hand.data.timestamp_ns
+
+        for gesture, subscriptions in list(self._subscriptions[hand.type].items()):
+            is_detected: bool = detections.get(gesture, False)
+
+            if is_detected == (gesture in active_gestures):
+                continue
+
+            transition: GestureTransition = GestureTransition.STARTED if is_detected else GestureTransition.ENDED
+            if is_detected:
+                active_gestures.add(gesture)
+            else:
+                active_gestures.discard(gesture)
+
+            state_change: GestureStateChange | None = None
+            for subscription in list(subscriptions):
+                if subscription.transitions & transition:
+                    state_change = state_change or GestureStateChange(
+                        hand=hand, gesture=gesture, transition=transition, timestamp_ns=timestamp_ns
+                    )
+                    if self._callback_loop is not None:
+                        self._callback_loop.call_soon_threadsafe(subscription.callback, state_change)
+                    else:
+                        subscription.callback(state_change)
 
     @property
     def right_hand(self) -> Hand:
@@ -234,3 +1004,88 @@ class HandsProvider:
     @property
     def left_hand(self) -> Hand:
         return self._left_hand
+
+    @property
+    def gesture_provider(self) -> GestureProvider:
+        """Gets the gesture provider detecting gestures of the hands.
+
+        Returns:
+            GestureProvider: The gesture provider, e.g. to register custom gesture rules.
+        """
+        return self._gesture_provider
+
+    @property
+    def tracer(self) -> FrameTracer | None:
+        """Gets the tracer recording the frame processing stages.
+
+        Returns:
+            FrameTracer | None: The tracer, or None if tracing is disabled.
+        """
+        return self._tracer
+
+    async def stream(self,
+            camera: Camera,
+            right_hand_gestures: bool = True,
+            left_hand_gestures: bool = True
+        ) -> AsyncIterator[dict[HandType, Hand]]:
+        """Streams hands of the camera frames without blocking the event loop.
+
+        Capture and inference run in a single worker thread (the camera and the tracking graph are not thread-safe),
+        one frame ahead of the consumer: the next frame is processed while the current hands are consumed, and
+        no further frame is read until they are. The stream ends when the camera stops. When the stream is
+        closed or cancelled, it waits for the frame in progress, so the camera and the provider can be reused
+        (iterate it in `contextlib.aclosing` to close it as soon as the consumer stops, e.g. when cancelled).
+        While streaming, subscription callbacks are called on the event loop (not on the worker thread), after the
+        frame is processed. The camera must be headless: OpenCV HighGUI calls (`cv2.waitKey`, `cv2.imshow`) are only reliable on the main
+        thread, so windows are shown by the consumer.
+
+        Args:
+            camera (Camera): The camera to read frames from, created with `headless=True`.
+            right_hand_gestures (bool): Whether to detect right hand gestures. Default is True.
+            left_hand_gestures (bool): Whether to detect left hand gestures. Default is True.
+
+        Yields:
+            dict[HandType, Hand]: The hands of the next frame.
+
+        Raises:
+            ValueError: If the camera is not headless.
+        """
+
+        if not camera.headless:
+            raise ValueError("Streaming reads frames in a worker thread and requires a camera with headless=True")
+
+        def process_next_frame() -> dict[HandType, Hand] | None:
+            frame: np.ndarray | None = camera.read()
+
+            if frame is None:
+                return None
+
+            self.update(frame, right_hand_gestures, left_hand_gestures)
+            return {HandType.RIGHT: self._right_hand, HandType.LEFT: self._left_hand}
+
+        self._callback_loop = asyncio.get_running_loop()
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="touchless-stream")
+        pending: Future | None = executor.submit(process_next_frame)
+
+        try:
+            while pending is not None:
+                hands: dict[HandType, Hand] | None = await asyncio.wrap_future(pending)
+                pending = None
+
+                if hands is None:
+                    break
+
+                pending = executor.submit(process_next_frame)
+                yield hands
+        finally:
+            try:
+                if pending is not None:
+                    # Cancelling the awaiting task does not stop the worker thread: wait for the frame in progress,
+                    # through a new wrapper as the awaited one is cancelled
+                    waiter: asyncio.Future = asyncio.wrap_future(pending)
+                    await asyncio.shield(asyncio.wait({waiter}))
+                    if not waiter.cancelled():
+                        waiter.exception()
+            finally:
+                executor.shutdown(wait=pending is None or pending.done())
+                self._callback_loop = None
@@ -0,0 +1,98 @@
+import numpy as np
+
+
+class LandmarkPredictor:
+    """A class predicting hand landmarks between measurements with an alpha-beta (constant velocity) filter.
+
+    Measurements (inference results) correct the filtered landmarks and their velocity. Predictions
+    extrapolate the filtered landmarks to the requested time, and their confidence decays with
+    the prediction age (time since the last measurement).
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.85,
+        beta: float = 0.5,
+        confidence_half_life_ms: float = 100.0,
+        max_age_ms: float = 500.0
+    ) -> None:
+        """Initializes the LandmarkPredictor.
+
+        Args:
+            alpha (float): Position correction gain in (0, 1], 1 follows measurements exactly. Default is 0.85.
+            beta (float): Velocity correction gain in [0, 2), 0 keeps the initial (zero) velocity. Default is 0.5.
+            confidence_half_life_ms (float): Prediction age which halves the confidence. Default is 100.0.
+            max_age_ms (float): Maximum prediction age, older predictions are not made (the hand is lost).
+                Default is 500.0.
+        """
+        self._alpha: float = alpha
+        self._beta: float = beta
+        self._confidence_half_life_ms: float = confidence_half_life_ms
+        self._max_age_ms: float = max_age_ms
+
+        self._landmarks: np.ndarray | None = None
+        self._velocity: np.ndarray | None = None
+        self._confidence: float = 0.0
+        self._timestamp_ns: int = 0
+
+    def update(self, landmarks: np.ndarray, timestamp_ns: int, confidence: float = 1.0) -> None:
+        """Corrects the filter with a measurement.
+
+        Args:
+            landmarks (np.ndarray): Measured landmarks array of shape (21, 3).
+            timestamp_ns (int): Time of the measurement in nanoseconds.
+            confidence (float): Confidence of the measurement. Default is 1.0.
+        """
+        landmarks = np.asarray(landmarks, dtype=np.float64)
+        dt: float = (timestamp_ns - self._timestamp_ns) / 1e9
+
+        if self._landmarks is None or self._velocity is None or dt <= 0:
+            self._landmarks = landmarks.copy()
+            self._velocity = np.zeros_like(landmarks)
+        else:
+            predicted: np.ndarray = self._landmarks + self._velocity * dt
+            residual: np.ndarray = landmarks - predicted
+            self._landmarks = predicted + self._alpha * residual
+            self._velocity = self._velocity + (self._beta / dt) * residual
+
+        self._confidence = confidence
+        self._timestamp_ns = timestamp_ns
+
+    def predict(self, timestamp_ns: int) -> tuple[np.ndarray, float] | None:
+        """Predicts landmarks at the given time.
+
+        Args:
+            timestamp_ns (int): Time of the prediction in nanoseconds.
+
+        Returns:
+            tuple[np.ndarray, float] | None: Predicted (21, 3) float32 landmarks and their confidence,
+                or None if there is no measurement or the prediction would be older than `max_age_ms`.
+        """
+        if self._landmarks is None or self._velocity is None:
+            return None
+
+        age_ms: float = max(timestamp_ns - self._timestamp_ns, 0) / 1e6
+
+        if age_ms > self._max_age_ms:
+            return None
+
+        landmarks: np.ndarray = (self._landmarks + self._velocity * (age_ms / 1e3)).astype(np.float32)
+        confidence: float = self._confidence * 0.5 ** (age_ms / self._confidence_half_life_ms)
+
+        return landmarks, confidence
+
+    def reset(self) -> None:
+        """Resets the filter (e.g. when the hand is lost)."""
+        self._landmarks = None
+        self._velocity = None
+        self._confidence = 0.0
+        self._timestamp_ns = 0
+
+    @property
+    def is_tracking(self) -> bool:
+        """Checks if the filter has a measurement to predict from.
+
+        Returns:
+            bool: True if the filter has a measurement, False otherwise.
+        """
+        return self._landmarks is not None
@@ -0,0 +1,396 @@
+from collections.abc import Iterator
+from contextlib import suppress
+from dataclasses import dataclass, field
+import multiprocessing as mp
+from multiprocessing.process import BaseProcess
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Event
+import queue
+import time
+
+import numpy as np
+
+from touchless.camera import Camera
+from touchless.hands import GestureProvider, Hand, HandTrackingData, HandTrackingProvider, HandType
+from touchless.utils.landmarks import LANDMARKS_SHAPE, HandLandmarkPoints
+
+
+HAND_TYPES: tuple[HandType, ...] = (HandType.RIGHT, HandType.LEFT)
+
+
+@dataclass
+class SourceResult:
+    """A class representing hand tracking results of a single frame of a source.
+
+    Attributes:
+        source (str): Name of the source.
+        frame_index (int): Index of the frame in the source.
+        frame (np.ndarray | None): The frame (a view into shared memory, valid until the next `get` call
+            for the source), or None if frames are not shared.
+        hands (dict[HandType, Hand]): The hands with tracking data and gestures.
+        dropped_results (int): Number of results the worker dropped so far because the consumer was behind.
+    """
+
+    source: str
+    frame_index: int
+    frame: np.ndarray | None
+    hands: dict[HandType, Hand] = field(default_factory=dict)
+    dropped_results: int = 0
+
+
+@dataclass
+class _SourceState:
+    """A class representing the consumer side state of a source."""
+
+    process: BaseProcess
+    results: mp.Queue
+    ready_event: Event
+    shared_memory: SharedMemory | None = None
+    frames: np.ndarray | None = None
+    release_status: str | None = None
+
+
+def _tracking_worker(
+    ocv_capture: int | str,
+    camera_params: dict,
+    results: mp.Queue,
+    stop_event: Event,
+    ready_event: Event,
+    frame_slots: int,
+    share_frames: bool
+) -> None:
+    """Captures frames of a source, tracks hands and detects gestures (runs in a worker process).
+
+    Sends ("ready", shared memory name, frame shape) first, then ("result", frame index, slot, timestamp, landmarks,
+    detected, confidence, gestures, dropped results) per frame and ("end", release status) when the capture stops
+    or fails.
+    A frame is written to a shared memory slot which is neither queued nor held by the consumer: the slot index
+    advances only when a result is queued, and at most `frame_slots - 2` results are queued. When the queue is full,
+    the oldest queued result is replaced, so the consumer gets the latest frames.
+    The shared memory is unlinked by the consumer once it received the "ready" message (and set `ready_event`),
+    or by the worker if it stops before.
+
+    Args:
+        ocv_capture (int | str): Index of the camera or path to video file.
+        camera_params (dict): Other `Camera` parameters.
+        results (mp.Queue): The queue to send results to.
+        stop_event (Event): The event which stops the capture.
+        ready_event (Event): The event set by the consumer once it received the "ready" message.
+        frame_slots (int): Number of frames in shared memory.
+        share_frames (bool): Whether to share frames through shared memory.
+    """
+
+    try:
+        _track_source(ocv_capture, camera_params, results, stop_event, ready_event, frame_slots, share_frames)
+    except Exception as e:
+        results.put(("end", f"Stop on error: {e!r}"))
+
+
+def _track_source(
+    ocv_capture: int | str,
+    camera_params: dict,
+    results: mp.Queue,
+    stop_event: Event,
+    ready_event: Event,
+    frame_slots: int,
+    share_frames: bool
+) -> None:
+    """Runs the capture and tracking loop of `_tracking_worker`."""
+
+    cam: Camera = Camera(ocv_capture, headless=True, stop_event=stop_event, **camera_params)
+    hand_tracking_provider: HandTrackingProvider = HandTrackingProvider()
+    gesture_provider: GestureProvider = GestureProvider()
+
+    frame: np.ndarray | None = cam.read() if cam.is_active else None
+
+    if frame is None:
+        results.put(("end", cam.release_status or "Capture is not opened"))
+        return
+
+    shared_memory: SharedMemory | None = None
+    frames: np.ndarray | None = None
+
+    if share_frames:
+        shared_memory = SharedMemory(create=True, size=frame.nbytes * frame_slots)
+
+    try:
+        if shared_memory is not None:
+            frames = np.ndarray((frame_slots, *frame.shape), dtype=frame.dtype, buffer=shared_memory.buf)
+
+        results.put(("ready", None if shared_memory is None else shared_memory.name, frame.shape))
+
+        frame_index: int = 0
+        slot: int = 0
+        dropped_results: int = 0
+
+        while frame is not None:
+            hands_tracking_data: dict[HandType, HandTrackingData] = hand_tracking_provider.update(frame)
+            landmarks: np.ndarray = np.full((len(HAND_TYPES), *LANDMARKS_SHAPE), np.nan, dtype=np.float32)
+            confidence: np.ndarray = np.zeros(len(HAND_TYPES), dtype=np.float32)
+
+            for i, hand_type in enumerate(HAND_TYPES):
+                data: HandTrackingData = hands_tracking_data[hand_type]
+                if data.is_hand_detected and data.keypoints is not None:
+                    landmarks[i] = data.keypoints.array
+                    confidence[i] = data.hand_confidence
+
+            detected: np.ndarray = ~np.isnan(landmarks[:, 0, 0])
+            gestures: np.ndarray = gesture_provider.detect_gestures_batch(landmarks)
+
+            if frames is not None:
+                frames[slot] = frame
+
+            # Replace the oldest queued result (the "ready" message only once the consumer received it)
+            if results.full() and ready_event.is_set():
+                with suppress(queue.Empty):
+                    results.get_nowait()
+                    dropped_results += 1
+
+            try:
+                results.put_nowait((
+                    "result", frame_index, slot, int(time.time() * 1000), landmarks, detected, confidence, gestures, dropped_results
+                ))
+                slot = (slot + 1) % frame_slots
+            except queue.Full:
+                dropped_results += 1
+
+            frame_index += 1
+            frame = cam.read()
+
+        results.put(("end", cam.release_status or "Stop on capture end"))
+    finally:
+        frames = None
+        if shared_memory is not None:
+            shared_memory.close()
+            if not ready_event.is_set():
+                # The consumer has not opened the shared memory (or unlinked it meanwhile)
+                with suppress(FileNotFoundError):
+                    shared_memory.unlink()
+
+
+class MultiCameraPipeline:
+    """A class for tracking hands of several sources in parallel, one worker process per source.
+
+    Each worker captures frames of its source, tracks hands and detects gestures. Frames are passed through
+    shared memory and results as compact landmark and gesture arrays; `Hand` objects are built on `get`.
+    When the consumer of a source falls behind, the worker drops the oldest queued results instead of waiting.
+    """
+
+    def __init__(
+        self,
+        sources: dict[str, int | str],
+        width: int = 640,
+        height: int = 480,
+        flip: bool = True,
+        right_hand_gestures: list[str] | None = None,
+        left_hand_gestures: list[str] | None = None,
+        queue_size: int = 2,
+        share_frames: bool = True
+    ) -> None:
+        """Initializes the MultiCameraPipeline.
+
+        Args:
+            sources (dict[str, int | str]): Camera indexes or video file paths by source name.
+            width (int): Width of the captured video frames. Default is 640 pixels.
+            height (int): Height of the captured video frames. Default is 480 pixels.
+            flip (bool): Whether to horizontally flip the captured frames. Default is True.
+            right_hand_gestures (list[str] | None): Gestures to report for right hands, or None for all.
+            left_hand_gestures (list[str] | None): Gestures to report for left hands, or None for all.
+            queue_size (int): Maximum number of results queued per source. Default is 2.
+            share_frames (bool): Whether to pass frames to the consumer. Default is True.
+        """
+        self._sources: dict[str, int | str] = dict(sources)
+        self._camera_params: dict = {"width": width, "height": height, "flip": flip}
+        self._required_gestures: dict[HandType, list[str] | None] = {
+            HandType.RIGHT: right_hand_gestures,
+            HandType.LEFT: left_hand_gestures
+        }
+        self._queue_size: int = queue_size
+        self._share_frames: bool = share_frames
+
+        self._context = mp.get_context("spawn")
+        self._stop_event: Event = self._context.Event()
+        self._states: dict[str, _SourceState] = {}
+        self._gesture_provider: GestureProvider = GestureProvider()
+        self._gesture_names: list[str] = self._gesture_provider.gesture_names()
+
+    def start(self, timeout: float | None = 30.0) -> None:
+        """Starts the worker processes and waits until all sources are opened.
+
+        Args:
+            timeout (float | None): Maximum time in seconds to wait for each source. Default is 30.0.
+
+        Raises:
+            RuntimeError: If a source does not report within the timeout (the workers are stopped).
+        """
+
+        for source, ocv_capture in self._sources.items():
+            results: mp.Queue = self._context.Queue(maxsize=self._queue_size)
+            ready_event: Event = self._context.Event()
+            process: BaseProcess = self._context.Process(
+                target=_tracking_worker,
+                args=(
+                    ocv_capture, self._camera_params, results, self._stop_event, ready_event,
+                    self._queue_size + 2, self._share_frames
+                ),
+                name=f"touchless-tracking-{source}",
+                daemon=True
+            )
+            process.start()
+            self._states[source] = _SourceState(process=process, results=results, ready_event=ready_event)
+
+        for source, state in self._states.items():
+            try:
+                message: tuple = state.results.get(timeout=timeout)
+            except queue.Empty:
+                self.stop()
+                raise RuntimeError(f"Source {source!r} was not opened within {timeout} seconds") from None
+
+            if message[0] == "end":
+                state.release_status = message[1]
+                continue
+
+            _, shared_memory_name, frame_shape = message
+
+            if shared_memory_name is not None:
+                try:
+                    state.shared_memory = SharedMemory(name=shared_memory_name)
+                except FileNotFoundError:
+                    # The worker failed and unlinked the shared memory before it was opened
+                    state.release_status = "Stop on error: the worker stopped before the source was opened"
+                    continue
+
+                # The consumer owns the shared memory: unlinking now frees it once both processes close it
+                with suppress(FileNotFoundError):
+                    state.shared_memory.unlink()
+                state.frames = np.ndarray((self._queue_size + 2, *frame_shape), dtype=np.uint8, buffer=state.shared_memory.buf)
+
+            state.ready_event.set()
+
+    def get(self, source: str, timeout: float | None = None) -> SourceResult | None:
+        """Gets the next result of a source.
+
+        Args:
+            source (str): Name of the source.
+            timeout (float | None): Maximum time in seconds to wait for a result, or None to wait forever.
+
+        Returns:
+            SourceResult | None: The result, or None if the source capture has ended or the timeout expired.
+        """
+
+        state: _SourceState = self._states[source]
+
+        if state.release_status is not None:
+            return None
+
+        try:
+            message: tuple = state.results.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+        if message[0] == "end":
+            state.release_status = message[1]
+            return None
+
+        _, frame_index, slot, timestamp_ns, landmarks, detected, confidence, gestures, dropped_results = message
+        hands: dict[HandType, Hand] = {}
+
+        for i, hand_type in enumerate(HAND_TYPES):
+            required_gestures: list[str] | None = self._required_gestures[hand_type]
+            hand: Hand = Hand(type=hand_type, required_gestures=required_gestures)
+
+            if detected[i]:
+                hand.data = HandTrackingData(
+                    is_hand_detected=True,
+                    hand_confidence=float(confidence[i]),
+                    keypoints=HandLandmarkPoints(landmarks[i]),
+                    timestamp_ns=timestamp_ns
+                )
+                hand.gestures = self._gesture_provider.to_hand_gestures(
+                    {
+                        name: bool(is_detected)
+                        for name, is_detected in zip(self._gesture_names, gestures[i])
+                        if required_gestures is None or name in required_gestures
+                    },
+                    timestamp_ns
+                )
+
+            hands[hand_type] = hand
+
+        return SourceResult(
+            source=source,
+            frame_index=frame_index,
+            frame=None if state.frames is None else state.frames[slot],
+            hands=hands,
+            dropped_results=dropped_results
+        )
+
+    def results(self, source: str) -> Iterator[SourceResult]:
+        """Iterates over results of a source until its capture ends.
+
+        Args:
+            source (str): Name of the source.
+
+        Yields:
+            SourceResult: The next result.
+        """
+
+        while (result := self.get(source)) is not None:
+            yield result
+
+    def release_status(self, source: str) -> str | None:
+        """Gets the release status of a source.
+
+        Args:
+            source (str): Name of the source.
+
+        Returns:
+            str | None: The release status, or None if the source capture is running.
+        """
+        return self._states[source].release_status
+
+    @property
+    def sources(self) -> list[str]:
+        """Gets the names of the sources.
+
+        Returns:
+            list[str]: The source names.
+        """
+        return list(self._sources)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stops the worker processes and releases shared memory.
+
+        Args:
+            timeout (float): Maximum time in seconds to wait for each worker to finish. Default is 5.0.
+        """
+
+        self._stop_event.set()
+
+        for state in self._states.values():
+            deadline: float = time.monotonic() + timeout
+
+            # Drain the results so that the worker does not block on exit flushing its queue
+            while state.process.is_alive() and time.monotonic() < deadline:
+                try:
+                    state.results.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+            if state.process.is_alive():
+                state.process.terminate()
+            state.process.join(timeout=1.0)
+
+            state.frames = None
+            if state.shared_memory is not None:
+                state.shared_memory.close()
+                state.shared_memory = None
+
+            state.results.close()
+
+    def __enter__(self) -> "MultiCameraPipeline":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
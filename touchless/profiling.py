@@ -0,0 +1,195 @@
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import threading
+import time
+
+import numpy as np
+
+
+@dataclass
+class StageStats:
+    """A class representing latency statistics of a stage over the recent frames.
+
+    Attributes:
+        stage (str): The stage name.
+        count (int): Number of recorded spans of the stage (since the tracer was created or reset).
+        mean_ms (float): Mean duration of the recent spans in milliseconds.
+        p50_ms (float): Median duration of the recent spans in milliseconds.
+        p90_ms (float): 90th percentile of the recent span durations in milliseconds.
+        p99_ms (float): 99th percentile of the recent span durations in milliseconds.
+        max_ms (float): Maximum duration of the recent spans in milliseconds.
+    """
+
+    stage: str
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class FrameTracer:
+    """A class for recording durations of the frame processing stages.
+
+    Spans are recorded with monotonic nanosecond timestamps (`time.perf_counter_ns`) by the components the tracer
+    is passed to (`Camera`, `HandTrackingProvider`, `HandsProvider`), so that a slow frame can be attributed
+    to capture, color conversion, inference, landmark conversion, gesture detection or callbacks.
+    Recording a span costs a few appends, components without a tracer skip instrumentation entirely.
+
+    Stages:
+        - "poll_keys": `cv2.waitKey` in `Camera.read`;
+        - "capture": reading (and flipping) a frame in `Camera.read`;
+        - "hand_tracking": `HandTrackingProvider.update`, which contains "color_conversion", "inference"
+          (MediaPipe) and "landmark_conversion" spans;
+        - "gesture_detection": gesture detection of a hand in `HandsProvider.update`;
+        - "callbacks": subscription callbacks of a hand in `HandsProvider.update`;
+        - "update": the whole `HandsProvider.update`.
+    """
+
+    def __init__(self, window_size: int = 1000, capacity: int = 100_000) -> None:
+        """Initializes the FrameTracer.
+
+        Args:
+            window_size (int): Number of recent spans per stage the statistics are computed over. Default is 1000.
+            capacity (int): Number of recent spans kept for the timeline export. Default is 100000.
+        """
+        self._window_size: int = window_size
+        self._durations: dict[str, deque[int]] = {}
+        self._counts: dict[str, int] = {}
+        self._spans: deque[tuple[str, int, int, int]] = deque(maxlen=capacity)
+        self._thread_names: dict[int, str] = {}
+        self._origin_ns: int = time.perf_counter_ns()
+
+    def record(self, stage: str, start_ns: int, end_ns: int | None = None) -> None:
+        """Records a span of a stage.
+
+        Args:
+            stage (str): The stage name.
+            start_ns (int): Start of the span, from `time.perf_counter_ns`.
+            end_ns (int | None): End of the span, from `time.perf_counter_ns`, or None for now.
+        """
+        if end_ns is None:
+            end_ns = time.perf_counter_ns()
+
+        durations: deque[int] | None = self._durations.get(stage)
+        if durations is None:
+            durations = self._durations[stage] = deque(maxlen=self._window_size)
+            self._counts[stage] = 0
+
+        durations.append(end_ns - start_ns)
+        self._counts[stage] += 1
+
+        thread_id: int = threading.get_ident()
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = threading.current_thread().name
+
+        self._spans.append((stage, start_ns, end_ns, thread_id))
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Records the span of a `with` block, e.g. to trace application code along with the built-in stages.
+
+        Args:
+            stage (str): The stage name.
+        """
+        start_ns: int = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(stage, start_ns)
+
+    @property
+    def stages(self) -> list[str]:
+        """Gets the recorded stages.
+
+        Returns:
+            list[str]: Names of the recorded stages, in the order they were first recorded.
+        """
+        return list(self._durations)
+
+    def stats(self, stage: str) -> StageStats:
+        """Gets latency statistics of a stage over its recent spans.
+
+        Args:
+            stage (str): The stage name.
+
+        Returns:
+            StageStats: The statistics.
+
+        Raises:
+            KeyError: If the stage was not recorded.
+        """
+        durations_ms: np.ndarray = np.fromiter(self._durations[stage], dtype=np.float64) / 1e6
+        p50, p90, p99 = np.percentile(durations_ms, (50, 90, 99))
+
+        return StageStats(
+            stage=stage,
+            count=self._counts[stage],
+            mean_ms=float(durations_ms.mean()),
+            p50_ms=float(p50),
+            p90_ms=float(p90),
+            p99_ms=float(p99),
+            max_ms=float(durations_ms.max())
+        )
+
+    def percentiles(self, stage: str, percentiles: tuple[float, ...] = (50, 90, 99)) -> dict[float, float]:
+        """Gets percentiles of the recent span durations of a stage.
+
+        Args:
+            stage (str): The stage name.
+            percentiles (tuple[float, ...]): Percentiles in [0, 100]. Default is (50, 90, 99).
+
+        Returns:
+            dict[float, float]: Durations in milliseconds by percentile.
+
+        Raises:
+            KeyError: If the stage was not recorded.
+        """
+        durations_ms: np.ndarray = np.fromiter(self._durations[stage], dtype=np.float64) / 1e6
+        return dict(zip(percentiles, np.percentile(durations_ms, percentiles).tolist()))
+
+    def summary(self) -> dict[str, StageStats]:
+        """Gets latency statistics of all recorded stages.
+
+        Returns:
+            dict[str, StageStats]: Statistics by stage name.
+        """
+        return {stage: self.stats(stage) for stage in self._durations}
+
+    def export_chrome_trace(self, path: str | Path) -> None:
+        """Exports the recent spans as a Chrome trace JSON timeline (open with Perfetto or chrome://tracing).
+
+        Args:
+            path (str | Path): Path to the output file.
+        """
+        pid: int = os.getpid()
+        events: list[dict] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": name}}
+            for thread_id, name in self._thread_names.items()
+        ]
+        events.extend(
+            {
+                "name": stage,
+                "cat": "touchless",
+                "ph": "X",
+                "ts": (start_ns - self._origin_ns) / 1e3,
+                "dur": (end_ns - start_ns) / 1e3,
+                "pid": pid,
+                "tid": thread_id
+            }
+            for stage, start_ns, end_ns, thread_id in list(self._spans)
+        )
+
+        Path(path).write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+    def reset(self) -> None:
+        """Removes all recorded spans."""
+        self._durations.clear()
+        self._counts.clear()
+        self._spans.clear()
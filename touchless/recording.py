@@ -0,0 +1,280 @@
+import os
+from pathlib import Path
+from typing import BinaryIO
+import warnings
+
+import numpy as np
+
+from touchless.hands import NS_PER_MS, Hand, HandTrackingData, HandType
+from touchless.utils.landmarks import LANDMARKS_SHAPE
+
+
+RECORDING_MAGIC: bytes = b"TLRECORD"
+RECORDING_VERSION: int = 2
+
+HAND_CODES: dict[HandType, int] = {HandType.RIGHT: 0, HandType.LEFT: 1}
+HAND_TYPES_BY_CODE: dict[int, HandType] = {code: hand_type for hand_type, code in HAND_CODES.items()}
+
+# Field offsets are explicit, so the record layout is fixed across platforms: every field is aligned
+# to its size (landmarks at offset 16, after 3 padding bytes) and the record size is a multiple of 8,
+# so the columns of a memory-mapped recording are aligned views
+RECORD_DTYPE: np.dtype = np.dtype({
+    "names": ["timestamp_ns", "confidence", "hand", "landmarks"],
+    "formats": ["<i8", "<f4", "u1", ("<f4", LANDMARKS_SHAPE)],
+    "offsets": [0, 8, 12, 16],
+    "itemsize": 272
+})
+HEADER_DTYPE: np.dtype = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("record_size", "<u4")
+])
+
+
+def _read_header(file: BinaryIO, path: str | Path) -> None:
+    """Reads and validates the header of a recording file.
+
+    Args:
+        file (BinaryIO): The file positioned at its start.
+        path (str | Path): Path to the file (for error messages).
+
+    Raises:
+        ValueError: If the file is not a recording or has an unsupported version or record size.
+    """
+    data: bytes = file.read(HEADER_DTYPE.itemsize)
+
+    if len(data) < HEADER_DTYPE.itemsize:
+        raise ValueError(f"{path} is not a landmark recording: the header is truncated")
+
+    header: np.ndarray = np.frombuffer(data, dtype=HEADER_DTYPE)[0]
+
+    if header["magic"] != RECORDING_MAGIC:
+        raise ValueError(f"{path} is not a landmark recording")
+
+    if header["version"] != RECORDING_VERSION or header["record_size"] != RECORD_DTYPE.itemsize:
+        raise ValueError(
+            f"{path} has unsupported version {header['version']} (record size {header['record_size']}), "
+            f"expected version {RECORDING_VERSION} (record size {RECORD_DTYPE.itemsize})"
+        )
+
+
+class LandmarkRecorder:
+    """A class for recording hand tracking data to an append-only binary file.
+
+    The file consists of a header and fixed-width records of `RECORD_DTYPE`: timestamp in nanoseconds,
+    confidence, hand code (see `HAND_CODES`) and (21, 3) float32 landmarks. Records are buffered and
+    appended in blocks. An incomplete trailing record (e.g. after a crash) is truncated on open, with a warning,
+    so that the appended records stay aligned.
+    """
+
+    def __init__(self, path: str | Path, buffer_size: int = 256) -> None:
+        """Initializes the LandmarkRecorder and opens the file for appending.
+
+        Args:
+            path (str | Path): Path to the recording file, created if it does not exist.
+            buffer_size (int): Number of records buffered before they are written. Default is 256.
+
+        Raises:
+            ValueError: If an existing file is not a compatible recording.
+
+        Warns:
+            RuntimeWarning: If an incomplete trailing record is truncated.
+        """
+        self._path: Path = Path(path)
+        self._buffer: np.ndarray = np.zeros(max(buffer_size, 1), dtype=RECORD_DTYPE)
+        self._buffered: int = 0
+        self._records: int = 0
+
+        self._file: BinaryIO = open(self._path, "a+b")
+
+        try:
+            self._open()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def _open(self) -> None:
+        """Writes the header of a new file, or validates the header of an existing file."""
+        self._file.seek(0)
+        size: int = os.fstat(self._file.fileno()).st_size
+
+        if size == 0:
+            header: np.ndarray = np.array(
+                [(RECORDING_MAGIC, RECORDING_VERSION, RECORD_DTYPE.itemsize)], dtype=HEADER_DTYPE
+            )
+            self._file.write(header.tobytes())
+            self._file.flush()
+            return
+
+        _read_header(self._file, self._path)
+        self._records, partial_size = divmod(size - HEADER_DTYPE.itemsize, RECORD_DTYPE.itemsize)
+
+        if partial_size:
+            warnings.warn(
+                f"{self._path} ends with an incomplete record ({partial_size} of {RECORD_DTYPE.itemsize} bytes), "
+                f"truncating it before appending",
+                RuntimeWarning,
+                stacklevel=3
+            )
+            self._file.truncate(HEADER_DTYPE.itemsize + self._records * RECORD_DTYPE.itemsize)
+
+    def write(self, hand_type: HandType, data: HandTrackingData) -> bool:
+        """Records hand tracking data of a hand.
+
+        Args:
+            hand_type (HandType): The hand type.
+            data (HandTrackingData): The hand tracking data.
+
+        Returns:
+            bool: True if the data was recorded, False if no hand was detected.
+        """
+        if not data.is_hand_detected or data.keypoints is None:
+            return False
+
+        record: np.ndarray = self._buffer[self._buffered]
+        # Tracking data timestamps are in milliseconds
+        record["timestamp_ns"] = (data.timestamp_ns or 0) * NS_PER_MS
+        record["hand"] = HAND_CODES[hand_type]
+        record["confidence"] = data.hand_confidence or 0.0
+        record["landmarks"] = data.keypoints.array
+        self._buffered += 1
+
+        if self._buffered == len(self._buffer):
+            self.flush()
+
+        return True
+
+    def write_hands(self, *hands: Hand) -> int:
+        """Records hand tracking data of hands.
+
+        Args:
+            *hands (Hand): The hands.
+
+        Returns:
+            int: Number of recorded hands.
+        """
+        return sum(self.write(hand.type, hand.data) for hand in hands if hand.data is not None)
+
+    def flush(self) -> None:
+        """Writes the buffered records to the file."""
+        if self._buffered:
+            self._file.write(self._buffer[:self._buffered].tobytes())
+            self._records += self._buffered
+            self._buffered = 0
+
+        self._file.flush()
+
+    def close(self) -> None:
+        """Writes the buffered records and closes the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    @property
+    def path(self) -> Path:
+        """Gets the path to the recording file.
+
+        Returns:
+            Path: The path.
+        """
+        return self._path
+
+    def __len__(self) -> int:
+        return self._records + self._buffered
+
+    def __enter__(self) -> "LandmarkRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class LandmarkRecording:
+    """A class for reading a landmark recording through a read-only memory map.
+
+    Columns are zero-copy NumPy views into the file. An incomplete trailing record (e.g. written
+    by a recorder which is still running) is ignored.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initializes the LandmarkRecording.
+
+        Args:
+            path (str | Path): Path to the recording file.
+
+        Raises:
+            ValueError: If the file is not a compatible recording.
+        """
+        self._path: Path = Path(path)
+
+        with open(self._path, "rb") as file:
+            _read_header(file, self._path)
+            size: int = os.fstat(file.fileno()).st_size
+
+        count: int = (size - HEADER_DTYPE.itemsize) // RECORD_DTYPE.itemsize
+        self._records: np.ndarray = (
+            np.memmap(self._path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_DTYPE.itemsize, shape=(count,))
+            if count else np.zeros(0, dtype=RECORD_DTYPE)
+        )
+
+    @property
+    def records(self) -> np.ndarray:
+        """Gets all records.
+
+        Returns:
+            np.ndarray: Records of `RECORD_DTYPE`.
+        """
+        return self._records
+
+    @property
+    def timestamp_ns(self) -> np.ndarray:
+        """Gets the timestamps.
+
+        Returns:
+            np.ndarray: The int64 timestamps in nanoseconds, shape (n,).
+        """
+        return self._records["timestamp_ns"]
+
+    @property
+    def hand(self) -> np.ndarray:
+        """Gets the hand codes (see `HAND_CODES`).
+
+        Returns:
+            np.ndarray: The uint8 hand codes, shape (n,).
+        """
+        return self._records["hand"]
+
+    @property
+    def confidence(self) -> np.ndarray:
+        """Gets the hand confidences.
+
+        Returns:
+            np.ndarray: The float32 confidences, shape (n,).
+        """
+        return self._records["confidence"]
+
+    @property
+    def landmarks(self) -> np.ndarray:
+        """Gets the landmarks.
+
+        Returns:
+            np.ndarray: The float32 landmarks, shape (n, 21, 3).
+        """
+        return self._records["landmarks"]
+
+    def select(self, hand_type: HandType) -> np.ndarray:
+        """Selects the records of a hand (a copy, as the records of a hand are not contiguous).
+
+        Args:
+            hand_type (HandType): The hand type.
+
+        Returns:
+            np.ndarray: Records of `RECORD_DTYPE`.
+        """
+        return self._records[self.hand == HAND_CODES[hand_type]]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index: int | slice) -> np.ndarray:
+        return self._records[index]
@@ -0,0 +1,174 @@
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass
+class InferenceDecision:
+    """A class representing a decision of the inference scheduler for a single frame.
+
+    Attributes:
+        frame_index (int): Index of the frame the decision is made for.
+        run_inference (bool): Whether to run inference on the frame (otherwise landmarks are extrapolated).
+        scale (float): Scale of the inference input relative to the frame resolution.
+        skip_interval (int): Inference runs on every `skip_interval`-th frame.
+        inference_ms (float | None): Measured inference time, or None if inference did not run.
+    """
+
+    frame_index: int
+    run_inference: bool
+    scale: float
+    skip_interval: int
+    inference_ms: float | None = None
+
+
+class InferenceScheduler:
+    """A load-adaptive scheduler for the hand tracking inference.
+
+    The scheduler keeps the amortized inference time per frame (smoothed inference time divided by
+    the skip interval) within the frame budget. When over budget it first lowers the inference resolution
+    down to `min_scale` and then runs inference on every k-th frame only, up to `max_skip_interval`.
+    When there is enough headroom it restores the frame rate first and then the resolution.
+    """
+
+    def __init__(
+        self,
+        frame_budget_ms: float = 33.3,
+        min_scale: float = 0.5,
+        scale_step: float = 0.1,
+        max_skip_interval: int = 4,
+        headroom: float = 0.7,
+        smoothing: float = 0.2,
+        min_samples: int = 5,
+        history_size: int = 300
+    ) -> None:
+        """Initializes the InferenceScheduler.
+
+        Args:
+            frame_budget_ms (float): Target hand tracking time per frame in milliseconds. Default is 33.3 (30 FPS).
+            min_scale (float): Minimum scale of the inference input. Default is 0.5.
+            scale_step (float): Scale change per adaptation step. Default is 0.1.
+            max_skip_interval (int): Maximum number of frames per inference run. Default is 4.
+            headroom (float): Quality is restored only when the expected cost is below `headroom * frame_budget_ms`.
+                Default is 0.7.
+            smoothing (float): Exponential smoothing factor of the measured inference time. Default is 0.2.
+            min_samples (int): Minimum number of inference runs between adaptation steps. Default is 5.
+            history_size (int): Number of recent decisions to keep. Default is 300.
+        """
+        self._frame_budget_ms: float = frame_budget_ms
+        self._min_scale: float = min_scale
+        self._scale_step: float = scale_step
+        self._max_skip_interval: int = max_skip_interval
+        self._headroom: float = headroom
+        self._smoothing: float = smoothing
+        self._min_samples: int = min_samples
+
+        self._scale: float = 1.0
+        self._skip_interval: int = 1
+        self._inference_ms: float | None = None
+        self._samples: int = 0
+        self._frame_index: int = 0
+        self._frames_since_inference: int = 0
+        self._inference_frames: int = 0
+        self._decisions: deque[InferenceDecision] = deque(maxlen=history_size)
+
+    def decide(self) -> InferenceDecision:
+        """Makes the decision for the next frame.
+
+        Returns:
+            InferenceDecision: The decision.
+        """
+        run_inference: bool = self._frame_index == 0 or self._frames_since_inference + 1 >= self._skip_interval
+        decision: InferenceDecision = InferenceDecision(
+            frame_index=self._frame_index,
+            run_inference=run_inference,
+            scale=self._scale,
+            skip_interval=self._skip_interval
+        )
+
+        self._frame_index += 1
+        self._frames_since_inference = 0 if run_inference else self._frames_since_inference + 1
+        self._decisions.append(decision)
+
+        return decision
+
+    def record(self, decision: InferenceDecision, inference_ms: float) -> None:
+        """Records the measured inference time of a decision and adapts the schedule.
+
+        Args:
+            decision (InferenceDecision): The decision inference ran for.
+            inference_ms (float): The inference time in milliseconds.
+        """
+        decision.inference_ms = inference_ms
+        self._inference_frames += 1
+        self._samples += 1
+
+        if self._inference_ms is None:
+            self._inference_ms = inference_ms
+        else:
+            self._inference_ms += self._smoothing * (inference_ms - self._inference_ms)
+
+        if self._samples >= self._min_samples:
+            self._adapt()
+
+    @property
+    def last_decision(self) -> InferenceDecision | None:
+        """Gets the last decision.
+
+        Returns:
+            InferenceDecision | None: The last decision, or None if no decision was made yet.
+        """
+        return self._decisions[-1] if self._decisions else None
+
+    @property
+    def decisions(self) -> list[InferenceDecision]:
+        """Gets the recent decisions.
+
+        Returns:
+            list[InferenceDecision]: Up to `history_size` recent decisions, oldest first.
+        """
+        return list(self._decisions)
+
+    def summary(self) -> dict[str, float | int | None]:
+        """Gets the summary of the scheduler state.
+
+        Returns:
+            dict[str, float | int | None]: Frames count, inference frames count, current scale and skip interval,
+                smoothed inference time and amortized inference time per frame (in milliseconds).
+        """
+        return {
+            "frames": self._frame_index,
+            "inference_frames": self._inference_frames,
+            "scale": self._scale,
+            "skip_interval": self._skip_interval,
+            "inference_ms": self._inference_ms,
+            "amortized_ms": None if self._inference_ms is None else self._inference_ms / self._skip_interval
+        }
+
+    def _adapt(self) -> None:
+        """Adapts the inference scale and skip interval to the frame budget."""
+        inference_ms: float | None = self._inference_ms
+
+        if inference_ms is None:
+            return
+
+        amortized_ms: float = inference_ms / self._skip_interval
+        target_ms: float = self._frame_budget_ms * self._headroom
+        scale: float = self._scale
+        skip_interval: int = self._skip_interval
+
+        if amortized_ms > self._frame_budget_ms:
+            if self._scale > self._min_scale:
+                scale = max(self._min_scale, round(self._scale - self._scale_step, 6))
+            elif self._skip_interval < self._max_skip_interval:
+                skip_interval = self._skip_interval + 1
+
+        elif amortized_ms < target_ms:
+            if self._skip_interval > 1 and inference_ms / (self._skip_interval - 1) < target_ms:
+                skip_interval = self._skip_interval - 1
+            elif self._skip_interval == 1 and self._scale < 1.0:
+                scale = min(1.0, round(self._scale + self._scale_step, 6))
+
+        if (scale, skip_interval) != (self._scale, self._skip_interval):
+            self._scale = scale
+            self._skip_interval = skip_interval
+            self._samples = 0
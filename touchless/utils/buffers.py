@@ -0,0 +1,69 @@
+import numpy as np
+
+
+class FrameBufferPool:
+    """A round-robin pool of pre-allocated frame buffers.
+
+    Buffers are handed out in turn, so a buffer returned by `acquire` is not reused
+    until `size - 1` other buffers have been acquired. Buffers which are still in use
+    can be excluded explicitly.
+    """
+
+    def __init__(self, size: int = 3) -> None:
+        """Initializes the FrameBufferPool.
+
+        Args:
+            size (int): Number of buffers in the pool. Default is 3.
+
+        Raises:
+            ValueError: If the size is less than 1.
+        """
+        if size < 1:
+            raise ValueError(f"Buffer pool size must be at least 1, got {size}")
+
+        self._size: int = size
+        self._buffers: list[np.ndarray] = []
+        self._next: int = 0
+
+    def acquire(
+        self,
+        shape: tuple[int, ...],
+        dtype: np.dtype | type = np.uint8,
+        exclude: tuple[np.ndarray | None, ...] = ()
+    ) -> np.ndarray:
+        """Acquires the next buffer of the pool.
+
+        All buffers are (re)allocated when the requested shape or dtype differs from the pooled ones.
+
+        Args:
+            shape (tuple[int, ...]): The buffer shape, e.g. (height, width, 3).
+            dtype (np.dtype | type): The buffer data type. Default is np.uint8.
+            exclude (tuple[np.ndarray | None, ...]): Buffers which are in use and must not be acquired. Default is ().
+
+        Returns:
+            np.ndarray: The buffer (its content is undefined).
+
+        Raises:
+            RuntimeError: If all buffers of the pool are excluded.
+        """
+        if not self._buffers or self._buffers[0].shape != tuple(shape) or self._buffers[0].dtype != dtype:
+            self._buffers = [np.empty(shape, dtype=dtype) for _ in range(self._size)]
+            self._next = 0
+
+        for _ in range(self._size):
+            buffer: np.ndarray = self._buffers[self._next]
+            self._next = (self._next + 1) % self._size
+
+            if not any(buffer is excluded for excluded in exclude):
+                return buffer
+
+        raise RuntimeError("All buffers of the pool are in use")
+
+    @property
+    def size(self) -> int:
+        """Gets the number of buffers in the pool.
+
+        Returns:
+            int: The pool size.
+        """
+        return self._size
@@ -0,0 +1,252 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import overload
+
+import cv2
+import numpy as np
+
+
+# Optional drawing arguments of cv2.circle and cv2.rectangle and their OpenCV defaults
+DRAW_DEFAULTS: dict[str, int] = {"thickness": 1, "lineType": cv2.LINE_8, "shift": 0}
+
+
+class CompiledShape(ABC):
+    """A base class for shapes compiled from the `SHAPES` dict format.
+
+    Drawing arguments of the default and selected states are merged once, into positional argument tuples
+    of the OpenCV drawing function, so drawing and hit-testing do not allocate per frame. The hit-testing
+    geometry is also kept as a row of `PackedShapes` (see `CompiledShapes`).
+    """
+
+    __slots__ = ("name", "default_args", "selected_args", "geometry")
+
+    # Set by subclasses
+    type: str
+    draw_function: Callable
+    geometry_args: tuple[str, ...]
+    geometry: tuple[float, float, float, float]
+
+    def __init__(self, name: str, default_args: tuple, selected_args: tuple) -> None:
+        """Initializes the CompiledShape.
+
+        Args:
+            name (str): The shape name.
+            default_args (tuple): Positional arguments of the drawing function (after the frame) in the default state.
+            selected_args (tuple): Positional arguments of the drawing function in the selected state.
+        """
+        self.name: str = name
+        self.default_args: tuple = default_args
+        self.selected_args: tuple = selected_args
+
+    @abstractmethod
+    def is_selected(self, pointer: tuple[int, int] | None) -> bool:
+        """Check if the shape is selected.
+
+        Args:
+            pointer (tuple[int, int] | None): Coordinates of the pointer.
+
+        Returns:
+            bool: True if the shape is selected, otherwise False.
+        """
+
+    def draw(self, frame: np.ndarray, is_selected: bool = False) -> None:
+        """Draw (render) the shape.
+
+        Args:
+            frame (np.ndarray): Frame which shape draw on.
+            is_selected (bool): Whether to draw the shape in the selected state. Default is False.
+        """
+        self.draw_function(frame, *(self.selected_args if is_selected else self.default_args))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r}, default_args={self.default_args}, selected_args={self.selected_args})"
+
+
+class CompiledCircle(CompiledShape):
+    """A class representing a compiled circle."""
+
+    __slots__ = ("cx", "cy", "radius_sq")
+
+    type = "circle"
+    draw_function = staticmethod(cv2.circle)
+    geometry_args = ("center", "radius")
+
+    def __init__(self, name: str, default_args: tuple, selected_args: tuple) -> None:
+        """Initializes the CompiledCircle.
+
+        Args:
+            name (str): The shape name.
+            default_args (tuple): Arguments (center, radius, color, thickness, lineType, shift) in the default state.
+            selected_args (tuple): Arguments in the selected state.
+        """
+        super().__init__(name, default_args, selected_args)
+        (self.cx, self.cy), radius = default_args[:2]
+        self.radius_sq: int = radius ** 2
+        self.geometry = (self.cx, self.cy, radius, 0)
+
+    def is_selected(self, pointer: tuple[int, int] | None) -> bool:
+        if pointer is None:
+            return False
+        return (self.cx - pointer[0]) ** 2 + (self.cy - pointer[1]) ** 2 <= self.radius_sq
+
+
+class CompiledRectangle(CompiledShape):
+    """A class representing a compiled rectangle."""
+
+    __slots__ = ("x1", "y1", "x2", "y2")
+
+    type = "rectangle"
+    draw_function = staticmethod(cv2.rectangle)
+    geometry_args = ("pt1", "pt2")
+
+    def __init__(self, name: str, default_args: tuple, selected_args: tuple) -> None:
+        """Initializes the CompiledRectangle.
+
+        Args:
+            name (str): The shape name.
+            default_args (tuple): Arguments (pt1, pt2, color, thickness, lineType, shift) in the default state.
+            selected_args (tuple): Arguments in the selected state.
+        """
+        super().__init__(name, default_args, selected_args)
+        (self.x1, self.y1), (self.x2, self.y2) = default_args[:2]
+        self.geometry = (self.x1, self.y1, self.x2, self.y2)
+
+    def is_selected(self, pointer: tuple[int, int] | None) -> bool:
+        if pointer is None:
+            return False
+        return self.x1 <= pointer[0] <= self.x2 and self.y1 <= pointer[1] <= self.y2
+
+
+COMPILED_SHAPES: dict[str, type[CompiledShape]] = {
+    "circle": CompiledCircle,
+    "rectangle": CompiledRectangle
+}
+
+
+class CompiledShapes(Sequence[CompiledShape]):
+    """A class representing an immutable sequence of compiled shapes with their geometry packed for batch hit-testing.
+
+    The geometry rows of the shapes (see `CompiledShape.geometry`) are stacked once into the arrays
+    used by `PackedShapes`, so many pointers are hit-tested without packing the shapes per frame.
+    """
+
+    __slots__ = ("_shapes", "_geometry", "_is_circle")
+
+    def __init__(self, shapes: Iterable[CompiledShape] = ()) -> None:
+        """Initializes the CompiledShapes.
+
+        Args:
+            shapes (Iterable[CompiledShape]): The compiled shapes. Default is () (no shapes).
+        """
+        self._shapes: tuple[CompiledShape, ...] = tuple(shapes)
+        self._geometry: np.ndarray = np.array(
+            [shape.geometry for shape in self._shapes], dtype=np.float64
+        ).reshape(len(self._shapes), 4)
+        self._is_circle: np.ndarray = np.array([shape.type == "circle" for shape in self._shapes], dtype=bool)
+
+    @property
+    def geometry(self) -> np.ndarray:
+        """Gets the packed geometry of the shapes.
+
+        Returns:
+            np.ndarray: The float64 geometry rows of shape (n_shapes, 4).
+        """
+        return self._geometry
+
+    @property
+    def is_circle(self) -> np.ndarray:
+        """Gets the circle mask of the shapes.
+
+        Returns:
+            np.ndarray: Boolean mask of shape (n_shapes,), True for circles and False for rectangles.
+        """
+        return self._is_circle
+
+    @overload
+    def __getitem__(self, index: int) -> CompiledShape: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CompiledShapes": ...
+
+    def __getitem__(self, index: int | slice) -> "CompiledShape | CompiledShapes":
+        if isinstance(index, slice):
+            return CompiledShapes(self._shapes[index])
+        return self._shapes[index]
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def __iter__(self) -> Iterator[CompiledShape]:
+        return iter(self._shapes)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._shapes)})"
+
+
+def _to_args(shape_class: type[CompiledShape], params: dict, name: str) -> tuple:
+    """Convert drawing keyword arguments of a shape to positional arguments.
+
+    Args:
+        shape_class (type[CompiledShape]): The compiled shape class.
+        params (dict): The drawing keyword arguments.
+        name (str): The shape name (for error messages).
+
+    Returns:
+        tuple: The positional arguments of the drawing function (after the frame).
+
+    Raises:
+        ValueError: If arguments are missing or unknown.
+    """
+    arg_names: tuple[str, ...] = (*shape_class.geometry_args, "color", *DRAW_DEFAULTS)
+
+    unknown: set[str] = params.keys() - set(arg_names)
+    if unknown:
+        raise ValueError(f"Unknown parameters of shape {name!r}: {', '.join(sorted(unknown))}")
+
+    missing: list[str] = [arg for arg in arg_names if arg not in params and arg not in DRAW_DEFAULTS]
+    if missing:
+        raise ValueError(f"Missing parameters of shape {name!r}: {', '.join(missing)}")
+
+    return tuple(params.get(arg, DRAW_DEFAULTS.get(arg)) for arg in arg_names)
+
+
+def compile_shape(shape: dict) -> CompiledShape:
+    """Compile a shape definition of the `SHAPES` format.
+
+    Args:
+        shape (dict): Shape object definition.
+
+    Returns:
+        CompiledShape: The compiled shape.
+
+    Raises:
+        ValueError: If the shape type is not supported or its parameters are invalid.
+    """
+
+    shape_class: type[CompiledShape] | None = COMPILED_SHAPES.get(shape["type"])
+    name: str = shape.get("name", "")
+
+    if shape_class is None:
+        raise ValueError(f"Unsupported shape type: {shape['type']}")
+
+    default_params: dict = shape["params"]["default"]
+    selected_params: dict = {**default_params, **shape["params"].get("on_select", {})}
+
+    return shape_class(
+        name,
+        _to_args(shape_class, default_params, name),
+        _to_args(shape_class, selected_params, name)
+    )
+
+
+def compile_shapes(shapes: Iterable[dict]) -> CompiledShapes:
+    """Compile shape definitions of the `SHAPES` format (e.g. `SHAPES`).
+
+    Args:
+        shapes (Iterable[dict]): Shapes definitions.
+
+    Returns:
+        CompiledShapes: The compiled shapes, in the same order.
+    """
+
+    return CompiledShapes(compile_shape(shape) for shape in shapes)
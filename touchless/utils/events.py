@@ -1,4 +1,8 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
+
+import numpy as np
+
+from touchless.utils.compiled_shapes import CompiledShapes
 
 
 def is_circle_selected(circle: dict, pointer: tuple[int, int]) -> bool:
@@ -63,3 +67,125 @@ def is_shape_selected(shape: dict, pointer: tuple[int, int] | None) -> bool:
         return False
 
     return IS_SELECTED[shape["type"]](shape, pointer)
+
+
+def pack_circle(circle: dict) -> tuple[float, float, float, float]:
+    """Pack circle geometry into a row of `PackedShapes`.
+
+    Args:
+        circle (dict): Circle object definition.
+
+    Returns:
+        tuple[float, float, float, float]: The center coordinates, radius and 0.
+    """
+
+    params: dict = circle["params"]["default"]
+    cx, cy = params["center"]
+
+    return cx, cy, params["radius"], 0
+
+
+def pack_rectangle(rectangle: dict) -> tuple[float, float, float, float]:
+    """Pack rectangle geometry into a row of `PackedShapes`.
+
+    Args:
+        rectangle (dict): Rectangle object definition.
+
+    Returns:
+        tuple[float, float, float, float]: The corner coordinates (x1, y1, x2, y2).
+    """
+
+    params: dict = rectangle["params"]["default"]
+    x1, y1 = params["pt1"]
+    x2, y2 = params["pt2"]
+
+    return x1, y1, x2, y2
+
+
+PACK_SHAPE: dict[str, Callable] = {
+    "circle": pack_circle,
+    "rectangle": pack_rectangle
+}
+
+
+class PackedShapes:
+    """A class representing geometry of shapes packed into NumPy arrays for batch hit-testing.
+
+    Each shape is a row of a (n_shapes, 4) array (see `PACK_SHAPE`), so many pointers are tested against
+    all shapes with a few array operations instead of a Python call per pointer and shape. Selection follows
+    `is_circle_selected` and `is_rectangle_selected`. The geometry is a snapshot: pack the shapes again after
+    they change. Compiled shapes are packed once, when compiled (see `CompiledShapes`), and used as is.
+    """
+
+    def __init__(self, shapes: Sequence[dict] | CompiledShapes) -> None:
+        """Initializes the PackedShapes.
+
+        Args:
+            shapes (Sequence[dict] | CompiledShapes): Shapes definitions, or compiled shapes.
+
+        Raises:
+            ValueError: If a shape type is not supported.
+        """
+        if isinstance(shapes, CompiledShapes):
+            self._geometry: np.ndarray = shapes.geometry
+            self._is_circle: np.ndarray = shapes.is_circle
+            return
+
+        for shape_type in {shape["type"] for shape in shapes} - PACK_SHAPE.keys():
+            raise ValueError(f"Unsupported shape type: {shape_type}")
+
+        self._geometry = np.array(
+            [PACK_SHAPE[shape["type"]](shape) for shape in shapes], dtype=np.float64
+        ).reshape(len(shapes), 4)
+        self._is_circle = np.array([shape["type"] == "circle" for shape in shapes], dtype=bool)
+
+    def select(self, pointers: Iterable[tuple[int, int] | None] | np.ndarray) -> np.ndarray:
+        """Check which shapes are selected by each pointer.
+
+        Args:
+            pointers (Iterable[tuple[int, int] | None] | np.ndarray): Coordinates of the pointers,
+                or an array of shape (n_pointers, 2). None pointers select nothing.
+
+        Returns:
+            np.ndarray: Boolean selection mask of shape (n_pointers, n_shapes).
+        """
+
+        if isinstance(pointers, np.ndarray):
+            points: np.ndarray = pointers.astype(np.float64, copy=False).reshape(-1, 2)
+            is_valid: np.ndarray = np.ones(len(points), dtype=bool)
+        else:
+            pointers = list(pointers)
+            is_valid = np.array([pointer is not None for pointer in pointers], dtype=bool)
+            points = np.array(
+                [pointer if pointer is not None else (0, 0) for pointer in pointers], dtype=np.float64
+            ).reshape(-1, 2)
+
+        px: np.ndarray = points[:, 0:1]
+        py: np.ndarray = points[:, 1:2]
+        x1, y1, x2, y2 = self._geometry.T
+
+        # Circles store (cx, cy, radius, 0) in (x1, y1, x2, y2)
+        in_circle: np.ndarray = (x1 - px) ** 2 + (y1 - py) ** 2 <= x2 ** 2
+        in_rectangle: np.ndarray = (x1 <= px) & (px <= x2) & (y1 <= py) & (py <= y2)
+
+        return np.where(self._is_circle, in_circle, in_rectangle) & is_valid[:, None]
+
+    def __len__(self) -> int:
+        return len(self._geometry)
+
+
+def select_shapes(
+    shapes: Sequence[dict] | CompiledShapes,
+    pointers: Iterable[tuple[int, int] | None] | np.ndarray
+) -> np.ndarray:
+    """Check which shapes are selected by each pointer (see `PackedShapes`).
+
+    Args:
+        shapes (Sequence[dict] | CompiledShapes): Shapes definitions, or compiled shapes.
+        pointers (Iterable[tuple[int, int] | None] | np.ndarray): Coordinates of the pointers.
+
+    Returns:
+        np.ndarray: Boolean selection mask of shape (n_pointers, n_shapes).
+    """
+
+    return PackedShapes(shapes).select(pointers)
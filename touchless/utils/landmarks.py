@@ -1,8 +1,9 @@
+from collections.abc import Mapping
 from typing import NamedTuple
 
 from google.protobuf.internal.containers import RepeatedCompositeFieldContainer
 from mediapipe.python.solutions.hands import HandLandmark
-from pydantic import BaseModel, Field
+import numpy as np
 from pydantic.dataclasses import dataclass
 
 
@@ -14,29 +15,156 @@ class Point:
     z: float
 
 
-class HandLandmarkPoints(BaseModel):
-    """A class representing landmarks of a hand."""
-    wrist: Point = Field(alias="WRIST")
-    thumb_cmc: Point = Field(alias="THUMB_CMC")
-    thumb_mcp: Point = Field(alias="THUMB_MCP")
-    thumb_ip: Point = Field(alias="THUMB_IP")
-    thumb_tip: Point = Field(alias="THUMB_TIP")
-    index_mcp: Point = Field(alias="INDEX_FINGER_MCP")
-    index_pip: Point = Field(alias="INDEX_FINGER_PIP")
-    index_dip: Point = Field(alias="INDEX_FINGER_DIP")
-    index_tip: Point = Field(alias="INDEX_FINGER_TIP")
-    middle_mcp: Point = Field(alias="MIDDLE_FINGER_MCP")
-    middle_pip: Point = Field(alias="MIDDLE_FINGER_PIP")
-    middle_dip: Point = Field(alias="MIDDLE_FINGER_DIP")
-    middle_tip: Point = Field(alias="MIDDLE_FINGER_TIP")
-    ring_mcp: Point = Field(alias="RING_FINGER_MCP")
-    ring_pip: Point = Field(alias="RING_FINGER_PIP")
-    ring_dip: Point = Field(alias="RING_FINGER_DIP")
-    ring_tip: Point = Field(alias="RING_FINGER_TIP")
-    pinky_mcp: Point = Field(alias="PINKY_MCP")
-    pinky_pip: Point = Field(alias="PINKY_PIP")
-    pinky_dip: Point = Field(alias="PINKY_DIP")
-    pinky_tip: Point = Field(alias="PINKY_TIP")
+class _LandmarkCoordinates(NamedTuple):
+    x: float
+    y: float
+    z: float
+
+
+class LandmarkPoint(_LandmarkCoordinates):
+    """A read-only landmark point of HandLandmarkPoints with Python float coordinates (x, y, z)."""
+
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, tuple):
+            return tuple.__eq__(self, other)
+        if isinstance(other, Point):
+            return (self.x, self.y, self.z) == (other.x, other.y, other.z)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return tuple.__hash__(self)
+
+
+LANDMARKS_SHAPE: tuple[int, int] = (len(HandLandmark), 3)
+
+# Attribute names of the landmarks ordered as `HandLandmark` (e.g. INDEX_FINGER_TIP -> "index_tip")
+LANDMARK_NAMES: tuple[str, ...] = tuple(landmark.name.lower().replace("_finger", "") for landmark in HandLandmark)
+
+_LANDMARK_INDICES: dict[str, int] = {name: index for index, name in enumerate(LANDMARK_NAMES)}
+
+_LANDMARK_INDICES_BY_NAME: dict[str, int] = {
+    **_LANDMARK_INDICES,
+    **{landmark.name: landmark.value for landmark in HandLandmark}
+}
+
+
+class HandLandmarkPoints:
+    """A class representing landmarks of a hand.
+
+    Landmarks are stored in a single (21, 3) float32 array ordered as `HandLandmark`.
+    Named attributes (e.g. `points.index_tip.x`) are LandmarkPoint tuples of Python floats, created together
+    on first access from the array converted once with `tolist`. The array is made read-only at that point,
+    so that the cached values cannot go stale (write to it, e.g. to transform landmarks, before accessing them).
+    """
+
+    __slots__ = ("_array", "_rows", "__dict__")
+
+    def __init__(self, array: np.ndarray) -> None:
+        """Initializes HandLandmarkPoints.
+
+        Args:
+            array (np.ndarray): Landmark coordinates of shape (21, 3). A float32 array is used
+                as is (no copy), other arrays are converted to float32.
+
+        Raises:
+            ValueError: If the array shape is not (21, 3).
+        """
+        array = np.asarray(array, dtype=np.float32)
+
+        if array.shape != LANDMARKS_SHAPE:
+            raise ValueError(f"Expected landmarks array of shape {LANDMARKS_SHAPE}, got {array.shape}")
+
+        self._array: np.ndarray = array
+        self._rows: list[list[float]] | None = None
+
+    def __getattr__(self, name: str) -> LandmarkPoint:
+        # Called only before the landmark points are created, which creates all of them at once
+        if name not in _LANDMARK_INDICES:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        self.__dict__.update(zip(LANDMARK_NAMES, map(LandmarkPoint._make, self.rows)))
+        return self.__dict__[name]
+
+    @classmethod
+    def from_landmarks(cls, landmarks: RepeatedCompositeFieldContainer) -> "HandLandmarkPoints":
+        """Creates HandLandmarkPoints from MediaPipe hand landmarks.
+
+        Args:
+            landmarks (RepeatedCompositeFieldContainer): The `landmark` field of MediaPipe `NormalizedLandmarkList`.
+
+        Returns:
+            HandLandmarkPoints: The hand landmark points.
+        """
+        array: np.ndarray = np.array([(lm.x, lm.y, lm.z) for lm in landmarks], dtype=np.float32)
+        return cls(array)
+
+    @classmethod
+    def from_points(cls, points: Mapping[str, Point | LandmarkPoint]) -> "HandLandmarkPoints":
+        """Creates HandLandmarkPoints from named points.
+
+        Args:
+            points (Mapping[str, Point | LandmarkPoint]): Points by landmark name, either attribute names
+                (e.g. "index_tip") or `HandLandmark` names (e.g. "INDEX_FINGER_TIP").
+
+        Returns:
+            HandLandmarkPoints: The hand landmark points.
+
+        Raises:
+            ValueError: If some landmarks are missing or unknown.
+        """
+        array: np.ndarray = np.empty(LANDMARKS_SHAPE, dtype=np.float32)
+        filled: set[int] = set()
+
+        for name, point in points.items():
+            index: int | None = _LANDMARK_INDICES_BY_NAME.get(name)
+            if index is None:
+                raise ValueError(f"Unknown landmark: {name}")
+            array[index] = (point.x, point.y, point.z)
+            filled.add(index)
+
+        if len(filled) != LANDMARKS_SHAPE[0]:
+            missing: list[str] = [name for i, name in enumerate(LANDMARK_NAMES) if i not in filled]
+            raise ValueError(f"Missing landmarks: {', '.join(missing)}")
+
+        return cls(array)
+
+    @property
+    def array(self) -> np.ndarray:
+        """Gets the underlying landmarks array.
+
+        Returns:
+            np.ndarray: The (21, 3) float32 array of landmark coordinates (not a copy), read-only once
+                the landmarks have been accessed as Python floats.
+        """
+        return self._array
+
+    @property
+    def rows(self) -> list[list[float]]:
+        """Gets the landmark coordinates as Python floats, converted from the array once.
+
+        Returns:
+            list[list[float]]: The 21 landmark coordinates [x, y, z] ordered as `HandLandmark`.
+        """
+        rows: list[list[float]] | None = self._rows
+        if rows is None:
+            rows = self._rows = self._array.tolist()
+            self._array.flags.writeable = False
+        return rows
+
+    def __array__(self, dtype: np.dtype | None = None, copy: bool | None = None) -> np.ndarray:
+        if dtype is None or np.dtype(dtype) == self._array.dtype:
+            return self._array.copy() if copy else self._array
+        return self._array.astype(dtype)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HandLandmarkPoints):
+            return bool(np.array_equal(self._array, other._array))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"HandLandmarkPoints({self._array.tolist()})"
 
 
 def get_pointer(points: HandLandmarkPoints | None, img_size: tuple[int, int]) -> tuple[int, int] | None:
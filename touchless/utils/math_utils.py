@@ -1,5 +1,12 @@
 import math
 
+import numpy as np
+
+
+# Coefficients of the approximation dist = k / area + b of `dist_from_triangle_0_5_17_to_camera`
+TRIANGLE_0_5_17_DIST_K: float = 103703.3834876518
+TRIANGLE_0_5_17_DIST_B: float = 15.012570158084339
+
 
 def angle_between_vectors(
     v1: tuple[int, int],
@@ -84,8 +91,122 @@ def dist_from_triangle_0_5_17_to_camera(area: float, accuracy: int = 3) -> float
         float: Distance to camera.
     """
 
-    k: float = 103703.3834876518
-    b: float = 15.012570158084339
+    k: float = TRIANGLE_0_5_17_DIST_K
+    b: float = TRIANGLE_0_5_17_DIST_B
     dist: float = round(k / area + b, accuracy)
 
     return dist
+
+
+def _round(values: np.ndarray, accuracy: int | None) -> np.ndarray:
+    """Round array values if the accuracy is given.
+
+    Args:
+        values (np.ndarray): The values.
+        accuracy (int | None): The number of decimal places, or None to keep the values as is.
+
+    Returns:
+        np.ndarray: The (rounded) values.
+    """
+
+    return values if accuracy is None else np.round(values, accuracy)
+
+
+def angle_between_vectors_batch(
+    v1: np.ndarray,
+    v2: np.ndarray,
+    in_degrees: bool = True,
+    accuracy: int | None = None
+) -> np.ndarray:
+    """Calculate the angles between pairs of vectors (array counterpart of `angle_between_vectors`).
+
+    Args:
+        v1 (np.ndarray): The first vectors of shape (N, 2) or (N, 3), or a single vector broadcast to all pairs.
+        v2 (np.ndarray): The second vectors, of the same or a broadcastable shape.
+        in_degrees (bool, optional): Whether to return the angles in degrees. Defaults to True.
+        accuracy (int | None, optional): The number of decimal places for rounding the results,
+            or None not to round. Defaults to None.
+
+    Returns:
+        np.ndarray: The angles of shape (N,), NaN for zero-length vectors.
+    """
+
+    v1 = np.asarray(v1, dtype=np.float64)
+    v2 = np.asarray(v2, dtype=np.float64)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cos: np.ndarray = np.einsum("...i,...i->...", v1, v2) / (np.linalg.norm(v1, axis=-1) * np.linalg.norm(v2, axis=-1))
+    # Clip rounding errors of (anti)parallel vectors, NaN stays NaN
+    angle: np.ndarray = np.arccos(np.clip(cos, -1.0, 1.0))
+
+    if in_degrees:
+        angle = np.degrees(angle)
+
+    return _round(angle, accuracy)
+
+
+def euclidean_batch(pts1: np.ndarray, pts2: np.ndarray, accuracy: int | None = None) -> np.ndarray:
+    """Calculate the Euclidean distances between pairs of points (array counterpart of `euclidean`).
+
+    Args:
+        pts1 (np.ndarray): The first points of shape (N, 2) or (N, 3). Distances are computed over all coordinates,
+            pass `[:, :2]` slices of 3D points for distances in the (x, y) plane as `euclidean`.
+        pts2 (np.ndarray): The second points, of the same or a broadcastable shape.
+        accuracy (int | None, optional): The number of decimal places for rounding the results,
+            or None not to round. Defaults to None.
+
+    Returns:
+        np.ndarray: The distances of shape (N,).
+    """
+
+    diff: np.ndarray = np.asarray(pts1, dtype=np.float64) - np.asarray(pts2, dtype=np.float64)
+    return _round(np.sqrt(np.einsum("...i,...i->...", diff, diff)), accuracy)
+
+
+def heron_area_by_points_batch(
+    p1: np.ndarray,
+    p2: np.ndarray,
+    p3: np.ndarray,
+    accuracy: int | None = None
+) -> np.ndarray:
+    """Calculate triangle areas by their vertices using Heron's formula (array counterpart of `heron_area_by_points`).
+
+    Args:
+        p1 (np.ndarray): The first vertices of shape (N, 2) or (N, 3).
+        p2 (np.ndarray): The second vertices.
+        p3 (np.ndarray): The third vertices.
+        accuracy (int | None, optional): The number of decimal places for rounding the results,
+            or None not to round. Defaults to None.
+
+    Returns:
+        np.ndarray: The areas of shape (N,).
+    """
+
+    a: np.ndarray = euclidean_batch(p1, p2)
+    b: np.ndarray = euclidean_batch(p1, p3)
+    c: np.ndarray = euclidean_batch(p2, p3)
+
+    p: np.ndarray = (a + b + c) / 2
+    # Degenerate triangles may get a tiny negative product from rounding errors
+    s: np.ndarray = np.sqrt(np.maximum(p * (p - a) * (p - b) * (p - c), 0.0))
+
+    return _round(s, accuracy)
+
+
+def dist_from_triangle_0_5_17_to_camera_batch(area: np.ndarray, accuracy: int | None = None) -> np.ndarray:
+    """Calculate distances from triangles (wrist, index and pinky fingers MCP) to camera
+    (array counterpart of `dist_from_triangle_0_5_17_to_camera`).
+
+    Args:
+        area (np.ndarray): The triangle areas of shape (N,).
+        accuracy (int | None, optional): The number of decimal places for rounding the results,
+            or None not to round. Defaults to None.
+
+    Returns:
+        np.ndarray: Distances to camera of shape (N,), inf for zero areas.
+    """
+
+    with np.errstate(divide="ignore"):
+        dist: np.ndarray = TRIANGLE_0_5_17_DIST_K / np.asarray(area, dtype=np.float64) + TRIANGLE_0_5_17_DIST_B
+
+    return _round(dist, accuracy)
@@ -0,0 +1,204 @@
+from collections.abc import Sequence
+
+import cv2
+import numpy as np
+
+from touchless.utils.events import PackedShapes
+from touchless.utils.scene import POSITION_PARAMS, SHAPE_BOUNDS
+from touchless.utils.shapes import DRAW_SHAPE
+
+
+def get_shape_extent(shape: dict) -> tuple[int, int, int, int]:
+    """Get the region a shape may cover when drawn, the union of its regions in the default and selected states.
+
+    Args:
+        shape (dict): Shape object definition.
+
+    Returns:
+        tuple[int, int, int, int]: The region (x1, y1, x2, y2), x2 and y2 exclusive.
+    """
+
+    default_params: dict = shape["params"]["default"]
+    regions: list[tuple[int, int, int, int]] = []
+
+    for params in (default_params, {**default_params, **shape["params"].get("on_select", {})}):
+        x1, y1, x2, y2 = SHAPE_BOUNDS[shape["type"]]({"params": {"default": params}})
+        # Lines are centered on the outline, one more pixel for rounding
+        padding: int = max(params.get("thickness", 1), 1) // 2 + 1
+        regions.append((x1 - padding, y1 - padding, x2 + padding + 1, y2 + padding + 1))
+
+    return (
+        min(region[0] for region in regions),
+        min(region[1] for region in regions),
+        max(region[2] for region in regions),
+        max(region[3] for region in regions)
+    )
+
+
+class ShapeOverlay:
+    """A class for rendering shapes (in the `SHAPES` format) as a cached overlay layer.
+
+    All shapes are drawn once into an overlay image and a mask. On every frame only the regions of the shapes whose
+    selection state changed are redrawn (with the other shapes overlapping them, in order), and the overlay is copied
+    onto the frame through the mask in one operation, so the per-frame cost does not grow with the number of shapes.
+    The result is the same as `render_shapes` for opaque shapes without anti-aliasing (`cv2.LINE_AA` edges are
+    blended with black instead of the frame). Shapes are a snapshot: call `invalidate` after they change.
+    """
+
+    def __init__(self, shapes: Sequence[dict], frame_size: tuple[int, int]) -> None:
+        """Initializes the ShapeOverlay.
+
+        Args:
+            shapes (Sequence[dict]): Shapes definitions, drawn in order.
+            frame_size (tuple[int, int]): Frame size (width, height).
+        """
+        self._shapes: Sequence[dict] = shapes
+        self._frame_size: tuple[int, int] = frame_size
+
+        width, height = frame_size
+        self._overlay: np.ndarray = np.zeros((height, width, 3), dtype=np.uint8)
+        self._mask: np.ndarray = np.zeros((height, width), dtype=np.uint8)
+
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Redraws the overlay from the current shapes definitions, all in the default state."""
+        shapes: Sequence[dict] = self._shapes
+
+        self._packed_shapes: PackedShapes = PackedShapes(shapes)
+        self._selected: np.ndarray = np.zeros(len(shapes), dtype=bool)
+        # Merged drawing parameters of each shape in the default and selected states
+        self._params: list[tuple[dict, dict]] = [
+            (shape["params"]["default"].copy(), {**shape["params"]["default"], **shape["params"].get("on_select", {})})
+            for shape in shapes
+        ]
+        self._extents: np.ndarray = np.array([get_shape_extent(shape) for shape in shapes], dtype=np.int64).reshape(-1, 4)
+        self._region: tuple[int, int, int, int] | None = self._clip((
+            *self._extents[:, :2].min(axis=0).tolist(),
+            *self._extents[:, 2:].max(axis=0).tolist()
+        )) if len(shapes) else None
+
+        self._overlay[:] = 0
+        self._mask[:] = 0
+
+        if self._region is not None:
+            self._redraw(self._region)
+
+    def update(self, pointer: tuple[int, int] | list[tuple[int, int] | None] | None) -> list[int]:
+        """Updates selection states of the shapes and redraws the regions of the changed ones.
+
+        Args:
+            pointer (tuple[int, int] | list[tuple[int, int] | None] | None): Pointer coordinates, or a list of pointers
+                selecting the shapes any of them is over.
+
+        Returns:
+            list[int]: Indices of the shapes whose selection state changed.
+        """
+        pointers: list[tuple[int, int] | None] = pointer if isinstance(pointer, list) else [pointer]
+        pointers = [pointer for pointer in pointers if pointer is not None]
+
+        selected: np.ndarray = np.zeros_like(self._selected)
+
+        if pointers:
+            selected = np.any(self._packed_shapes.select(pointers), axis=0)
+        changed: np.ndarray = np.flatnonzero(selected != self._selected)
+        self._selected = selected
+
+        for index in changed.tolist():
+            region: tuple[int, int, int, int] | None = self._clip(tuple(self._extents[index].tolist()))
+            if region is not None:
+                self._redraw(region)
+
+        return changed.tolist()
+
+    def render(self, frame: np.ndarray, pointer: tuple[int, int] | list[tuple[int, int] | None] | None) -> None:
+        """Updates selection states of the shapes and draws the overlay onto a frame.
+
+        Args:
+            frame (np.ndarray): Frame which shapes draw on, of the overlay frame size.
+            pointer (tuple[int, int] | list[tuple[int, int] | None] | None): Pointer coordinates,
+                or a list of pointers.
+
+        Raises:
+            ValueError: If the frame size differs from the overlay frame size.
+        """
+        if frame.shape[:2] != self._mask.shape:
+            raise ValueError(f"Expected frame of size {self._frame_size}, got {frame.shape[1::-1]}")
+
+        self.update(pointer)
+
+        if self._region is None:
+            return
+
+        x1, y1, x2, y2 = self._region
+        cv2.copyTo(self._overlay[y1:y2, x1:x2], self._mask[y1:y2, x1:x2], frame[y1:y2, x1:x2])
+
+    @property
+    def selected(self) -> np.ndarray:
+        """Gets selection states of the shapes.
+
+        Returns:
+            np.ndarray: Boolean array of shape (n_shapes,).
+        """
+        return self._selected
+
+    @property
+    def overlay(self) -> np.ndarray:
+        """Gets the overlay image.
+
+        Returns:
+            np.ndarray: The (height, width, 3) image of the shapes.
+        """
+        return self._overlay
+
+    @property
+    def mask(self) -> np.ndarray:
+        """Gets the overlay mask.
+
+        Returns:
+            np.ndarray: The (height, width) mask, 255 where the shapes are drawn.
+        """
+        return self._mask
+
+    def _clip(self, region: tuple[int, int, int, int]) -> tuple[int, int, int, int] | None:
+        """Clips a region to the frame.
+
+        Args:
+            region (tuple[int, int, int, int]): The region (x1, y1, x2, y2), x2 and y2 exclusive.
+
+        Returns:
+            tuple[int, int, int, int] | None: The clipped region, or None if it is outside the frame.
+        """
+        width, height = self._frame_size
+        x1, y1, x2, y2 = max(region[0], 0), max(region[1], 0), min(region[2], width), min(region[3], height)
+
+        return (x1, y1, x2, y2) if x1 < x2 and y1 < y2 else None
+
+    def _redraw(self, region: tuple[int, int, int, int]) -> None:
+        """Redraws the shapes overlapping a region of the overlay.
+
+        Args:
+            region (tuple[int, int, int, int]): The region (x1, y1, x2, y2), x2 and y2 exclusive.
+        """
+        x1, y1, x2, y2 = region
+        overlay: np.ndarray = self._overlay[y1:y2, x1:x2]
+        mask: np.ndarray = self._mask[y1:y2, x1:x2]
+        overlay[:] = 0
+        mask[:] = 0
+
+        extents: np.ndarray = self._extents
+        overlapping: np.ndarray = np.flatnonzero(
+            (extents[:, 0] < x2) & (extents[:, 2] > x1) & (extents[:, 1] < y2) & (extents[:, 3] > y1)
+        )
+
+        for index in overlapping.tolist():
+            shape: dict = self._shapes[index]
+            params: dict = self._params[index][int(self._selected[index])].copy()
+
+            # Shift the shape to the region origin
+            for name in POSITION_PARAMS[shape["type"]]:
+                params[name] = (params[name][0] - x1, params[name][1] - y1)
+
+            draw = DRAW_SHAPE[shape["type"]]
+            draw(overlay, **params)
+            draw(mask, **{**params, "color": 255})
@@ -0,0 +1,284 @@
+from collections.abc import Callable, Iterable, Iterator
+
+from touchless.utils.events import is_shape_selected
+
+
+# Position parameters of each shape type, translated when a shape moves
+POSITION_PARAMS: dict[str, tuple[str, ...]] = {
+    "circle": ("center",),
+    "rectangle": ("pt1", "pt2")
+}
+
+
+def get_circle_bounds(circle: dict) -> tuple[int, int, int, int]:
+    """Get the bounding box of a circle.
+
+    Args:
+        circle (dict): Circle object definition.
+
+    Returns:
+        tuple[int, int, int, int]: The bounding box (x1, y1, x2, y2), inclusive.
+    """
+
+    params: dict = circle["params"]["default"]
+    cx, cy = params["center"]
+    cr = params["radius"]
+
+    return cx - cr, cy - cr, cx + cr, cy + cr
+
+
+def get_rectangle_bounds(rectangle: dict) -> tuple[int, int, int, int]:
+    """Get the bounding box of a rectangle.
+
+    Args:
+        rectangle (dict): Rectangle object definition.
+
+    Returns:
+        tuple[int, int, int, int]: The bounding box (x1, y1, x2, y2), inclusive.
+    """
+
+    params: dict = rectangle["params"]["default"]
+    x1, y1 = params["pt1"]
+    x2, y2 = params["pt2"]
+
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+
+SHAPE_BOUNDS: dict[str, Callable] = {
+    "circle": get_circle_bounds,
+    "rectangle": get_rectangle_bounds
+}
+
+
+class ShapeScene:
+    """A class representing shapes (in the `SHAPES` format) indexed by a uniform grid for hit-testing.
+
+    Each shape is registered in the grid cells its bounding box overlaps, so a pointer query only checks
+    the shapes of one cell instead of all shapes. Shapes are identified by ids assigned when they are added,
+    increasing in the order they are rendered. Shape dicts are owned by the scene: change their position
+    with `move` or `update`, so that the index follows.
+    """
+
+    def __init__(self, shapes: Iterable[dict] = (), cell_size: int = 64) -> None:
+        """Initializes the ShapeScene.
+
+        Args:
+            shapes (Iterable[dict]): Initial shapes definitions. Default is ().
+            cell_size (int): Size of the grid cells in pixels, about the size of typical shapes. Default is 64.
+
+        Raises:
+            ValueError: If the cell size is less than 1.
+        """
+        if cell_size < 1:
+            raise ValueError(f"Cell size must be at least 1, got {cell_size}")
+
+        self._cell_size: int = cell_size
+        self._shapes: dict[int, dict] = {}
+        self._cells_by_shape: dict[int, tuple[int, int, int, int]] = {}
+        self._grid: dict[tuple[int, int], set[int]] = {}
+        self._next_id: int = 0
+
+        for shape in shapes:
+            self.add(shape)
+
+    def add(self, shape: dict) -> int:
+        """Adds a shape on top of the scene.
+
+        Args:
+            shape (dict): Shape object definition.
+
+        Returns:
+            int: The shape id.
+
+        Raises:
+            ValueError: If the shape type is not supported.
+        """
+        if shape["type"] not in SHAPE_BOUNDS:
+            raise ValueError(f"Unsupported shape type: {shape['type']}")
+
+        shape_id: int = self._next_id
+        self._next_id += 1
+        self._shapes[shape_id] = shape
+        self._index(shape_id, self._get_cells(shape))
+
+        return shape_id
+
+    def remove(self, shape_id: int) -> dict:
+        """Removes a shape from the scene.
+
+        Args:
+            shape_id (int): The shape id.
+
+        Returns:
+            dict: The removed shape definition.
+
+        Raises:
+            KeyError: If there is no shape with the id.
+        """
+        shape: dict = self._shapes.pop(shape_id)
+        self._unindex(shape_id, self._cells_by_shape.pop(shape_id))
+
+        return shape
+
+    def move(self, shape_id: int, dx: int, dy: int) -> None:
+        """Translates a shape.
+
+        Args:
+            shape_id (int): The shape id.
+            dx (int): Horizontal offset in pixels.
+            dy (int): Vertical offset in pixels.
+
+        Raises:
+            KeyError: If there is no shape with the id.
+        """
+        shape: dict = self._shapes[shape_id]
+        params: dict = shape["params"]["default"]
+
+        self.update(shape_id, **{
+            name: (params[name][0] + dx, params[name][1] + dy) for name in POSITION_PARAMS[shape["type"]]
+        })
+
+    def update(self, shape_id: int, **params) -> None:
+        """Updates default parameters of a shape (e.g. "center" or "radius" of a circle) and its index cells.
+
+        Only the grid cells the shape enters or leaves are updated.
+
+        Args:
+            shape_id (int): The shape id.
+            **params: The default parameters to set.
+
+        Raises:
+            KeyError: If there is no shape with the id.
+        """
+        shape: dict = self._shapes[shape_id]
+        shape["params"]["default"].update(params)
+
+        old_cells: tuple[int, int, int, int] = self._cells_by_shape[shape_id]
+        new_cells: tuple[int, int, int, int] = self._get_cells(shape)
+
+        if new_cells == old_cells:
+            return
+
+        old_keys: set[tuple[int, int]] = set(self._iter_cells(old_cells))
+        new_keys: set[tuple[int, int]] = set(self._iter_cells(new_cells))
+
+        for key in old_keys - new_keys:
+            self._discard(key, shape_id)
+        for key in new_keys - old_keys:
+            self._grid.setdefault(key, set()).add(shape_id)
+
+        self._cells_by_shape[shape_id] = new_cells
+
+    def query_ids(self, *pointers: tuple[int, int] | None) -> set[int]:
+        """Gets ids of the shapes selected by any of the pointers.
+
+        Args:
+            *pointers (tuple[int, int] | None): Pointer coordinates, None pointers select nothing.
+
+        Returns:
+            set[int]: Ids of the selected shapes.
+        """
+        selected: set[int] = set()
+        cell_size: int = self._cell_size
+
+        for pointer in pointers:
+            if pointer is None:
+                continue
+
+            candidates: set[int] | None = self._grid.get((pointer[0] // cell_size, pointer[1] // cell_size))
+            if not candidates:
+                continue
+
+            selected.update(
+                shape_id for shape_id in candidates
+                if shape_id not in selected and is_shape_selected(self._shapes[shape_id], pointer)
+            )
+
+        return selected
+
+    def query(self, *pointers: tuple[int, int] | None) -> list[dict]:
+        """Gets the shapes selected by any of the pointers.
+
+        Args:
+            *pointers (tuple[int, int] | None): Pointer coordinates, None pointers select nothing.
+
+        Returns:
+            list[dict]: The selected shapes definitions, in the rendering order.
+        """
+        return [self._shapes[shape_id] for shape_id in sorted(self.query_ids(*pointers))]
+
+    def get(self, shape_id: int) -> dict:
+        """Gets a shape.
+
+        Args:
+            shape_id (int): The shape id.
+
+        Returns:
+            dict: The shape definition.
+
+        Raises:
+            KeyError: If there is no shape with the id.
+        """
+        return self._shapes[shape_id]
+
+    def items(self) -> Iterator[tuple[int, dict]]:
+        """Iterates over the shapes in the rendering order.
+
+        Returns:
+            Iterator[tuple[int, dict]]: Pairs of shape id and shape definition.
+        """
+        return iter(self._shapes.items())
+
+    @property
+    def cell_size(self) -> int:
+        """Gets the size of the grid cells.
+
+        Returns:
+            int: The cell size in pixels.
+        """
+        return self._cell_size
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._shapes.values())
+
+    def __contains__(self, shape_id: object) -> bool:
+        return shape_id in self._shapes
+
+    def _get_cells(self, shape: dict) -> tuple[int, int, int, int]:
+        """Gets the range of grid cells a shape overlaps.
+
+        Args:
+            shape (dict): Shape object definition.
+
+        Returns:
+            tuple[int, int, int, int]: The inclusive cell range (column1, row1, column2, row2).
+        """
+        x1, y1, x2, y2 = SHAPE_BOUNDS[shape["type"]](shape)
+        cell_size: int = self._cell_size
+
+        return int(x1 // cell_size), int(y1 // cell_size), int(x2 // cell_size), int(y2 // cell_size)
+
+    @staticmethod
+    def _iter_cells(cells: tuple[int, int, int, int]) -> Iterator[tuple[int, int]]:
+        column1, row1, column2, row2 = cells
+        for column in range(column1, column2 + 1):
+            for row in range(row1, row2 + 1):
+                yield column, row
+
+    def _index(self, shape_id: int, cells: tuple[int, int, int, int]) -> None:
+        for key in self._iter_cells(cells):
+            self._grid.setdefault(key, set()).add(shape_id)
+        self._cells_by_shape[shape_id] = cells
+
+    def _unindex(self, shape_id: int, cells: tuple[int, int, int, int]) -> None:
+        for key in self._iter_cells(cells):
+            self._discard(key, shape_id)
+
+    def _discard(self, key: tuple[int, int], shape_id: int) -> None:
+        cell: set[int] = self._grid[key]
+        cell.discard(shape_id)
+        if not cell:
+            del self._grid[key]
@@ -3,7 +3,9 @@ from collections.abc import Callable
 import cv2
 import numpy as np
 
-from touchless.utils.events import is_shape_selected
+from touchless.utils.compiled_shapes import CompiledShapes
+from touchless.utils.events import PackedShapes, is_shape_selected
+from touchless.utils.scene import ShapeScene
 
 
 SHAPES: list[dict] = [
@@ -95,6 +97,11 @@ SHAPES: list[dict] = [
 ]
 
 
+# Shapes lists are hit-tested in a batch from this number of pointer-shape tests (and two pointers),
+# below it packing the shapes costs more than testing them one by one
+BATCH_HIT_TEST_MIN_TESTS: int = 256
+
+
 DRAW_SHAPE: dict[str, Callable] = {
     "circle": cv2.circle,
     "rectangle": cv2.rectangle
@@ -121,26 +128,80 @@ def draw_shape(frame: np.ndarray, shape: dict, pointer: tuple[int, int] | None)
         pointer (Tuple[int, int] | None): Pointer coordinates tuple.
     """
 
-    event: str = "default"
+    draw_shape_state(frame, shape, is_shape_selected(shape=shape, pointer=pointer))
+
+
+def draw_shape_state(frame: np.ndarray, shape: dict, is_selected: bool) -> None:
+    """Draw (render) single shape by its definition in the default or selected state.
 
-    if is_shape_selected(shape=shape, pointer=pointer):
-        event = "on_select"
+    The "default" parameters are used as is and merged with the "on_select" parameters into a new dict
+    when selected, so shapes definitions can change between frames. Compile static shapes (see `compile_shapes`)
+    to draw them without merging parameters.
+
+    Args:
+        frame (np.ndarray): Frame which shape draw on.
+        shape (Dict): Shape definition dictionary.
+        is_selected (bool): Whether to draw the shape with its "on_select" parameters.
+    """
+
+    params: dict = shape["params"]["default"]
+
+    if is_selected:
+        params = {**params, **shape["params"].get("on_select", {})}
 
-    params = shape["params"]["default"].copy()
-    params.update(shape["params"][event])
     DRAW_SHAPE[shape["type"]](frame, **params)
 
 
-def render_shapes(frame: np.ndarray, shapes: list[dict], pointer: tuple[int, int] | None) -> None:
+def render_shapes(
+    frame: np.ndarray,
+    shapes: list[dict] | CompiledShapes | ShapeScene,
+    pointer: tuple[int, int] | list[tuple[int, int] | None] | None
+) -> None:
     """Render shapes from shapes list.
 
+    Shapes lists and compiled shapes are hit-tested in one batch (see `PackedShapes`) for several pointers
+    and many shapes, scenes through their spatial index. Compiled shapes (see `compile_shapes`) are packed
+    once and drawn without merging parameters dicts.
+
     Args:
         frame (np.ndarray): Frame which shapes draw on.
-        shapes (List[Dict]): List of shapes definitions.
-        pointer (Tuple[int, int] | None): Pointer coordinates tuple.
+        shapes (List[Dict] | CompiledShapes | ShapeScene): List of shapes definitions, compiled shapes,
+            or a scene (hit-tested through its spatial index).
+        pointer (Tuple[int, int] | List[Tuple[int, int] | None] | None): Pointer coordinates tuple, or a list of
+            pointers (e.g. fingertips of both hands) selecting the shapes any of them is over.
     """
-    for shape in shapes:
-        draw_shape(frame, shape, pointer)
+    pointers: list[tuple[int, int] | None] = pointer if isinstance(pointer, list) else [pointer]
+
+    if isinstance(shapes, ShapeScene):
+        selected_ids: set[int] = shapes.query_ids(*pointers)
+        for shape_id, shape in shapes.items():
+            draw_shape_state(frame, shape, shape_id in selected_ids)
+        return
+
+    pointers = [pointer for pointer in pointers if pointer is not None]
+    is_batched: bool = len(pointers) >= 2 and len(pointers) * len(shapes) >= BATCH_HIT_TEST_MIN_TESTS
+    selected: list[bool]
+
+    if isinstance(shapes, CompiledShapes):
+        if is_batched:
+            selected = PackedShapes(shapes).select(pointers).any(axis=0).tolist()
+        elif len(pointers) <= 1:
+            single_pointer: tuple[int, int] | None = pointers[0] if pointers else None
+            selected = [shape.is_selected(single_pointer) for shape in shapes]
+        else:
+            selected = [any(shape.is_selected(pointer) for pointer in pointers) for shape in shapes]
+
+        for compiled_shape, is_selected in zip(shapes, selected):
+            compiled_shape.draw(frame, is_selected)
+        return
+
+    if is_batched:
+        selected = PackedShapes(shapes).select(pointers).any(axis=0).tolist()
+    else:
+        selected = [any(is_shape_selected(shape, pointer) for pointer in pointers) for shape in shapes]
+
+    for shape, is_selected in zip(shapes, selected):
+        draw_shape_state(frame, shape, is_selected)
 
 
 def draw_angle_vertex(frame: np.ndarray, vertex: tuple[int, int]) -> None: